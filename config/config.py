@@ -14,6 +14,24 @@ class Config:
     HEADLESS = os.getenv("HEADLESS", "True").lower() == "true"
     BROWSER_TYPE = os.getenv("BROWSER_TYPE", "chromium")
     BASE_URL = os.getenv("BASE_URL", "https://opensource-demo.orangehrmlive.com")
+    CONTEXT_POOL_SIZE = int(os.getenv("CONTEXT_POOL_SIZE", 2))
+
+    # Network resource blocking settings (comma separated; empty disables)
+    BLOCK_RESOURCE_TYPES = os.getenv("BLOCK_RESOURCE_TYPES", "image,font,media").split(",")
+    BLOCK_URL_PATTERNS = os.getenv(
+        "BLOCK_URL_PATTERNS",
+        "**/pim/viewPhoto/**,**/fonts.googleapis.com/**,**/fonts.gstatic.com/**",
+    ).split(",")
+
+    # HAR settings: HAR_MODE is "record", "replay" or empty for live traffic
+    HAR_MODE = os.getenv("HAR_MODE", "").lower()
+    HAR_DIR = os.getenv("HAR_DIR", "reports/har")
+    HAR_IGNORE_FIELDS = os.getenv("HAR_IGNORE_FIELDS", "_token").split(",")
+
+    # Auth state cache settings
+    AUTH_CACHE_ENABLED = os.getenv("AUTH_CACHE_ENABLED", "True").lower() == "true"
+    AUTH_STATE_DIR = os.getenv("AUTH_STATE_DIR", "reports/.auth")
+    AUTH_STATE_TTL = int(os.getenv("AUTH_STATE_TTL", 1800))
 
     # Database settings
     MYSQL_HOST = os.getenv("MYSQL_HOST", "127.0.0.1")
@@ -21,10 +39,78 @@ class Config:
     MYSQL_USER = os.getenv("MYSQL_USER", "root")
     MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
     MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "orangehrm")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_FETCH_CHUNK_SIZE = int(os.getenv("DB_FETCH_CHUNK_SIZE", 1000))
+    DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", 1000))
+
+    # SQL profiling: EXPLAIN plans attached to the slowest statements
+    SQL_PROFILE_EXPLAIN = int(os.getenv("SQL_PROFILE_EXPLAIN", 3))
 
     # API settings
     API_BASE_URL = os.getenv("API_BASE_URL", "https://opensource-demo.orangehrm.com/api")
     API_TIMEOUT = int(os.getenv("API_TIMEOUT", 30))
+    API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", 10))
+    API_RETRIES = int(os.getenv("API_RETRIES", 3))
+    API_BACKOFF = float(os.getenv("API_BACKOFF", 0.3))
+    API_BATCH_CONCURRENCY = int(os.getenv("API_BATCH_CONCURRENCY", 10))
+    API_RATE_PER_HOST = float(os.getenv("API_RATE_PER_HOST", 0))
+    API_CACHE_TTL = int(os.getenv("API_CACHE_TTL", 300))
+    API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", 256))
+    API_CACHE_MAX_BYTES = int(os.getenv("API_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+    # Parallel run settings
+    PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", 0))
+    PARALLEL_DIR = os.getenv("PARALLEL_DIR", "reports/parallel")
+    DURATIONS_FILE = os.getenv("DURATIONS_FILE", "reports/durations.json")
+    WORKER_ID = os.getenv("WORKER_ID", "")
+    IMPACT_MAP = os.getenv("IMPACT_MAP", "reports/impact.json")
+
+    # Dependency health probes: tests whose dependency is down are skipped or errored
+    HEALTH_ENABLED = os.getenv("HEALTH_ENABLED", "true").lower() == "true"
+    HEALTH_TIMEOUT = float(os.getenv("HEALTH_TIMEOUT", 3))
+    HEALTH_RETRY_INTERVAL = float(os.getenv("HEALTH_RETRY_INTERVAL", 30))
+    HEALTH_ON_FAILURE = os.getenv("HEALTH_ON_FAILURE", "skip").lower()
+
+    # Failure artifacts: "screenshots", "trace" or "off"
+    ARTIFACT_MODE = os.getenv("ARTIFACT_MODE", "screenshots").lower()
+    ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "reports/artifacts")
+    ARTIFACT_MAX_BYTES = int(os.getenv("ARTIFACT_MAX_MB", 200)) * 1024 * 1024
+    ARTIFACT_HISTORY = int(os.getenv("ARTIFACT_HISTORY", 20))
+
+    # Results store
+    RESULTS_ENABLED = os.getenv("RESULTS_ENABLED", "true").lower() == "true"
+    RESULTS_DIR = os.getenv("RESULTS_DIR", "reports/results")
+    RESULTS_KEEP_RUNS = int(os.getenv("RESULTS_KEEP_RUNS", 50))
+
+    # Action timing report
+    TIMING_ENABLED = os.getenv("TIMING_ENABLED", "true").lower() == "true"
+    TIMING_REPORT = os.getenv("TIMING_REPORT", "reports/timing.json")
+    TIMING_TOP_N = int(os.getenv("TIMING_TOP_N", 20))
+
+    # Page-load benchmarks
+    BENCHMARK_BASELINE = os.getenv("BENCHMARK_BASELINE", "tests/benchmark/baseline.json")
+    BENCHMARK_WARMUP = int(os.getenv("BENCHMARK_WARMUP", 1))
+    BENCHMARK_ITERATIONS = int(os.getenv("BENCHMARK_ITERATIONS", 5))
+    BENCHMARK_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", 0.2))
+    BENCHMARK_SIGMA = float(os.getenv("BENCHMARK_SIGMA", 3))
+    BENCHMARK_UPDATE_BASELINE = os.getenv("BENCHMARK_UPDATE_BASELINE", "false").lower() == "true"
+
+    # API load generator
+    API_LOAD_RATE = float(os.getenv("API_LOAD_RATE", 20))
+    API_LOAD_DURATION = float(os.getenv("API_LOAD_DURATION", 60))
+    API_LOAD_MAX_IN_FLIGHT = int(os.getenv("API_LOAD_MAX_IN_FLIGHT", 100))
+
+    # UI load test
+    LOAD_USERS = int(os.getenv("LOAD_USERS", 10))
+    LOAD_BROWSERS = int(os.getenv("LOAD_BROWSERS", 2))
+    LOAD_RAMP_UP = float(os.getenv("LOAD_RAMP_UP", 10))
+    LOAD_THINK_TIME = float(os.getenv("LOAD_THINK_TIME", 1))
+    LOAD_DURATION = float(os.getenv("LOAD_DURATION", 60))
+    LOAD_REPORT_DIR = os.getenv("LOAD_REPORT_DIR", "reports/load")
+
+    # Logging settings
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_KEEP = int(os.getenv("LOG_KEEP", 5))
 
     # Test data
     DEFAULT_USERNAME = "Admin"
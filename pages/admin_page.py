@@ -1,11 +1,58 @@
 """Admin page class for various objects"""
 
-from playwright.async_api import Page
+from typing import AsyncIterator, NamedTuple
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Response
 import logging
 from pages.base_page import BasePage
+from utils.timing import timed
 
 logger = logging.getLogger(__name__)
 
+# Cell texts of every grid row plus whether the pager has a next page
+# (a pager button holding the right chevron; no :has() for older engines)
+_READ_GRID_JS = """([rowSelector, buttonSelector, iconSelector]) => ({
+    rows: Array.from(document.querySelectorAll(rowSelector), (row) =>
+        Array.from(row.querySelectorAll(".oxd-table-cell"), (cell) => cell.textContent.trim())),
+    hasNext: Array.from(document.querySelectorAll(buttonSelector))
+        .some((button) => button.querySelector(iconSelector) !== null),
+})"""
+
+# True once the grid shows exactly the given usernames, in order
+_GRID_SHOWS_JS = """([rowSelector, usernames]) => {
+    const shown = Array.from(document.querySelectorAll(rowSelector), (row) => {
+        const cell = row.querySelectorAll(".oxd-table-cell")[1];
+        return cell ? cell.textContent.trim() : null;
+    });
+    return shown.length === usernames.length && shown.every((name, i) => name === usernames[i]);
+}"""
+
+
+class SystemUserRow(NamedTuple):
+    """One row of the System Users grid."""
+
+    username: str
+    role: str
+    employee_name: str
+    status: str
+
+    @classmethod
+    def from_cells(cls, cells: list) -> "SystemUserRow":
+        """Build a row from grid cell texts (checkbox, username, role, employee, status, actions)."""
+        return cls(cells[1], cells[2], cells[3], cells[4])
+
+    @classmethod
+    def from_api(cls, user: dict) -> "SystemUserRow":
+        """Build a row from an /api/v2/admin/users item, formatted like the grid."""
+        employee = user.get("employee") or {}
+        name = " ".join(n for n in (employee.get("firstName"), employee.get("lastName")) if n)
+        return cls(
+            user["userName"],
+            (user.get("userRole") or {}).get("displayName", ""),
+            name,
+            "Enabled" if user.get("status") else "Disabled",
+        )
+
 
 class AdminPage(BasePage):
     """Page Object for OrangeHRM Admin Page."""
@@ -19,12 +66,20 @@ class AdminPage(BasePage):
     SEARCH_BUTTON = "button:has-text('Search')"  # Button with "Search" text
     # In admin_page.py
     USERNAME_INPUT = 'input[role="textbox"]'  # CSS selector
+    USERS_API = "/api/v2/admin/users"
+    GRID_ROWS = ".oxd-table-body .oxd-table-card"
+    NEXT_PAGE_BUTTON = "button.oxd-pagination-page-item--previous-next"
+    NEXT_PAGE_ICON = ".bi-chevron-right"
+    API_PAGE_SIZE = 50
+    KEY_ELEMENTS = (ADMIN_USER_TITLE, SEARCH_BUTTON)
     
 
+    @timed
     async def is_admin_page_loaded(self) -> bool:
         """Check if admin page is loaded."""
-        return await self.is_element_visible(self.ADMIN_USER_TITLE)
+        return await self.is_loaded()
 
+    @timed
     async def search_user(self, username: str):
         """Search for a user by username."""
         # Use get_by_role for nth selector support
@@ -32,7 +87,78 @@ class AdminPage(BasePage):
         await textbox.click()
         await textbox.fill(username)
         
-        # Click search button
-        await self.page.get_by_role("button", name="Search").click()
-        await self.page.wait_for_load_state("networkidle")
-        logger.info(f"Searched for user: {username}")
\ No newline at end of file
+        # Click search button and wait for the users request it fires
+        response = await self.wait_for_response(
+            self.page.get_by_role("button", name="Search").click,
+            self.USERS_API,
+            method="GET",
+        )
+        await self._wait_for_grid(response)
+        logger.info("Searched for user: %s", username)
+
+    async def _wait_for_grid(self, response: Response):
+        """Wait until the grid renders exactly the users a /admin/users response returned.
+
+        Comparing every username (and so the row count) keeps a stale grid
+        that happens to start with the same user from passing early.
+        """
+        if not response.ok:
+            return
+        usernames = [user["userName"] for user in (await response.json()).get("data", [])]
+        await self.page.wait_for_function(_GRID_SHOWS_JS, arg=[self.GRID_ROWS, usernames])
+
+    @timed
+    async def read_grid_page(self) -> tuple:
+        """Read the rows on the current grid page in one DOM round trip.
+
+        Returns the rows and whether the pager has a next page.
+        """
+        grid = await self.page.evaluate(
+            _READ_GRID_JS, [self.GRID_ROWS, self.NEXT_PAGE_BUTTON, self.NEXT_PAGE_ICON]
+        )
+        return [SystemUserRow.from_cells(cells) for cells in grid["rows"]], grid["hasNext"]
+
+    async def iter_users(self, username: str = None, from_api: bool = False) -> AsyncIterator[SystemUserRow]:
+        """Yield System Users rows page by page, optionally searching first.
+
+        Only one page of rows is held at a time. With ``from_api`` the rows
+        come from the /api/v2/admin/users endpoint the grid uses, called
+        with the page's session, instead of the DOM.
+        """
+        if from_api:
+            async for row in self._iter_users_from_api(username):
+                yield row
+            return
+        if username is not None:
+            await self.search_user(username)
+        while True:
+            rows, has_next = await self.read_grid_page()
+            for row in rows:
+                yield row
+            if not has_next:
+                return
+            next_button = self.page.locator(self.NEXT_PAGE_BUTTON).filter(
+                has=self.page.locator(self.NEXT_PAGE_ICON)
+            )
+            response = await self.wait_for_response(next_button.click, self.USERS_API, method="GET")
+            await self._wait_for_grid(response)
+
+    async def _iter_users_from_api(self, username: str = None) -> AsyncIterator[SystemUserRow]:
+        """Yield System Users rows from the users API, one page per request."""
+        parts = urlsplit(self.page.url)
+        url = f"{parts.scheme}://{parts.netloc}/web/index.php{self.USERS_API}"
+        params = {"limit": self.API_PAGE_SIZE, "sortField": "u.userName", "sortOrder": "ASC"}
+        if username:
+            params["username"] = username
+        offset = 0
+        while True:
+            response = await self.page.request.get(url, params={**params, "offset": offset})
+            if not response.ok:
+                raise RuntimeError(f"GET {url} failed with status {response.status}")
+            body = await response.json()
+            users = body.get("data", [])
+            for user in users:
+                yield SystemUserRow.from_api(user)
+            offset += len(users)
+            if not users or offset >= body.get("meta", {}).get("total", 0):
+                return
\ No newline at end of file
@@ -1,65 +1,264 @@
 """Base Page class with common page methods."""
 
-from playwright.async_api import Page, Locator
+import asyncio
+import re
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Pattern, Union
+from playwright.async_api import Page, Locator, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from utils.timing import timed
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Selectors the browser can resolve itself; anything else (":has-text",
+# ">> nth=", "text=", ...) needs Playwright's selector engine.
+_PLAYWRIGHT_ONLY = re.compile(
+    r">>|:(has-text|text|text-is|text-matches|visible|nth-match|"
+    r"left-of|right-of|above|below|near)\b|^[a-z-]+="
+)
+
+# State of a list of matched elements, using Playwright's notion of visible:
+# a non-empty bounding box and no visibility:hidden.
+_ELEMENT_STATE_JS = """(elements, attributes) => {
+    const visible = (e) => {
+        const box = e.getBoundingClientRect();
+        return box.width > 0 && box.height > 0 && getComputedStyle(e).visibility !== "hidden";
+    };
+    const first = elements.find(visible) || elements[0];
+    return {
+        count: elements.length,
+        visible: elements.some(visible),
+        text: first ? first.textContent : null,
+        attributes: Object.fromEntries(attributes.map((a) => [a, first ? first.getAttribute(a) : null])),
+    };
+}"""
+
+_RESOLVE_JS = """([kind, selector]) => {
+    if (kind === "css") {
+        return Array.from(document.querySelectorAll(selector));
+    }
+    const result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+}"""
+
+_QUERY_JS = f"""([queries, attributes]) => {{
+    const state = {_ELEMENT_STATE_JS};
+    const resolve = {_RESOLVE_JS};
+    return queries.map((query) => state(resolve(query), attributes));
+}}"""
+
+_ALL_VISIBLE_JS = f"""(queries) => {{
+    const state = {_ELEMENT_STATE_JS};
+    const resolve = {_RESOLVE_JS};
+    return queries.every((query) => state(resolve(query), []).visible);
+}}"""
+
+
+def _write_file(path: Path, data: bytes):
+    """Write bytes to a file, creating its directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _native_selector(locator: str):
+    """Return (kind, selector) if the browser can resolve the locator itself, else None."""
+    if locator.startswith("xpath="):
+        return "xpath", locator[len("xpath="):]
+    if locator.startswith(("//", "(/", "..")):
+        return "xpath", locator
+    if locator.startswith("css="):
+        locator = locator[len("css="):]
+    if _PLAYWRIGHT_ONLY.search(locator):
+        return None
+    return "css", locator
+
 
 class BasePage:
     """Base page class with common methods for all pages."""
 
+    # Locators that must all be visible for the page to count as loaded
+    KEY_ELEMENTS = ()
+
     def __init__(self, page: Page):
         """Initialize base page with Playwright page object."""
         self.page = page
 
+    @timed(selector="url")
     async def navigate_to(self, url: str):
         """Navigate to a specific URL."""
         await self.page.goto(url)
-        logger.info(f"Navigated to {url}")
+        logger.debug("Navigated to %s", url)
 
+    @timed(selector="locator")
     async def click(self, locator: str):
         """Click on an element."""
         await self.page.click(locator)
-        logger.info(f"Clicked on {locator}")
+        logger.debug("Clicked on %s", locator)
 
+    @timed(selector="locator")
     async def fill(self, locator: str, text: str):
         """Fill in text input."""
         await self.page.fill(locator, text)
-        logger.info(f"Filled {locator} with {text}")
+        logger.debug("Filled %s", locator)
 
+    @timed(selector="locator")
     async def get_text(self, locator: str) -> str:
         """Get text from an element."""
         text = await self.page.text_content(locator)
-        logger.info(f"Got text from {locator}: {text}")
+        logger.debug("Got text from %s: %s", locator, text)
         return text
 
+    @timed(selector="locator")
     async def wait_for_element(self, locator: str, timeout: int = 5000):
         """Wait for element to be visible."""
         await self.page.wait_for_selector(locator, timeout=timeout)
-        logger.info(f"Element {locator} is visible")
+        logger.debug("Element %s is visible", locator)
 
+    @timed(selector="locator")
     async def is_element_visible(self, locator: str) -> bool:
         """Check if element is visible."""
         try:
             await self.wait_for_element(locator, timeout=2000)
             return True
-        except:
+        except PlaywrightTimeoutError:
             return False
 
+    @timed
+    async def query_elements(self, locators: Iterable[str], attributes: Iterable[str] = ()) -> dict:
+        """Read count, visibility, text and attributes of many locators at once.
+
+        Plain CSS and XPath locators are resolved together in a single
+        ``page.evaluate``; locators that need Playwright's selector engine
+        are read concurrently with one ``evaluate_all`` each. Nothing waits:
+        this is the state of the page right now. Text and attributes come
+        from the first visible match (or the first match).
+        """
+        locators = list(dict.fromkeys(locators))
+        attributes = list(attributes)
+        native = {l: _native_selector(l) for l in locators}
+        batched = [l for l in locators if native[l]]
+        others = [l for l in locators if not native[l]]
+
+        async def read_batched():
+            if not batched:
+                return []
+            return await self.page.evaluate(_QUERY_JS, [[native[l] for l in batched], attributes])
+
+        results = await asyncio.gather(
+            read_batched(),
+            *(self.page.locator(l).evaluate_all(_ELEMENT_STATE_JS, attributes) for l in others),
+        )
+        states = dict(zip(batched, results[0]))
+        states.update(zip(others, results[1:]))
+        return {l: states[l] for l in locators}
+
+    @timed(selector="locator")
+    async def is_absent(self, locator: str) -> bool:
+        """Check that no visible element matches right now, without waiting."""
+        states = await self.query_elements([locator])
+        return not states[locator]["visible"]
+
+    @timed
+    async def wait_for_elements(self, locators: Iterable[str], timeout: int = 5000) -> bool:
+        """Wait until every locator has a visible match; False on timeout.
+
+        Plain CSS and XPath locators are polled together inside the page
+        with a single ``wait_for_function``.
+        """
+        locators = list(locators)
+        batched = [_native_selector(l) for l in locators if _native_selector(l)]
+        others = [l for l in locators if not _native_selector(l)]
+        waits = [
+            self.page.locator(l).first.wait_for(state="visible", timeout=timeout) for l in others
+        ]
+        if batched:
+            waits.append(self.page.wait_for_function(_ALL_VISIBLE_JS, arg=batched, timeout=timeout))
+        results = await asyncio.gather(*waits, return_exceptions=True)
+        for result in results:
+            if isinstance(result, PlaywrightTimeoutError):
+                logger.debug("Elements not visible within %sms: %s", timeout, locators)
+                return False
+            if isinstance(result, BaseException):
+                raise result
+        return True
+
+    @timed
+    async def is_loaded(self, timeout: int = 2000) -> bool:
+        """Check that all of the page's key elements are visible."""
+        return await self.wait_for_elements(self.KEY_ELEMENTS, timeout=timeout)
+
+    @staticmethod
+    def _url_matches(url: str, pattern: Union[str, Pattern, Callable[[str], bool]]) -> bool:
+        """Match URL by substring, glob (with *), regex or predicate."""
+        if callable(pattern):
+            return pattern(url)
+        if isinstance(pattern, str):
+            return fnmatch(url, pattern) if "*" in pattern else pattern in url
+        return pattern.search(url) is not None
+
+    @timed
+    async def wait_for_response(
+        self,
+        action: Callable[[], Awaitable],
+        url: Union[str, Pattern, Callable[[str], bool]],
+        method: str = None,
+        status: Union[int, Iterable[int]] = None,
+        timeout: int = 10000,
+    ) -> Response:
+        """Run an action and wait for the response it triggers.
+
+        Waits only as long as the matching request takes instead of a
+        blanket network-idle period.
+        """
+        statuses = {status} if isinstance(status, int) else set(status or ())
+
+        def matches(response: Response) -> bool:
+            if method and response.request.method != method.upper():
+                return False
+            if statuses and response.status not in statuses:
+                return False
+            return self._url_matches(response.url, url)
+
+        async with self.page.expect_response(matches, timeout=timeout) as response_info:
+            await action()
+        response = await response_info.value
+        logger.info("Got response %s %s %s", response.status, response.request.method, response.url)
+        return response
+
+    @timed
+    async def wait_for_navigation(
+        self,
+        action: Callable[[], Awaitable],
+        url: Union[str, Pattern, Callable[[str], bool]] = None,
+        timeout: int = 10000,
+    ):
+        """Run an action and wait for the main frame to commit a new document."""
+        async with self.page.expect_navigation(
+            url=url, wait_until="domcontentloaded", timeout=timeout
+        ):
+            await action()
+        logger.info("Navigated to %s", self.page.url)
+
+    @timed
     async def take_screenshot(self, filename: str):
-        """Take screenshot of the page."""
-        await self.page.screenshot(path=f"reports/screenshots/{filename}.png")
-        logger.info(f"Screenshot saved as {filename}")
+        """Take screenshot of the page, writing the file off the event loop."""
+        data = await self.page.screenshot()
+        path = Path("reports/screenshots") / f"{filename}.png"
+        await asyncio.to_thread(_write_file, path, data)
+        logger.info("Screenshot saved as %s", filename)
 
+    @timed
     async def get_page_title(self) -> str:
         """Get page title."""
         title = await self.page.title()
-        logger.info(f"Page title: {title}")
+        logger.info("Page title: %s", title)
         return title
 
+    @timed
     async def get_page_url(self) -> str:
         """Get current page URL."""
         url = self.page.url
-        logger.info(f"Current URL: {url}")
+        logger.info("Current URL: %s", url)
         return url
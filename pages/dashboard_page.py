@@ -2,6 +2,7 @@
 
 from playwright.async_api import Page
 from pages.base_page import BasePage
+from utils.timing import timed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,36 +13,47 @@ class DashboardPage(BasePage):
 
     # Locators
     DASHBOARD_TITLE = "h6.oxd-topbar-header-breadcrumb-module:has-text('Dashboard')"
-    USER_PROFILE_DROPDOWN = "//img[@class='oxd-userdropdown-img']"
+    # The tab holding the avatar and the user's name; the avatar image alone has
+    # no layout box when the resource blocker drops images
+    USER_PROFILE_DROPDOWN = "span.oxd-userdropdown-tab"
+    USER_NAME = "p.oxd-userdropdown-name"
     LOGOUT_BUTTON = "//a[@href='/web/index.php/auth/logout']"
+    LOGIN_URL = "**/auth/login"
     QUICK_LAUNCH_MENU = "//p[@class='oxd-text oxd-text--p oxd-text--subtitle-2']"
     WELCOME_MESSAGE = "//h6[contains(text(), 'Welcome')]"
+    KEY_ELEMENTS = (DASHBOARD_TITLE, USER_NAME)
 
+    @timed
     async def is_dashboard_loaded(self) -> bool:
         """Check if dashboard is loaded."""
-        return await self.is_element_visible(self.DASHBOARD_TITLE)
+        return await self.is_loaded()
 
+    @timed
     async def click_user_profile(self):
         """Click on user profile dropdown."""
         await self.click(self.USER_PROFILE_DROPDOWN)
         logger.info("Clicked user profile dropdown")
 
+    @timed
     async def click_logout(self):
         """Click on logout button."""
         await self.click(self.LOGOUT_BUTTON)
         logger.info("Clicked logout button")
 
+    @timed
     async def logout(self):
         """Perform logout action."""
         await self.click_user_profile()
-        await self.click_logout()
+        await self.wait_for_navigation(self.click_logout, self.LOGIN_URL)
         logger.info("Logged out")
 
+    @timed
     async def get_welcome_message(self) -> str:
         """Get welcome message."""
         welcome = await self.get_text(self.WELCOME_MESSAGE)
         return welcome
 
+    @timed
     async def get_page_title(self) -> str:
         """Get dashboard page title."""
         return await super().get_page_title()
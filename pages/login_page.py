@@ -2,6 +2,7 @@
 
 from playwright.async_api import Page
 from pages.base_page import BasePage
+from utils.timing import timed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,36 +17,42 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = "//button[@type='submit']"
     ERROR_MESSAGE = ".oxd-alert-content--error"  # CSS selector (more flexible)
     PAGE_TITLE = "//h5[@class='oxd-text oxd-text--h5 orangehrm-login-title']"
+    KEY_ELEMENTS = (PAGE_TITLE, USERNAME_INPUT, PASSWORD_INPUT, LOGIN_BUTTON)
 
+    @timed
     async def enter_username(self, username: str):
         """Enter username."""
         await self.fill(self.USERNAME_INPUT, username)
-        logger.info(f"Entered username: {username}")
+        logger.info("Entered username: %s", username)
 
+    @timed
     async def enter_password(self, password: str):
         """Enter password."""
         await self.fill(self.PASSWORD_INPUT, password)
-        logger.info(f"Entered password")
+        logger.info("Entered password")
 
+    @timed
     async def click_login(self):
         """Click login button."""
         await self.click(self.LOGIN_BUTTON)
         logger.info("Clicked login button")
 
+    @timed
     async def login(self, username: str, password: str):
         """Perform login action."""
         await self.enter_username(username)
         await self.enter_password(password)
-        await self.click_login()
-        # Wait for navigation to complete after login
-        await self.page.wait_for_load_state("networkidle")
-        logger.info(f"Login performed for user: {username}")
+        # Wait for the page the credential check redirects to (dashboard or login)
+        await self.wait_for_navigation(self.click_login)
+        logger.info("Login performed for user: %s", username)
 
+    @timed
     async def get_error_message(self) -> str:
         """Get error message if login fails."""
         error_text = await self.get_text(self.ERROR_MESSAGE)
         return error_text
 
+    @timed
     async def is_login_page_displayed(self) -> bool:
         """Check if login page is displayed."""
-        return await self.is_element_visible(self.PAGE_TITLE)
+        return await self.is_loaded()
@@ -0,0 +1 @@
+"""Plugins module - Pytest plugins for the test suite."""
@@ -0,0 +1,55 @@
+"""Fails tests fast when the system they depend on is down."""
+
+import pytest
+from config.config import Config
+from utils.health import breakers
+
+# Fixtures that mark a test as needing a dependency, and the breaker guarding it.
+# API clients are built offline, so API tests opt in with the live_api marker.
+DEPENDENCIES = {
+    "browser": "target",
+    "db_pool": "mysql",
+}
+MARKERS = {
+    "live_api": "api",
+}
+
+
+def dependencies_of(item) -> list:
+    """Return the breaker names a test depends on through its fixtures."""
+    names = {DEPENDENCIES[f] for f in getattr(item, "fixturenames", ()) if f in DEPENDENCIES}
+    names.update(breaker for marker, breaker in MARKERS.items() if item.get_closest_marker(marker))
+    if Config.HAR_MODE == "replay":
+        # Replayed tests are served from the HAR and never reach the target
+        names.discard("target")
+    return sorted(names)
+
+
+def pytest_runtest_setup(item):
+    """Skip or error a test before its fixtures wait out a dead dependency.
+
+    Runs after skip and skipif markers, so tests skipped anyway never probe.
+    """
+    if not Config.HEALTH_ENABLED:
+        return
+    for name in dependencies_of(item):
+        reason = breakers[name].check()
+        if reason is None:
+            continue
+        message = f"{name} is down: {reason}"
+        if Config.HEALTH_ON_FAILURE == "error":
+            pytest.fail(message, pytrace=False)
+        pytest.skip(message)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report dependencies that were down during the run."""
+    tripped = [b for b in breakers.values() if b.trips]
+    if not tripped:
+        return
+    terminalreporter.section("dependency health")
+    for breaker in tripped:
+        state = f"down: {breaker.reason}" if breaker.is_open else "recovered"
+        terminalreporter.write_line(
+            f"{breaker.name} {state} ({breaker.rejected} tests stopped, {breaker.probes} probes)"
+        )
@@ -0,0 +1,268 @@
+"""Change-impact test selection from the project files each test uses."""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+from fnmatch import fnmatch
+from pathlib import Path
+import pytest
+from config.config import Config
+from plugins.parallel import load_durations
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Files every test depends on: a change to any of them reruns the whole suite
+FULL_RUN_PATTERNS = ("tests/conftest.py", "config/*.py", "plugins/*.py", "pytest.ini", "requirements.txt")
+
+# sys.monitoring tool IDs without a fixed owner; COVERAGE_ID is left to coverage.py
+CUSTOM_TOOL_IDS = (3, 4)
+
+
+def pytest_addoption(parser):
+    """Register change-impact options."""
+    group = parser.getgroup("impact", "change-impact test selection")
+    group.addoption(
+        "--impact",
+        action="store_true",
+        help="Run only tests whose files changed since they last passed (and record them).",
+    )
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        help="Record the files each test uses without changing the selection.",
+    )
+
+
+def claim_tool_id(monitoring, name: str) -> int:
+    """Claim the profiler or a custom ``sys.monitoring`` tool ID, whichever is free."""
+    candidates = (monitoring.PROFILER_ID, *CUSTOM_TOOL_IDS)
+    for tool in candidates:
+        if monitoring.get_tool(tool) is None:
+            monitoring.use_tool_id(tool, name)
+            return tool
+    owners = ", ".join(f"{tool}: {monitoring.get_tool(tool)}" for tool in candidates)
+    raise pytest.UsageError(
+        f"Cannot trace files for {name}: sys.monitoring tool IDs are all in use ({owners}). "
+        "Run without other profilers or tracers."
+    )
+
+
+class FileTracer:
+    """Collects the source files of Python functions called while active.
+
+    Uses ``sys.monitoring`` where available, which reports each code object
+    once per test, and falls back to a profile hook on older Pythons. The
+    monitoring tool ID is claimed with ``claim_tool_id`` so coverage.py
+    keeps its own.
+    """
+
+    def __init__(self):
+        """Initialize idle tracer."""
+        self.files = set()
+        self._monitoring = getattr(sys, "monitoring", None)
+        if self._monitoring is not None:
+            self._tool = claim_tool_id(self._monitoring, "impact")
+            self._monitoring.register_callback(
+                self._tool, self._monitoring.events.PY_START, self._on_start
+            )
+
+    def _on_start(self, code, offset):
+        """Record a code object's file and stop reporting it until restarted."""
+        self.files.add(code.co_filename)
+        return self._monitoring.DISABLE
+
+    def _on_profile(self, frame, event, arg):
+        """Record the file of every Python call."""
+        if event == "call":
+            self.files.add(frame.f_code.co_filename)
+
+    def start(self):
+        """Start collecting into an empty set."""
+        self.files = set()
+        if self._monitoring is not None:
+            self._monitoring.restart_events()
+            self._monitoring.set_events(self._tool, self._monitoring.events.PY_START)
+        else:
+            sys.setprofile(self._on_profile)
+            threading.setprofile(self._on_profile)
+
+    def stop(self) -> set:
+        """Stop collecting and return the files seen."""
+        if self._monitoring is not None:
+            self._monitoring.set_events(self._tool, 0)
+        else:
+            sys.setprofile(None)
+            threading.setprofile(None)
+        return self.files
+
+    def close(self):
+        """Release the ``sys.monitoring`` tool ID."""
+        if self._monitoring is not None and self._tool is not None:
+            self._monitoring.set_events(self._tool, 0)
+            self._monitoring.register_callback(self._tool, self._monitoring.events.PY_START, None)
+            self._monitoring.free_tool_id(self._tool)
+            self._tool = None
+
+
+class ImpactSelector:
+    """Selects affected tests and records what each passing test used.
+
+    The map in ``Config.IMPACT_MAP`` stores, per test, the content hash of
+    every project file it imported or executed plus the full-run files.
+    A test is selected when it is new, failed last time, or any of those
+    hashes changed.
+    """
+
+    def __init__(self, config, select: bool):
+        """Initialize selector for a pytest config."""
+        self.config = config
+        self.select = select
+        self.root = Path(config.rootpath).resolve()
+        self.path = Path(Config.IMPACT_MAP)
+        self.tests = self._load()
+        self.tracer = FileTracer()
+        self._hashes = {}
+        self.used = {}
+        self.failed = set()
+        self.selected = []
+        self.deselected = []
+        self.changed = set()
+        self.full_run_files = sorted(
+            str(p.relative_to(self.root)).replace(os.sep, "/")
+            for pattern in FULL_RUN_PATTERNS
+            for p in self.root.glob(pattern)
+        )
+
+    def _load(self) -> dict:
+        """Load the recorded test map."""
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text()).get("tests", {})
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable impact map %s: %s", self.path, e)
+            return {}
+
+    def _relative(self, filename: str):
+        """Return a project-relative path for a source file, or None outside the project."""
+        try:
+            path = Path(filename).resolve().relative_to(self.root)
+        except (ValueError, OSError):
+            return None
+        parts = path.parts
+        if path.suffix != ".py" or any(p.startswith(".") or p == "site-packages" for p in parts):
+            return None
+        return path.as_posix()
+
+    def _hash(self, path: str):
+        """Return the content hash of a project file, or None if it is gone."""
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = hashlib.sha1((self.root / path).read_bytes()).hexdigest()
+            except OSError:
+                self._hashes[path] = None
+        return self._hashes[path]
+
+    def _changed_files(self, nodeid: str) -> list:
+        """Return the recorded files of a test whose content changed."""
+        return [p for p, digest in self.tests[nodeid].items() if self._hash(p) != digest]
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        """Keep only tests that are new or use a changed file."""
+        if not self.select:
+            return
+        for item in items:
+            if item.nodeid not in self.tests:
+                self.selected.append(item)
+                continue
+            changed = self._changed_files(item.nodeid)
+            if changed:
+                self.changed.update(changed)
+                self.selected.append(item)
+            else:
+                self.deselected.append(item)
+        if self.deselected:
+            config.hook.pytest_deselected(items=self.deselected)
+        items[:] = self.selected
+
+    def _imported_files(self, item) -> set:
+        """Return the project files the test's module imports names from."""
+        files = {str(item.path)}
+        module = getattr(item, "module", None)
+        for value in vars(module).values() if module is not None else ():
+            source = inspect.getmodule(value)
+            filename = getattr(source, "__file__", None)
+            if filename:
+                files.add(filename)
+        return files
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        """Trace the files a test executes during setup, call and teardown."""
+        self.tracer.start()
+        try:
+            yield
+        finally:
+            files = self.tracer.stop() | self._imported_files(item)
+            self.used[item.nodeid] = {p for p in map(self._relative, files) if p}
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        """Remember failed tests so they are selected again next time."""
+        if report.failed:
+            self.failed.add(report.nodeid)
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session):
+        """Store the files and hashes of tests that passed; forget failed ones."""
+        if not self.used:
+            return
+        if Config.WORKER_ID:
+            logger.info("Not recording the impact map in parallel worker %s", Config.WORKER_ID)
+            return
+        for nodeid, files in self.used.items():
+            if nodeid in self.failed:
+                self.tests.pop(nodeid, None)
+                continue
+            files = sorted(files.union(self.full_run_files))
+            self.tests[nodeid] = {p: self._hash(p) for p in files}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"tests": self.tests}, separators=(",", ":"), sort_keys=True))
+        os.replace(tmp_path, self.path)
+        logger.info("Recorded impact map for %s tests in %s", len(self.used), self.path)
+
+    @pytest.hookimpl
+    def pytest_unconfigure(self, config):
+        """Release the tracer's monitoring tool ID."""
+        self.tracer.close()
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report the selection and the estimated time saved."""
+        if not self.select:
+            return
+        durations = load_durations()
+        saved = sum(durations.get(item.nodeid, 0.0) for item in self.deselected)
+        terminalreporter.section("change impact")
+        full_run = sorted(self.changed.intersection(self.full_run_files))
+        if full_run:
+            terminalreporter.write_line(f"full run: {', '.join(full_run)} changed")
+        elif self.changed:
+            terminalreporter.write_line(f"changed: {', '.join(sorted(self.changed))}")
+        terminalreporter.write_line(
+            f"selected {len(self.selected)} of {len(self.selected) + len(self.deselected)} tests, "
+            f"skipped {len(self.deselected)} unaffected (~{saved:.1f}s saved)"
+        )
+
+
+def pytest_configure(config):
+    """Install the selector when impact selection or recording is requested."""
+    select = config.getoption("impact")
+    if select or config.getoption("impact_record"):
+        config.pluginmanager.register(ImpactSelector(config, select), "impact-selector")
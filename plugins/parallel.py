@@ -0,0 +1,246 @@
+"""Parallel test runner that shards tests by historical duration."""
+
+import heapq
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+import pytest
+from config.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DURATION = 1.0
+SMOOTHING = 0.5
+
+
+def pytest_addoption(parser):
+    """Register parallel runner options."""
+    group = parser.getgroup("parallel", "parallel test sharding")
+    group.addoption(
+        "--workers",
+        type=int,
+        default=Config.PARALLEL_WORKERS,
+        help="Number of worker processes (0 or 1 runs serially).",
+    )
+    group.addoption("--shard-file", default=None, help="Internal: node ids for a worker.")
+    group.addoption("--worker-report", default=None, help="Internal: worker result file.")
+
+
+def load_durations(path: str = None) -> dict:
+    """Load recorded test durations keyed by node id."""
+    path = Path(path or Config.DURATIONS_FILE)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable durations file %s: %s", path, e)
+        return {}
+
+
+def save_durations(measured: dict, path: str = None):
+    """Merge measured durations into the durations file."""
+    path = Path(path or Config.DURATIONS_FILE)
+    durations = load_durations(path)
+    for nodeid, seconds in measured.items():
+        previous = durations.get(nodeid)
+        if previous is not None:
+            seconds = SMOOTHING * seconds + (1 - SMOOTHING) * previous
+        durations[nodeid] = round(seconds, 3)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(durations, separators=(",", ":"), sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def shard(nodeids: list, durations: dict, workers: int) -> list:
+    """Split node ids across workers using longest-processing-time-first."""
+    known = sorted(durations[n] for n in nodeids if n in durations)
+    default = known[len(known) // 2] if known else DEFAULT_DURATION
+    weighted = sorted(
+        ((durations.get(n, default), n) for n in nodeids), key=lambda x: (-x[0], x[1])
+    )
+    heap = [(0.0, index) for index in range(workers)]
+    shards = [{"nodeids": [], "estimate": 0.0} for _ in range(workers)]
+    for seconds, nodeid in weighted:
+        load, index = heapq.heappop(heap)
+        shards[index]["nodeids"].append(nodeid)
+        shards[index]["estimate"] = load + seconds
+        heapq.heappush(heap, (load + seconds, index))
+    return [s for s in shards if s["nodeids"]]
+
+
+def _worker_args(config) -> list:
+    """Return the invocation arguments without the parallel options."""
+    args = []
+    skip_next = False
+    for arg in config.invocation_params.args:
+        if skip_next:
+            skip_next = False
+        elif arg == "--workers":
+            skip_next = True
+        elif not arg.startswith("--workers="):
+            args.append(arg)
+    return args
+
+
+class ParallelRecorder:
+    """Records per-test durations and outcomes in serial and worker processes."""
+
+    def __init__(self, config):
+        """Initialize recorder for a pytest config."""
+        self.config = config
+        self.durations = {}
+        self.failed = []
+        self.passed = 0
+        self.skipped = 0
+        self._phases = {}
+
+    @pytest.hookimpl
+    def pytest_collection_modifyitems(self, config, items):
+        """Keep only this worker's shard."""
+        shard_file = config.getoption("shard_file")
+        if not shard_file:
+            return
+        wanted = set(Path(shard_file).read_text().splitlines())
+        selected = [item for item in items if item.nodeid in wanted]
+        deselected = [item for item in items if item.nodeid not in wanted]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        """Collect a test's phases, then count its outcome and duration once."""
+        self._phases.setdefault(report.nodeid, {})[report.when] = report
+        if report.when != "teardown":
+            return
+        phases = self._phases.pop(report.nodeid)
+        call = phases.get("call")
+        if any(phase.failed for phase in phases.values()):
+            self.failed.append(report.nodeid)
+        elif call is not None and call.passed:
+            self.passed += 1
+        else:
+            self.skipped += 1
+        # Skipped tests take no time and would drag the smoothed duration down
+        if call is not None and not call.skipped:
+            self.durations[report.nodeid] = sum(phase.duration for phase in phases.values())
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session):
+        """Write worker results, or update the durations file when running serially."""
+        worker_report = self.config.getoption("worker_report")
+        if worker_report:
+            Path(worker_report).write_text(json.dumps({
+                "durations": self.durations,
+                "failed": self.failed,
+                "passed": self.passed,
+                "skipped": self.skipped,
+            }))
+        elif self.durations:
+            save_durations(self.durations)
+
+
+class ParallelController:
+    """Spawns worker processes and aggregates their results."""
+
+    def __init__(self, config, workers: int):
+        """Initialize controller for a pytest config and worker count."""
+        self.config = config
+        self.workers = workers
+        self.results = []
+        self.wall_time = 0.0
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        """Run the collected tests in sharded worker processes."""
+        if session.config.option.collectonly or not session.items:
+            return None
+
+        nodeids = [item.nodeid for item in session.items]
+        shards = shard(nodeids, load_durations(), min(self.workers, len(nodeids)))
+        run_dir = Path(Config.PARALLEL_DIR)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        base_args = _worker_args(self.config)
+
+        started = time.perf_counter()
+        processes = []
+        for index, worker in enumerate(shards):
+            worker_id = f"gw{index}"
+            shard_file = run_dir / f"{worker_id}.shard"
+            report_file = run_dir / f"{worker_id}.json"
+            log_file = run_dir / f"{worker_id}.log"
+            shard_file.write_text("\n".join(worker["nodeids"]))
+            report_file.unlink(missing_ok=True)
+            args = [
+                sys.executable, "-m", "pytest", *base_args,
+                "--workers=0",
+                f"--shard-file={shard_file}",
+                f"--worker-report={report_file}",
+            ]
+            env = dict(os.environ, WORKER_ID=worker_id)
+            log = open(log_file, "w")
+            process = subprocess.Popen(
+                args, cwd=self.config.invocation_params.dir, env=env,
+                stdout=log, stderr=subprocess.STDOUT,
+            )
+            processes.append((worker_id, worker, process, log, report_file, log_file))
+            logger.info(
+                "Started %s with %s tests (estimated %.1fs)",
+                worker_id, len(worker["nodeids"]), worker["estimate"],
+            )
+
+        measured = {}
+        for worker_id, worker, process, log, report_file, log_file in processes:
+            returncode = process.wait()
+            log.close()
+            result = {"failed": [], "passed": 0, "skipped": 0, "durations": {}}
+            if report_file.exists():
+                result.update(json.loads(report_file.read_text()))
+            elif returncode != 0:
+                result["failed"] = list(worker["nodeids"])
+            measured.update(result["durations"])
+            self.results.append({
+                "worker": worker_id,
+                "returncode": returncode,
+                "estimate": worker["estimate"],
+                "actual": sum(result["durations"].values()),
+                "log": str(log_file),
+                **result,
+            })
+        self.wall_time = time.perf_counter() - started
+
+        if measured:
+            save_durations(measured)
+        session.testsfailed = sum(len(r["failed"]) for r in self.results)
+        return True
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print per-worker results."""
+        if not self.results:
+            return
+        terminalreporter.section("parallel workers")
+        for r in self.results:
+            terminalreporter.write_line(
+                f"{r['worker']}: {r['passed']} passed, {len(r['failed'])} failed, "
+                f"{r['skipped']} skipped in {r['actual']:.1f}s "
+                f"(estimated {r['estimate']:.1f}s, exit {r['returncode']}) - {r['log']}"
+            )
+            for nodeid in r["failed"]:
+                terminalreporter.write_line(f"    FAILED {nodeid}")
+        terminalreporter.write_line(f"wall time: {self.wall_time:.1f}s")
+
+
+def pytest_configure(config):
+    """Install the controller or the recorder for this process."""
+    workers = config.getoption("workers") or 0
+    if workers > 1 and not config.getoption("shard_file"):
+        config.pluginmanager.register(ParallelController(config, workers), "parallel-controller")
+    else:
+        config.pluginmanager.register(ParallelRecorder(config), "parallel-recorder")
@@ -0,0 +1,74 @@
+"""Streams test results to the JSONL results store."""
+
+import os
+import time
+from datetime import datetime
+import pytest
+from config.config import Config
+from utils.results_store import ResultsStore, ResultsWriter
+
+# Shared by the controller and its workers through the environment
+RUN_ID_ENV = "RESULTS_RUN_ID"
+
+
+class ResultsRecorder:
+    """Writes one line per test as it finishes and merges the run at the end."""
+
+    def __init__(self, config, run_id: str):
+        """Initialize recorder for this process."""
+        self.config = config
+        self.run_id = run_id
+        self.store = ResultsStore()
+        worker = Config.WORKER_ID or "main"
+        self.worker = worker
+        self.writer = ResultsWriter(self.store.run_dir(run_id) / f"{worker}.jsonl")
+        self._pending = {}
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        """Collect phase timings and write the record after teardown."""
+        record = self._pending.setdefault(report.nodeid, {
+            "run": self.run_id,
+            "id": report.nodeid,
+            "worker": self.worker,
+            "start": time.time() - report.duration,
+            "outcome": "passed",
+        })
+        record[report.when] = round(report.duration, 4)
+        if report.failed and record["outcome"] != "failed":
+            record["outcome"] = "failed"
+            record["message"] = report.longreprtext.strip().splitlines()[-1][:500] if report.longreprtext else ""
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+        if report.when == "teardown":
+            record = self._pending.pop(report.nodeid)
+            record["duration"] = round(
+                sum(record.get(phase, 0.0) for phase in ("setup", "call", "teardown")), 4
+            )
+            self.writer.write(record)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        """Close this process's file; the main process merges the run."""
+        self.writer.close()
+        if not Config.WORKER_ID:
+            self.store.merge(self.run_id)
+
+
+def pytest_configure(config):
+    """Register the recorder with a run id shared by parallel workers."""
+    if not Config.RESULTS_ENABLED or config.option.collectonly:
+        return
+    if Config.WORKER_ID and os.environ.get(RUN_ID_ENV):
+        run_id = os.environ[RUN_ID_ENV]
+    else:
+        # A new id for every session, even a later pytest.main() in this process
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        os.environ[RUN_ID_ENV] = run_id
+    config.pluginmanager.register(ResultsRecorder(config, run_id), "results-recorder")
+
+
+def pytest_unconfigure(config):
+    """Forget the run id once the controller's session is over."""
+    if not Config.WORKER_ID:
+        os.environ.pop(RUN_ID_ENV, None)
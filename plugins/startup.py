@@ -0,0 +1,81 @@
+"""Collection time profile and the heavy dependencies a run loaded."""
+
+import sys
+import time
+import pytest
+
+# Dependencies that should only be imported by the fixtures and tests that use them
+HEAVY_MODULES = ("playwright", "mysql", "requests")
+
+
+def pytest_addoption(parser):
+    """Register the startup profile option."""
+    parser.getgroup("startup", "startup profile").addoption(
+        "--startup-profile",
+        action="store_true",
+        help="Report per-module collection time and which heavy dependencies were imported.",
+    )
+
+
+def loaded_heavy_modules() -> set:
+    """Return the heavy dependencies currently imported."""
+    return {name for name in HEAVY_MODULES if name in sys.modules}
+
+
+class StartupProfiler:
+    """Times collection of each test module and notes the heavy imports it caused."""
+
+    def __init__(self):
+        """Initialize profiler; dependencies loaded so far came from conftest and plugins."""
+        self.configured = loaded_heavy_modules()
+        self.modules = {}
+        self.collection = 0.0
+        self.collected = 0
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        """Time the whole collection."""
+        start = time.perf_counter()
+        yield
+        self.collection = time.perf_counter() - start
+        self.collected = len(session.items)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        """Time importing and collecting one test module."""
+        if not isinstance(collector, pytest.Module):
+            yield
+            return
+        before = loaded_heavy_modules()
+        start = time.perf_counter()
+        yield
+        self.modules[collector.nodeid] = (
+            time.perf_counter() - start, sorted(loaded_heavy_modules() - before)
+        )
+
+    def report_lines(self, top: int = 10) -> list:
+        """Return the collection profile, slowest modules first."""
+        lines = [f"collected {self.collected} items in {self.collection:.3f}s"]
+        slowest = sorted(self.modules.items(), key=lambda m: m[1][0], reverse=True)[:top]
+        for nodeid, (seconds, loaded) in slowest:
+            suffix = f"  (loaded {', '.join(loaded)})" if loaded else ""
+            lines.append(f"{seconds:8.3f}s  {nodeid}{suffix}")
+        if self.configured:
+            lines.append(f"loaded by conftest/plugins: {', '.join(sorted(self.configured))}")
+        not_loaded = sorted(set(HEAVY_MODULES) - loaded_heavy_modules())
+        if not_loaded:
+            lines.append(f"not loaded: {', '.join(not_loaded)}")
+        return lines
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print the startup profile."""
+        terminalreporter.section("startup profile")
+        for line in self.report_lines():
+            terminalreporter.write_line(line)
+
+
+def pytest_configure(config):
+    """Install the profiler when requested."""
+    if config.getoption("startup_profile"):
+        config.pluginmanager.register(StartupProfiler(), "startup-profiler")
@@ -0,0 +1,58 @@
+"""Per-action timing report for page object calls."""
+
+import json
+import os
+from pathlib import Path
+import pytest
+from config.config import Config
+from utils.logger import get_logger
+from utils.timing import recorder
+
+logger = get_logger(__name__)
+
+
+def report_path() -> Path:
+    """Return the timing report path, suffixed with the worker id in workers."""
+    path = Path(Config.TIMING_REPORT)
+    if Config.WORKER_ID:
+        path = path.with_name(f"{path.stem}_{Config.WORKER_ID}{path.suffix}")
+    return path
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    """Attribute spans recorded during a test, fixtures included, to its node id."""
+    recorder.test_id = item.nodeid
+    yield
+    recorder.test_id = ""
+
+
+def pytest_sessionfinish(session):
+    """Write the aggregated timing report."""
+    if not recorder.spans:
+        return
+    path = report_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(recorder.summary(Config.TIMING_TOP_N), indent=2))
+    os.replace(tmp_path, path)
+    logger.info("Wrote timing report for %s spans to %s", len(recorder.spans), path)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the slowest actions."""
+    if not recorder.spans:
+        return
+    summary = recorder.summary(Config.TIMING_TOP_N)
+    terminalreporter.section("slowest page actions")
+    for entry in summary["actions"][:Config.TIMING_TOP_N]:
+        terminalreporter.write_line(
+            f"{entry['p95']:8.3f}s p95 {entry['p50']:8.3f}s p50 {entry['max']:8.3f}s max "
+            f"x{entry['count']:<4} {entry['action']} {entry['selector'] or ''}"
+        )
+    terminalreporter.write_line(f"full report: {report_path()}")
+
+
+def pytest_configure(config):
+    """Enable or disable span recording."""
+    recorder.enabled = Config.TIMING_ENABLED
@@ -1,6 +1,12 @@
 """API Tests for OrangeHRM."""
 
+import time
 import pytest
+import requests
+from utils.api_client import APIClient
+from utils.api_load import LatencyHistogram
+from utils.health import CircuitBreaker, probe_http
+from utils.response_cache import ResponseCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,3 +40,128 @@ class TestAPIEndpoints:
         api_client.set_authorization(token)
         assert api_client.headers["Authorization"] == f"Bearer {token}"
         logger.info("✓ Set authorization test passed")
+
+    def test_session_shared_between_clients(self, api_client, http_session):
+        """Test API client reuses the pooled session but keeps its own headers."""
+        assert api_client.session is http_session
+        assert "X-Custom" not in api_client.headers
+        logger.info("✓ Shared session test passed")
+
+    def test_retry_on_connection_error(self, http_session):
+        """Test idempotent requests are retried before giving up."""
+        client = APIClient(base_url="http://127.0.0.1:9", session=http_session)
+        client.retries, client.backoff = 2, 0.01
+        attempts = []
+        original = http_session.request
+
+        def counting_request(*args, **kwargs):
+            attempts.append(args[0])
+            return original(*args, **kwargs)
+
+        http_session.request = counting_request
+        try:
+            assert client.get("/ping") is None
+            assert client.post("/ping") is None
+        finally:
+            del http_session.request
+        assert attempts == ["GET", "GET", "GET", "POST"]
+        logger.info("✓ Retry on connection error test passed")
+
+    async def test_batch_bounded_and_isolates_failures(self, api_client):
+        """Test batch requests respect the concurrency limit and keep going after failures."""
+        running, peak = 0, 0
+
+        def fake_request(method, endpoint, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            time.sleep(0.02)
+            running -= 1
+            if endpoint.endswith("/3"):
+                raise ValueError("boom")
+            return endpoint
+
+        api_client._request = fake_request
+        specs = [{"endpoint": f"/api/v2/pim/employees/{i}"} for i in range(10)]
+        results = [r async for r in api_client.batch(specs, concurrency=3)]
+
+        assert len(results) == 10
+        assert peak <= 3
+        assert [r["spec"]["endpoint"] for r in results if r["error"]] == ["/api/v2/pim/employees/3"]
+        logger.info("✓ Batch requests test passed")
+
+    def test_cached_get_revalidates_with_etag(self, http_session):
+        """Test cached GETs are revalidated with If-None-Match and reused on 304."""
+        client = APIClient(session=http_session, cache=ResponseCache())
+        sent = []
+
+        def fake_request(method, endpoint, headers=None, **kwargs):
+            sent.append(headers or {})
+            response = requests.Response()
+            response.status_code = 304 if headers else 200
+            response.headers.update({"ETag": '"v1"', "Cache-Control": "no-cache"})
+            response._content = b"" if headers else b'{"data": []}'
+            return response
+
+        client._request = fake_request
+        first = client.get("/api/v2/admin/job-titles")
+        second = client.get("/api/v2/admin/job-titles")
+
+        assert second is first
+        assert sent == [{}, {"If-None-Match": '"v1"'}]
+        assert client.cache.stats()["revalidations"] == 1
+        logger.info("✓ Cached GET revalidation test passed")
+
+    def test_cached_get_dropped_on_no_store_304(self, http_session):
+        """Test a 304 carrying Cache-Control: no-store evicts the cached entry."""
+        client = APIClient(session=http_session, cache=ResponseCache())
+        sent = []
+
+        def fake_request(method, endpoint, headers=None, **kwargs):
+            sent.append(headers or {})
+            response = requests.Response()
+            response.status_code = 304 if headers else 200
+            cache_control = "no-store" if headers else "no-cache"
+            response.headers.update({"ETag": '"v1"', "Cache-Control": cache_control})
+            response._content = b"" if headers else b'{"data": []}'
+            return response
+
+        client._request = fake_request
+        first = client.get("/api/v2/admin/job-titles")
+        assert client.get("/api/v2/admin/job-titles") is first
+        assert client.cache.stats()["entries"] == 0 and client.cache.stats()["bytes"] == 0
+
+        client.get("/api/v2/admin/job-titles")
+        assert sent == [{}, {"If-None-Match": '"v1"'}, {}]
+        logger.info("✓ Cached GET no-store eviction test passed")
+
+    def test_latency_histogram_percentiles(self):
+        """Test load histogram percentiles stay within bucket precision and survive export."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        restored = LatencyHistogram.from_dict(histogram.to_dict())
+        assert restored.count == 1000
+        assert restored.percentile(50) == pytest.approx(0.5, rel=0.03)
+        assert restored.percentile(99) == pytest.approx(0.99, rel=0.03)
+        assert restored.percentile(100) == pytest.approx(1.0)
+        logger.info("✓ Latency histogram test passed")
+
+    def test_circuit_breaker_trips_and_recovers(self):
+        """Test a failed probe stops callers until a later re-probe succeeds."""
+        now = [0.0]
+        refused = probe_http("http://127.0.0.1:9", timeout=1)
+        results = [refused, None]
+        breaker = CircuitBreaker("api", lambda: results.pop(0), retry_interval=30, clock=lambda: now[0])
+
+        assert refused is not None
+        assert breaker.check() == refused
+        now[0] = 10
+        assert breaker.check() == refused
+        assert breaker.probes == 1 and breaker.rejected == 2
+
+        now[0] = 31
+        assert breaker.check() is None
+        assert breaker.probes == 2 and not breaker.is_open
+        logger.info("✓ Circuit breaker test passed")
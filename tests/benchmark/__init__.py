@@ -0,0 +1 @@
+"""Page-load benchmark tests module."""
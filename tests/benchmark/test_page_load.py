@@ -0,0 +1,68 @@
+"""Page-load benchmarks for the main OrangeHRM pages."""
+
+import pytest
+from config.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.benchmark
+@pytest.mark.ui
+@pytest.mark.asyncio
+# Load every resource so paint metrics reflect what users see
+@pytest.mark.block_resources(False)
+class TestPageLoad:
+    """Measure page loads and fail when a metric regresses against the baseline."""
+
+    def require_baseline(self, page_benchmark, name):
+        """Skip before measuring when there is no baseline to compare with."""
+        if Config.BENCHMARK_UPDATE_BASELINE:
+            return
+        problem = page_benchmark.missing_baseline(name)
+        if problem:
+            pytest.skip(f"{problem}; record one with BENCHMARK_UPDATE_BASELINE=true pytest -m benchmark")
+
+    def check(self, page_benchmark, name):
+        """Assert the page has no regressed metrics unless the baseline is being updated."""
+        if Config.BENCHMARK_UPDATE_BASELINE:
+            return
+        regressions = page_benchmark.regressions(name)
+        assert not regressions, "\n".join(regressions)
+
+    async def test_login_page_load(self, page, login_page, page_benchmark):
+        """Benchmark the login page."""
+        self.require_baseline(page_benchmark, "login")
+
+        async def load():
+            await login_page.navigate_to(f"{Config.BASE_URL}/web/index.php/auth/login")
+            assert await login_page.is_login_page_displayed()
+
+        await page_benchmark.measure("login", page, load)
+        self.check(page_benchmark, "login")
+        logger.info("✓ Login page benchmark passed")
+
+    async def test_dashboard_page_load(self, authenticated_page, authenticated_dashboard, page_benchmark):
+        """Benchmark the dashboard page."""
+        self.require_baseline(page_benchmark, "dashboard")
+        dashboard_page = authenticated_dashboard
+
+        async def load():
+            await dashboard_page.navigate_to(f"{Config.BASE_URL}/web/index.php/dashboard/index")
+            assert await dashboard_page.is_dashboard_loaded()
+
+        await page_benchmark.measure("dashboard", authenticated_page, load)
+        self.check(page_benchmark, "dashboard")
+        logger.info("✓ Dashboard page benchmark passed")
+
+    async def test_admin_page_load(self, authenticated_page, admin_page, page_benchmark):
+        """Benchmark the admin system users page."""
+        self.require_baseline(page_benchmark, "admin")
+
+        async def load():
+            await admin_page.navigate_to(f"{Config.BASE_URL}/web/index.php/admin/viewSystemUsers")
+            assert await admin_page.is_admin_page_loaded()
+
+        await page_benchmark.measure("admin", authenticated_page, load)
+        self.check(page_benchmark, "admin")
+        logger.info("✓ Admin page benchmark passed")
@@ -1,88 +1,422 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
 
+Playwright, MySQL and requests are imported inside the fixtures that need
+them, so a marker-filtered run only loads the dependencies it uses.
+"""
+
+import asyncio
 import pytest
-from playwright.async_api import async_playwright
 from config.config import Config
-from pages.login_page import LoginPage
-from pages.dashboard_page import DashboardPage
 from utils.logger import get_logger
-from utils.database import DatabaseConnection
-from utils.api_client import APIClient
+from utils.response_cache import ResponseCache
+from utils.resource_blocker import BlockingStats
+from utils.artifacts import ArtifactStore
+from utils.health import breakers
 
 logger = get_logger(__name__)
 
+pytest_plugins = [
+    "plugins.parallel", "plugins.impact", "plugins.health", "plugins.results",
+    "plugins.startup", "plugins.timing",
+]
+
+blocking_stats = BlockingStats()
+har_unmatched = {}
+api_response_cache = ResponseCache()
+seeding_report = {}
+benchmark_results = {}
+sql_profiles = {}
+artifact_store = ArtifactStore()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they are selected with ``-m benchmark``."""
+    if "benchmark" in (config.option.markexpr or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with -m benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Keep each phase's report on the item so fixtures can see the outcome."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+def phase_failed(node) -> bool:
+    """Return True if the test's setup or call phase failed."""
+    return any(
+        getattr(getattr(node, f"rep_{when}", None), "failed", False) for when in ("setup", "call")
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Fixture to provide one event loop shared by the whole session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def browser(event_loop):
+    """Fixture to provide one Playwright browser per worker session."""
+    from playwright.async_api import async_playwright
+
+    playwright = event_loop.run_until_complete(async_playwright().start())
+    browser = event_loop.run_until_complete(
+        playwright[Config.BROWSER_TYPE].launch(headless=Config.HEADLESS)
+    )
+    yield browser
+    event_loop.run_until_complete(browser.close())
+    event_loop.run_until_complete(playwright.stop())
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, event_loop):
+    """Fixture to provide the warm pool of browser contexts."""
+    from utils.browser_pool import BrowserContextPool
+
+    pool = BrowserContextPool(browser, size=Config.CONTEXT_POOL_SIZE)
+    event_loop.run_until_complete(pool.fill())
+    yield pool
+    event_loop.run_until_complete(pool.close())
+
+
+def resource_blocker_for(node):
+    """Build the resource blocker for a test, honouring the block_resources marker."""
+    from utils.resource_blocker import ResourceBlocker
+
+    types, urls = Config.BLOCK_RESOURCE_TYPES, Config.BLOCK_URL_PATTERNS
+    marker = node.get_closest_marker("block_resources")
+    if marker is not None:
+        if marker.args and not marker.args[0]:
+            types, urls = (), ()
+        else:
+            types = marker.kwargs.get("types", types)
+            urls = marker.kwargs.get("urls", urls)
+    return ResourceBlocker(types, urls, stats=blocking_stats)
+
 
 @pytest.fixture(scope="function")
-async def browser():
-    """Fixture to provide Playwright browser instance."""
-    async with async_playwright() as p:
-        browser = await p[Config.BROWSER_TYPE].launch(headless=Config.HEADLESS)
-        yield browser
-        await browser.close()
+async def context(request, context_pool):
+    """Fixture to provide an isolated browser context for one test."""
+    from utils.har import HarReplayer, har_path, record_har
+
+    context = await context_pool.acquire()
+    replayer = None
+    if Config.HAR_MODE == "record":
+        await record_har(context, har_path(request.node.nodeid))
+    elif Config.HAR_MODE == "replay":
+        path = har_path(request.node.nodeid)
+        if not path.exists():
+            await context_pool.release(context)
+            pytest.fail(f"No HAR recording for {request.node.nodeid} at {path}", pytrace=False)
+        replayer = HarReplayer(path)
+        await replayer.install(context)
+    # Installed last so it runs first and falls back to the HAR handlers
+    await resource_blocker_for(request.node).install(context)
+    yield context
+    await context_pool.release(context)
+    if replayer is not None and replayer.unmatched:
+        har_unmatched[request.node.nodeid] = replayer.unmatched
 
 
 @pytest.fixture(scope="function")
-async def page(browser):
-    """Fixture to provide Playwright page instance."""
-    page = await browser.new_page()
+async def page(request, context):
+    """Fixture to provide Playwright page instance.
+
+    A trace or page-load log is kept while the test runs, and artifacts
+    are written to ``ARTIFACT_DIR`` only if the test fails.
+    """
+    from utils.artifacts import FailureCapture
+
+    capture = FailureCapture(context, artifact_store)
+    await capture.start()
+    page = await context.new_page()
     yield page
+    await capture.finish(request.node.nodeid, phase_failed(request.node))
     await page.close()
 
 
 @pytest.fixture(scope="function")
 async def login_page(page):
     """Fixture to provide LoginPage instance."""
+    from pages.login_page import LoginPage
+
     return LoginPage(page)
 
 
 @pytest.fixture(scope="function")
 async def dashboard_page(page):
     """Fixture to provide DashboardPage instance."""
+    from pages.dashboard_page import DashboardPage
+
     return DashboardPage(page)
 
 
+@pytest.fixture(scope="session")
+def auth_cache(browser):
+    """Fixture to provide the authenticated storage state cache."""
+    from utils.auth_cache import AuthStateCache
+
+    return AuthStateCache(browser)
+
+
 @pytest.fixture(scope="function")
-async def authenticated_page(page):
-    """Fixture to provide authenticated page (logged in)."""
-    login_page = LoginPage(page)
-    await page.goto(Config.BASE_URL)
-    await login_page.login(Config.DEFAULT_USERNAME, Config.DEFAULT_PASSWORD)
+async def authenticated_page(request, page, auth_cache):
+    """Fixture to provide authenticated page (logged in).
+
+    The session is seeded from the cached storage state; tests marked
+    with ``fresh_login`` (and HAR runs, so the login is part of the
+    recording) log in through the UI instead.
+    """
+    use_cache = Config.AUTH_CACHE_ENABLED and not Config.HAR_MODE
+    if use_cache and not request.node.get_closest_marker("fresh_login"):
+        await auth_cache.authenticate(page, Config.DEFAULT_USERNAME, Config.DEFAULT_PASSWORD)
+    else:
+        from pages.login_page import LoginPage
+
+        login_page = LoginPage(page)
+        await page.goto(Config.BASE_URL)
+        await login_page.login(Config.DEFAULT_USERNAME, Config.DEFAULT_PASSWORD)
     yield page
 
 
 @pytest.fixture(scope="function")
 async def authenticated_dashboard(authenticated_page):
     """Fixture to provide authenticated dashboard page."""
+    from pages.dashboard_page import DashboardPage
+
     return DashboardPage(authenticated_page)
 
 
 @pytest.fixture(scope="function")
-def db_connection():
-    """Fixture to provide database connection."""
+async def admin_page(authenticated_page):
+    """Fixture to provide AdminPage instance on an authenticated page."""
+    from pages.admin_page import AdminPage
+
+    return AdminPage(authenticated_page)
+
+
+@pytest.fixture(scope="session")
+def page_benchmark():
+    """Fixture to provide the page-load benchmark and its baseline.
+
+    With ``BENCHMARK_UPDATE_BASELINE=true`` the measured results are
+    written to the baseline file at session end.
+    """
+    from utils.benchmark import PageLoadBenchmark
+
+    benchmark = PageLoadBenchmark(results=benchmark_results)
+    yield benchmark
+    if Config.BENCHMARK_UPDATE_BASELINE and benchmark.results:
+        benchmark.save_baseline()
+
+
+@pytest.fixture(scope="session")
+def db_pool():
+    """Fixture to close the worker's MySQL connection pools at session end."""
+    from utils.database import close_pools
+
+    yield
+    close_pools()
+
+
+@pytest.fixture(scope="function")
+def db_connection(db_pool):
+    """Fixture to provide a pooled database connection inside a transaction.
+
+    Everything the test writes is rolled back at teardown.
+    """
+    from utils.database import DatabaseConnection
+
     db = DatabaseConnection()
-    db.connect()
+    if db.connect():
+        db.begin()
+    else:
+        breakers["mysql"].trip("connection from the pool failed")
     yield db
     db.disconnect()
 
 
+@pytest.fixture(scope="session")
+def seeder(db_pool):
+    """Fixture to provide the dataset seeder on its own committed connection.
+
+    Parallel workers share the database, so seeded tests are skipped there.
+    """
+    if Config.WORKER_ID:
+        pytest.skip("seeded datasets need a serial run (workers share the database)")
+
+    from tests.data.datasets import ALL_DATASETS
+    from utils.database import DatabaseConnection
+    from utils.seeding import Seeder
+
+    db = DatabaseConnection()
+    if not db.connect():
+        pytest.fail("Cannot seed test data: MySQL is unavailable", pytrace=False)
+    seeder = Seeder(db, ALL_DATASETS, report=seeding_report)
+    yield seeder
+    seeder.teardown()
+    db.disconnect()
+
+
+@pytest.fixture(scope="module")
+def seeded_data(request, seeder):
+    """Fixture to seed the datasets named by ``dataset`` markers in this module.
+
+    Data is seeded once per session and the affected tables are restored
+    from a snapshot after each module.
+    """
+    names = sorted({
+        name
+        for item in request.session.items
+        if item.module is request.module
+        for marker in item.iter_markers("dataset")
+        for name in marker.args
+    })
+    seeder.seed(names)
+    yield seeder
+    seeder.restore(names)
+
+
+@pytest.fixture(scope="session")
+def sql_profiler(db_pool):
+    """Fixture to provide the performance_schema SQL profiler."""
+    from utils.database import DatabaseConnection
+    from utils.sql_profiler import SqlProfiler
+
+    db = DatabaseConnection()
+    if not db.connect():
+        pytest.fail("Cannot profile SQL: MySQL is unavailable", pytrace=False)
+    yield SqlProfiler(db)
+    db.disconnect()
+
+
+@pytest.fixture(scope="function")
+def sql_profile(request, sql_profiler):
+    """Fixture to profile every statement the backend runs during a test.
+
+    Budgets from the ``sql_budget`` marker are asserted at teardown.
+    """
+    marker = request.node.get_closest_marker("sql_budget")
+    budget = dict(marker.kwargs) if marker else {}
+    explain = budget.pop("explain", None)
+    with sql_profiler.profile(
+        explain=Config.SQL_PROFILE_EXPLAIN if explain is None else explain
+    ) as profile:
+        yield profile
+    sql_profiles[request.node.nodeid] = profile
+    budget = {k: v for k, v in budget.items() if v is not None}
+    if budget:
+        profile.assert_budget(**budget)
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Fixture to provide the pooled keep-alive HTTP session."""
+    from utils.api_client import create_session
+
+    session = create_session()
+    yield session
+    session.close()
+
+
 @pytest.fixture(scope="function")
-def api_client():
-    """Fixture to provide API client."""
-    return APIClient()
+def api_client(http_session):
+    """Fixture to provide API client on the shared HTTP session."""
+    from utils.api_client import APIClient
+
+    return APIClient(session=http_session)
+
+
+@pytest.fixture(scope="session")
+def response_cache():
+    """Fixture to provide the run-wide API response cache."""
+    return api_response_cache
+
+
+@pytest.fixture(scope="function")
+def cached_api_client(http_session, response_cache):
+    """Fixture to provide API client whose GETs go through the response cache."""
+    from utils.api_client import APIClient
+
+    return APIClient(session=http_session, cache=response_cache)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Setup test environment before all tests."""
     logger.info("Setting up test environment...")
-    logger.info(f"Base URL: {Config.BASE_URL}")
-    logger.info(f"Headless mode: {Config.HEADLESS}")
-    logger.info(f"Browser: {Config.BROWSER_TYPE}")
+    logger.info("Base URL: %s", Config.BASE_URL)
+    logger.info("Headless mode: %s", Config.HEADLESS)
+    logger.info("Browser: %s", Config.BROWSER_TYPE)
+
+
+def pytest_sessionfinish(session):
+    """Wait for queued failure artifacts to be written."""
+    artifact_store.close()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report resource blocking, HAR replay, seeding, API cache, benchmark, SQL and artifact results."""
+    if blocking_stats.blocked or blocking_stats.allowed:
+        terminalreporter.section("resource blocking")
+        for line in blocking_stats.summary_lines():
+            terminalreporter.write_line(line)
+    if har_unmatched:
+        terminalreporter.section("HAR replay unmatched requests")
+        for nodeid, requests in har_unmatched.items():
+            terminalreporter.write_line(nodeid)
+            for line in requests:
+                terminalreporter.write_line(f"    {line}")
+    if seeding_report:
+        terminalreporter.section("test data seeding")
+        for name, entry in seeding_report.items():
+            terminalreporter.write_line(
+                f"{name}: {entry.get('rows', 0)} rows seeded in {entry.get('seed', 0):.2f}s, "
+                f"{entry.get('restores', 0)} restores in {entry.get('restore', 0):.2f}s"
+            )
+    stats = api_response_cache.stats()
+    if stats["hits"] or stats["misses"] or stats["revalidations"]:
+        terminalreporter.section("API response cache")
+        terminalreporter.write_line(
+            f"hits: {stats['hits']}, misses: {stats['misses']}, "
+            f"revalidations: {stats['revalidations']}, "
+            f"saved: {stats['bytes_saved'] / 1024:.1f} KiB"
+        )
+    if benchmark_results:
+        terminalreporter.section("page-load benchmarks (median ms)")
+        for name, summary in benchmark_results.items():
+            terminalreporter.write_line(
+                f"{name}: " + ", ".join(f"{m} {s['p50']:.0f}" for m, s in summary.items())
+            )
+    if sql_profiles:
+        terminalreporter.section("SQL profiles")
+        for nodeid, profile in sql_profiles.items():
+            terminalreporter.write_line(nodeid)
+            for line in profile.report_lines(limit=5):
+                terminalreporter.write_line(f"    {line}")
+    saved = [path for path in artifact_store.saved if path.exists()]
+    if saved or artifact_store.evicted:
+        terminalreporter.section("failure artifacts")
+        for path in saved:
+            terminalreporter.write_line(str(path))
+        if artifact_store.evicted:
+            terminalreporter.write_line(
+                f"{artifact_store.evicted} older artifacts evicted to stay under "
+                f"{Config.ARTIFACT_MAX_BYTES // (1024 * 1024)} MB"
+            )
 
 
 @pytest.fixture(scope="function", autouse=True)
 def test_logger(request):
     """Fixture to log test start and end."""
-    logger.info(f"Starting test: {request.node.name}")
+    logger.info("Starting test: %s", request.node.name)
     yield
-    logger.info(f"Completed test: {request.node.name}")
+    logger.info("Completed test: %s", request.node.name)
@@ -0,0 +1 @@
+"""Test data module - Declarative seed datasets."""
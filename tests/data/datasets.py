@@ -0,0 +1,45 @@
+"""Seed datasets for OrangeHRM tests."""
+
+from utils.seeding import Dataset
+
+# Seeded rows use a high key range so they never collide with demo data
+SEED_ID_BASE = 900000
+EMPLOYEE_COUNT = 300
+
+
+def _employees():
+    for i in range(EMPLOYEE_COUNT):
+        yield SEED_ID_BASE + i, f"SEED{i:05d}", f"Seed{i}", "Employee"
+
+
+def _system_users():
+    for i in range(EMPLOYEE_COUNT):
+        # user_role_id 2 is ESS; the password hash is a placeholder, seeded users don't log in
+        yield SEED_ID_BASE + i, 2, SEED_ID_BASE + i, f"seed_user_{i:05d}", "seeded", 0, 1
+
+
+EMPLOYEES = Dataset(
+    "employees",
+    tables={
+        "hs_hr_employee": {
+            "columns": ["emp_number", "employee_id", "emp_firstname", "emp_lastname"],
+            "rows": _employees,
+        },
+    },
+)
+
+SYSTEM_USERS = Dataset(
+    "system_users",
+    tables={
+        "ohrm_user": {
+            "columns": [
+                "id", "user_role_id", "emp_number", "user_name",
+                "user_password", "deleted", "status",
+            ],
+            "rows": _system_users,
+        },
+    },
+    depends_on=["employees"],
+)
+
+ALL_DATASETS = [EMPLOYEES, SYSTEM_USERS]
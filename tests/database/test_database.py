@@ -40,3 +40,85 @@ class TestDatabaseConnection:
         assert results is not None
         assert len(results) > 0
         logger.info("✓ Fetch multiple rows test passed")
+
+    def test_parameterized_query(self, db_connection):
+        """Test fetching with bound parameters."""
+        result = db_connection.fetch_one("SELECT %s + %s", (2, 3))
+
+        assert result is not None
+        assert result[0] == 5
+        logger.info("✓ Parameterized query test passed")
+
+    def test_stream_query_in_chunks(self, db_connection):
+        """Test streaming a result set in fixed-size chunks."""
+        query = "SELECT 1 UNION SELECT 2 UNION SELECT 3 UNION SELECT 4 UNION SELECT 5"
+        chunks = list(db_connection.stream_query(query, chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert db_connection.fetch_one("SELECT 1")[0] == 1
+        logger.info("✓ Streaming query test passed")
+
+    def test_stream_query_stopped_early(self, db_connection):
+        """Test breaking out of a large stream kills the query and keeps the connection usable."""
+        digits = " UNION ALL ".join(f"SELECT {n} AS n" for n in range(10))
+        joined = ", ".join(f"({digits}) AS t{i}" for i in range(7))
+        stream = db_connection.stream_query(f"SELECT t0.n FROM {joined}", chunk_size=100)
+
+        for chunk in stream:
+            assert len(chunk) == 100
+            break
+        stream.close()
+
+        assert db_connection.fetch_one("SELECT 1")[0] == 1
+        assert db_connection.in_transaction
+        logger.info("✓ Early-stopped streaming query test passed")
+
+    def test_runs_inside_rolled_back_transaction(self, db_connection):
+        """Test each test runs in a transaction with savepoint support."""
+        assert db_connection.in_transaction
+        with db_connection.savepoint():
+            # InnoDB lists the transaction once it has read a table
+            db_connection.fetch_one("SELECT COUNT(*) FROM ohrm_user")
+            result = db_connection.fetch_one(
+                "SELECT COUNT(*) FROM information_schema.innodb_trx "
+                "WHERE trx_mysql_thread_id = CONNECTION_ID()"
+            )
+        assert result is not None and result[0] == 1
+        logger.info("✓ Transactional test isolation passed")
+
+    def test_sql_profiler_reports_statements(self, db_connection, sql_profiler):
+        """Test the profiler picks up statements run inside the profiled block."""
+        with sql_profiler.profile() as profile:
+            db_connection.fetch_one("SELECT COUNT(*) FROM ohrm_user WHERE user_name = %s", ("Admin",))
+
+        assert profile.query_count >= 1
+        assert any("ohrm_user" in s["text"] for s in profile.statements)
+        profile.assert_budget(max_statement_ms=1000)
+        logger.info("✓ SQL profiler test passed")
+
+    def test_sql_profile_diff_keeps_slow_outlier(self):
+        """Test one slow execution of a known digest fails the statement budget."""
+        from utils.sql_profiler import PICOSECONDS_PER_MS, SqlProfiler
+
+        def digest(count, sum_ms, max_ms, no_index=0, no_good_index=0):
+            return {
+                "text": "SELECT * FROM ohrm_user", "sample": None, "count": count,
+                "sum_timer": sum_ms * PICOSECONDS_PER_MS, "max_timer": max_ms * PICOSECONDS_PER_MS,
+                "rows_examined": 0, "rows_sent": 0,
+                "no_index_used": no_index, "no_good_index_used": no_good_index,
+            }
+
+        profiler = SqlProfiler(type("Db", (), {"database": "orangehrm"})())
+        before = {"d1": digest(10, 100, 500)}
+        # Nine 1ms runs and one 200ms run: average 20.9ms, below the old 500ms maximum
+        after = {"d1": digest(20, 309, 500, no_index=10, no_good_index=10)}
+
+        averaged = profiler.diff(before, after)
+        assert not averaged.statements[0]["max_exact"]
+        profile = profiler.diff(before, after, {"d1": 200 * PICOSECONDS_PER_MS})
+        statement = profile.statements[0]
+        assert statement["max_exact"] and statement["max_ms"] == 200
+        assert profile.full_scans == 10 and profile.no_good_index == 10
+        with pytest.raises(AssertionError, match="200.0ms > 50ms"):
+            profile.assert_budget(max_statement_ms=50)
+        logger.info("✓ SQL profile window maximum test passed")
@@ -0,0 +1,185 @@
+"""Seeding tests against an in-memory fake of the statements the seeder runs."""
+
+import re
+from graphlib import CycleError
+import pytest
+from config.config import Config
+from tests.data.datasets import EMPLOYEE_COUNT, SEED_ID_BASE
+from utils.logger import get_logger
+from utils.seeding import Dataset, Seeder, TableSnapshot
+
+logger = get_logger(__name__)
+
+
+class FakeDb:
+    """Runs the seeder's statements on in-memory tables of row tuples."""
+
+    def __init__(self, tables: dict, foreign_keys=()):
+        """Initialize with table contents and (child, parent) foreign keys."""
+        self.tables = {name: list(rows) for name, rows in tables.items()}
+        self.foreign_keys = list(foreign_keys)
+        self.foreign_key_checks = 1
+        self.fail_on = None
+        self.statements = []
+
+    def execute_query(self, query: str, params=None):
+        """Apply a DDL/DML statement; return None on failure like DatabaseConnection."""
+        self.statements.append(query)
+        if self.fail_on and self.fail_on in query:
+            return None
+        if match := re.fullmatch(r"SET FOREIGN_KEY_CHECKS = (\d)", query):
+            self.foreign_key_checks = int(match.group(1))
+        elif match := re.fullmatch(r"DROP TABLE IF EXISTS `(\w+)`", query):
+            self.tables.pop(match.group(1), None)
+        elif match := re.fullmatch(r"CREATE TABLE `(\w+)` LIKE `(\w+)`", query):
+            self.tables[match.group(1)] = []
+        elif match := re.fullmatch(r"INSERT INTO `(\w+)` SELECT \* FROM `(\w+)`", query):
+            self.tables[match.group(1)].extend(self.tables[match.group(2)])
+        elif match := re.fullmatch(r"TRUNCATE TABLE `(\w+)`", query):
+            assert self.foreign_key_checks == 0, "TRUNCATE with foreign key checks on"
+            self.tables[match.group(1)] = []
+        else:
+            raise AssertionError(f"Unexpected statement: {query}")
+        return 0
+
+    def bulk_insert(self, table: str, columns: list, rows, batch_size: int = None):
+        """Append rows to a table."""
+        rows = list(rows)
+        self.tables[table].extend(rows)
+        return len(rows)
+
+    def fetch_query(self, query: str, params=None):
+        """Answer the seeder's information_schema foreign key lookup."""
+        assert "KEY_COLUMN_USAGE" in query
+        wanted = set(params)
+        return [(c, p) for c, p in self.foreign_keys if c in wanted and p in wanted]
+
+
+def datasets():
+    """Return employees and users datasets, users depending on employees."""
+    employees = Dataset("employees", {
+        "employee": {"columns": ["id"], "rows": [(100,), (101,)]},
+    })
+    users = Dataset("users", {
+        "user": {"columns": ["id", "emp"], "rows": lambda: iter([(1, 100), (2, 101)])},
+    }, depends_on=["employees"])
+    return [employees, users]
+
+
+@pytest.mark.database
+class TestSeeding:
+    """Test dataset ordering and table snapshot/restore."""
+
+    def test_resolve_orders_dependencies_first(self):
+        """Test datasets are resolved with their dependencies, dependencies first."""
+        seeder = Seeder(FakeDb({}), datasets())
+
+        assert seeder._resolve(["users"]) == ["employees", "users"]
+        with pytest.raises(KeyError, match="missing"):
+            seeder._resolve(["missing"])
+        logger.info("✓ Dataset resolution test passed")
+
+    def test_cycles_are_rejected(self):
+        """Test dataset and foreign key cycles raise instead of loading in a wrong order."""
+        a = Dataset("a", {"t_a": {"columns": [], "rows": []}}, depends_on=["b"])
+        b = Dataset("b", {"t_b": {"columns": [], "rows": []}}, depends_on=["a"])
+        with pytest.raises(CycleError):
+            Seeder(FakeDb({}), [a, b])._resolve(["a"])
+
+        db = FakeDb({}, foreign_keys=[("t_a", "t_b"), ("t_b", "t_a")])
+        with pytest.raises(CycleError):
+            Seeder(db)._table_order(["t_a", "t_b"])
+        logger.info("✓ Cycle detection test passed")
+
+    def test_table_order_puts_parents_first(self):
+        """Test foreign key parents load before children and self references are ignored."""
+        db = FakeDb({}, foreign_keys=[("user", "employee"), ("employee", "employee"), ("user", "role")])
+        order = Seeder(db)._table_order(["user", "employee", "role"])
+
+        assert order.index("employee") < order.index("user")
+        assert order.index("role") < order.index("user")
+        logger.info("✓ Table order test passed")
+
+    def test_snapshot_restore_brings_back_contents(self):
+        """Test restore replaces changed rows with the snapshot and re-enables FK checks."""
+        db = FakeDb({"employee": [(1,), (2,)], "user": [(10, 1)]})
+        snapshot = TableSnapshot(db, ["employee", "user"], "test")
+        snapshot.take()
+        db.tables["employee"].append((3,))
+        db.tables["user"].clear()
+
+        snapshot.restore()
+
+        assert db.tables["employee"] == [(1,), (2,)]
+        assert db.tables["user"] == [(10, 1)]
+        assert db.foreign_key_checks == 1
+        snapshot.drop()
+        assert not [t for t in db.tables if t.startswith("_snap_")]
+        logger.info("✓ Snapshot restore test passed")
+
+    def test_failed_restore_raises_and_reenables_fk_checks(self):
+        """Test a failed restore statement raises and never leaves FK checks off."""
+        db = FakeDb({"employee": [(1,)]})
+        snapshot = TableSnapshot(db, ["employee"], "test")
+        snapshot.take()
+        db.fail_on = "INSERT INTO `employee`"
+
+        with pytest.raises(RuntimeError, match="Seeding statement failed"):
+            snapshot.restore()
+        assert db.foreign_key_checks == 1
+        logger.info("✓ Failed restore test passed")
+
+    def test_seed_restore_and_teardown(self, monkeypatch):
+        """Test seeding, restoring after a module and tearing down to the original data."""
+        # Seeding is refused in parallel workers, which this offline test may run in
+        monkeypatch.setattr(Config, "WORKER_ID", "")
+        db = FakeDb({"employee": [(1,)], "user": []}, foreign_keys=[("user", "employee")])
+        report = {}
+        seeder = Seeder(db, datasets(), report=report)
+
+        assert seeder.seed(["users"]) == ["employees", "users"]
+        assert seeder.seed(["users"]) == []
+        assert db.tables["employee"] == [(1,), (100,), (101,)]
+        assert db.tables["user"] == [(1, 100), (2, 101)]
+
+        # A test module changes the seeded data
+        db.tables["user"].append((3, 100))
+        db.tables["employee"].remove((101,))
+        seeder.restore(["users"])
+        assert db.tables["user"] == [(1, 100), (2, 101)]
+        assert db.tables["employee"] == [(1,), (100,), (101,)]
+        assert report["users"]["restores"] == 1 and report["users"]["rows"] == 2
+
+        seeder.teardown()
+        assert db.tables == {"employee": [(1,)], "user": []}
+        assert db.foreign_key_checks == 1
+        logger.info("✓ Seed, restore and teardown test passed")
+
+    def test_seeding_refused_in_parallel_workers(self, monkeypatch):
+        """Test workers sharing the database never seed or truncate each other's tables."""
+        db = FakeDb({"employee": [], "user": []})
+        monkeypatch.setattr(Config, "WORKER_ID", "gw1")
+
+        with pytest.raises(RuntimeError, match="parallel worker gw1"):
+            Seeder(db, datasets()).seed(["users"])
+        assert db.statements == []
+        logger.info("✓ Parallel worker seeding refusal test passed")
+
+
+@pytest.mark.database
+@pytest.mark.dataset("system_users")
+@pytest.mark.usefixtures("seeded_data")
+class TestSeededData:
+    """Test the seeded datasets on the real database."""
+
+    def test_seeded_users_and_employees(self, db_connection):
+        """Test every seeded user exists and belongs to a seeded employee."""
+        result = db_connection.fetch_one(
+            "SELECT COUNT(*) FROM ohrm_user u JOIN hs_hr_employee e ON e.emp_number = u.emp_number "
+            "WHERE u.id >= %s AND e.emp_number >= %s",
+            (SEED_ID_BASE, SEED_ID_BASE),
+        )
+
+        assert result is not None
+        assert result[0] == EMPLOYEE_COUNT
+        logger.info("✓ Seeded data test passed")
@@ -0,0 +1,229 @@
+"""Unit tests of the pytest plugins, run against synthetic projects and data."""
+
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from config.config import Config
+from plugins.impact import ImpactSelector, claim_tool_id
+from plugins.parallel import SMOOTHING, ParallelRecorder, load_durations, save_durations, shard
+from plugins import results as results_plugin
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FakeMonitoring:
+    """Stands in for ``sys.monitoring`` tool ID bookkeeping."""
+
+    PROFILER_ID = 2
+
+    def __init__(self, tools: dict):
+        """Initialize with tool names already registered by ID."""
+        self.tools = dict(tools)
+
+    def get_tool(self, tool: int):
+        """Return the name registered for a tool ID, or None."""
+        return self.tools.get(tool)
+
+    def use_tool_id(self, tool: int, name: str):
+        """Register a tool ID, failing like sys.monitoring when it is taken."""
+        if tool in self.tools:
+            raise ValueError(f"tool {tool} is already in use")
+        self.tools[tool] = name
+
+
+def impact_project(tmp_path, monkeypatch, recorded: dict = None):
+    """Create or reopen a project in tmp_path; return (selector, deselected items, write)."""
+    def write(path: str, text: str):
+        (tmp_path / path).write_text(text)
+
+    for path in ("pytest.ini", "a.py", "b.py"):
+        if not (tmp_path / path).exists():
+            write(path, "# original\n")
+    map_path = tmp_path / "impact.json"
+    if recorded is not None:
+        map_path.write_text(json.dumps({"tests": recorded}))
+    monkeypatch.setattr(Config, "IMPACT_MAP", str(map_path))
+    monkeypatch.setattr(Config, "WORKER_ID", "")
+    deselected = []
+    hook = SimpleNamespace(pytest_deselected=lambda items: deselected.extend(items))
+    config = SimpleNamespace(rootpath=tmp_path, hook=hook)
+    selector = ImpactSelector(config, select=True)
+    return selector, deselected, write
+
+
+def items(*nodeids):
+    """Return fake collected items."""
+    return [SimpleNamespace(nodeid=nodeid) for nodeid in nodeids]
+
+
+@pytest.mark.plugins
+class TestImpactSelector:
+    """Test change-impact selection on a synthetic impact map."""
+
+    def test_claims_free_tool_id(self):
+        """Test the tracer leaves coverage's tool ID alone and fails clearly when all are taken."""
+        monitoring = FakeMonitoring({1: "coverage.py"})
+        assert claim_tool_id(monitoring, "impact") == monitoring.PROFILER_ID
+
+        monitoring = FakeMonitoring({1: "coverage.py", 2: "cProfile"})
+        assert claim_tool_id(monitoring, "impact") == 3
+        assert monitoring.tools[3] == "impact"
+
+        monitoring = FakeMonitoring({2: "cProfile", 3: "a", 4: "b"})
+        with pytest.raises(pytest.UsageError, match="2: cProfile"):
+            claim_tool_id(monitoring, "impact")
+        logger.info("✓ Tool ID claim test passed")
+
+    def test_unreadable_map_selects_everything(self, tmp_path, monkeypatch):
+        """Test a missing or corrupt map is ignored and every test is new."""
+        selector, _, _ = impact_project(tmp_path, monkeypatch)
+        assert selector.tests == {}
+        selector.pytest_unconfigure(None)
+
+        (tmp_path / "impact.json").write_text("{not json")
+        selector, deselected, _ = impact_project(tmp_path, monkeypatch)
+        collected = items("t::a", "t::b")
+        selector.pytest_collection_modifyitems(selector.config, collected)
+
+        assert selector.tests == {}
+        assert [i.nodeid for i in collected] == ["t::a", "t::b"] and not deselected
+        selector.pytest_unconfigure(None)
+        logger.info("✓ Unreadable impact map test passed")
+
+    def test_selects_tests_using_changed_files(self, tmp_path, monkeypatch):
+        """Test only new tests and tests whose recorded files changed are selected."""
+        selector, _, _ = impact_project(tmp_path, monkeypatch)
+        recorded = {
+            "t::uses_a": {"a.py": selector._hash("a.py"), "pytest.ini": selector._hash("pytest.ini")},
+            "t::uses_b": {"b.py": selector._hash("b.py"), "pytest.ini": selector._hash("pytest.ini")},
+        }
+        selector.pytest_unconfigure(None)
+        selector, deselected, write = impact_project(tmp_path, monkeypatch, recorded)
+        write("b.py", "B = 2\n")
+        collected = items("t::uses_a", "t::uses_b", "t::new")
+
+        selector.pytest_collection_modifyitems(selector.config, collected)
+
+        assert [i.nodeid for i in collected] == ["t::uses_b", "t::new"]
+        assert [i.nodeid for i in deselected] == ["t::uses_a"]
+        assert selector.changed == {"b.py"}
+        selector.pytest_unconfigure(None)
+        logger.info("✓ Changed file selection test passed")
+
+    def test_full_run_file_change_selects_all(self, tmp_path, monkeypatch):
+        """Test changing a full-run file such as pytest.ini reruns every recorded test."""
+        selector, _, write = impact_project(tmp_path, monkeypatch)
+        # t::failed is forgotten, so it is selected again as a new test
+        selector.used = {"t::uses_a": {"a.py"}, "t::uses_b": {"b.py"}, "t::failed": {"a.py"}}
+        selector.failed = {"t::failed"}
+        selector.pytest_sessionfinish(None)
+        selector.pytest_unconfigure(None)
+
+        recorded = json.loads((tmp_path / "impact.json").read_text())["tests"]
+        assert sorted(recorded) == ["t::uses_a", "t::uses_b"]
+        assert "pytest.ini" in recorded["t::uses_a"]
+
+        selector, deselected, write = impact_project(tmp_path, monkeypatch)
+        selector.pytest_collection_modifyitems(selector.config, items("t::uses_a", "t::uses_b"))
+        assert len(deselected) == 2
+        selector.pytest_unconfigure(None)
+
+        write("pytest.ini", "[pytest]\naddopts = -x\n")
+        selector, deselected, write = impact_project(tmp_path, monkeypatch)
+        collected = items("t::uses_a", "t::uses_b", "t::failed")
+        selector.pytest_collection_modifyitems(selector.config, collected)
+
+        assert len(collected) == 3 and not deselected
+        assert selector.changed.intersection(selector.full_run_files) == {"pytest.ini"}
+        selector.pytest_unconfigure(None)
+        logger.info("✓ Full run selection test passed")
+
+
+@pytest.mark.plugins
+class TestParallelRunner:
+    """Test duration-based sharding and the recorded durations."""
+
+    def test_shard_balances_longest_first(self):
+        """Test LPT assigns the longest tests first, each to the least loaded worker."""
+        durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+        shards = shard(sorted(durations), durations, workers=2)
+
+        assert [s["nodeids"] for s in shards] == [["a", "d", "f"], ["b", "c", "e"]]
+        assert [s["estimate"] for s in shards] == [9.0, 9.0]
+        logger.info("✓ Shard balancing test passed")
+
+    def test_shard_estimates_unknown_tests_with_median(self):
+        """Test tests without history count as the median duration and idle workers are dropped."""
+        durations = {"a": 1.0, "b": 3.0, "c": 8.0}
+        shards = shard(["a", "b", "c", "new"], durations, workers=6)
+
+        assert len(shards) == 4
+        assert {n: s["estimate"] for s in shards for n in s["nodeids"]}["new"] == 3.0
+        assert shard(["x", "y"], {}, workers=1)[0]["estimate"] == 2.0
+        logger.info("✓ Shard unknown duration test passed")
+
+    def test_durations_are_smoothed(self, tmp_path):
+        """Test new measurements are blended into recorded durations with the EMA weight."""
+        path = tmp_path / "durations.json"
+        save_durations({"a": 2.0}, path)
+        save_durations({"a": 4.0, "b": 1.0}, path)
+
+        durations = load_durations(path)
+        assert durations == {"a": SMOOTHING * 4.0 + (1 - SMOOTHING) * 2.0, "b": 1.0}
+
+        path.write_text("{not json")
+        assert load_durations(path) == {}
+        logger.info("✓ Duration smoothing test passed")
+
+    def test_recorder_counts_each_test_once(self):
+        """Test only tests whose call ran get a duration, and a teardown error is only a failure."""
+        recorder = ParallelRecorder(SimpleNamespace())
+
+        def run(nodeid, *phases):
+            for when, outcome, duration in phases:
+                recorder.pytest_runtest_logreport(SimpleNamespace(
+                    nodeid=nodeid, when=when, duration=duration, passed=outcome == "passed",
+                    failed=outcome == "failed", skipped=outcome == "skipped",
+                ))
+
+        run("t::passes", ("setup", "passed", 0.5), ("call", "passed", 2.0), ("teardown", "passed", 0.5))
+        run("t::skipped", ("setup", "skipped", 0.01), ("teardown", "passed", 0.0))
+        run("t::skips_in_body", ("setup", "passed", 0.1), ("call", "skipped", 0.0), ("teardown", "passed", 0.0))
+        run("t::teardown_error", ("setup", "passed", 0.1), ("call", "passed", 1.0), ("teardown", "failed", 0.1))
+
+        assert recorder.durations == {"t::passes": 3.0, "t::teardown_error": pytest.approx(1.2)}
+        assert (recorder.passed, recorder.skipped, recorder.failed) == (1, 2, ["t::teardown_error"])
+        logger.info("✓ Parallel recorder outcome test passed")
+
+
+@pytest.mark.plugins
+class TestResultsPlugin:
+    """Test the results recorder's run id."""
+
+    def test_each_session_gets_a_new_run_id(self, tmp_path, monkeypatch):
+        """Test a later session in the same process never reuses the previous run id."""
+        monkeypatch.setattr(Config, "RESULTS_DIR", str(tmp_path))
+        monkeypatch.setattr(Config, "RESULTS_ENABLED", True)
+        monkeypatch.setattr(Config, "WORKER_ID", "")
+        monkeypatch.delenv(results_plugin.RUN_ID_ENV, raising=False)
+
+        def session():
+            registered = []
+            config = SimpleNamespace(
+                option=SimpleNamespace(collectonly=False),
+                pluginmanager=SimpleNamespace(register=lambda plugin, name: registered.append(plugin)),
+            )
+            results_plugin.pytest_configure(config)
+            run_id = registered[0].run_id
+            # Workers started now inherit the controller's id
+            assert os.environ[results_plugin.RUN_ID_ENV] == run_id
+            results_plugin.pytest_unconfigure(config)
+            return run_id
+
+        first, second = session(), session()
+
+        assert first != second
+        assert results_plugin.RUN_ID_ENV not in os.environ
+        logger.info("✓ Results run id test passed")
@@ -18,12 +18,13 @@ class TestDashboard:
         assert is_loaded
         logger.info("✓ Dashboard loads after login test passed")
 
+    # Logging out ends the server-side session, so the cached one must not be used
+    @pytest.mark.fresh_login
     async def test_logout_functionality(self, authenticated_page, authenticated_dashboard):
         """Test logout functionality."""
         await authenticated_dashboard.logout()
         
         # Verify redirect to login page
-        await authenticated_page.wait_for_load_state("networkidle")
         assert "/login" in authenticated_page.url
         logger.info("✓ Logout test passed")
 
@@ -18,7 +18,6 @@ class TestLogin:
         await login_page.login(Config.DEFAULT_USERNAME, Config.DEFAULT_PASSWORD)
         
         # Verify redirect to dashboard
-        await page.wait_for_load_state("networkidle")
         assert "/dashboard/index" in page.url
         logger.info("✓ Successful login test passed")
 
@@ -36,7 +35,6 @@ class TestLogin:
         await login_page.login("InvalidUser", "InvalidPassword")
         
         # Verify error message appears
-        await page.wait_for_load_state("networkidle")
         error_message = await login_page.get_error_message()
         
         assert error_message is not None
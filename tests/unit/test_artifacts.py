@@ -0,0 +1,90 @@
+"""Failure artifact capture tests against fake Playwright pages and contexts."""
+
+import asyncio
+import pytest
+from utils.artifacts import ArtifactStore, FailureCapture
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Emitter:
+    """Minimal stand-in for Playwright's event emitter."""
+
+    def __init__(self):
+        """Initialize with no listeners."""
+        self.listeners = {}
+
+    def on(self, event, handler):
+        """Add a listener."""
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        """Remove a listener."""
+        self.listeners[event].remove(handler)
+
+    def emit(self, event, arg=None):
+        """Call the listeners of an event."""
+        for handler in list(self.listeners.get(event, [])):
+            handler(arg)
+
+
+class FakePage(Emitter):
+    """Page that counts its screenshots."""
+
+    url = "https://example.test/dashboard"
+
+    def __init__(self):
+        """Initialize page without screenshots."""
+        super().__init__()
+        self.screenshots = 0
+
+    def is_closed(self):
+        """Return False; the page stays open."""
+        return False
+
+    async def screenshot(self, **kwargs):
+        """Count the screenshot and return fake image bytes."""
+        self.screenshots += 1
+        return b"jpeg"
+
+
+class FakeContext(Emitter):
+    """Browser context holding fake pages."""
+
+    def __init__(self):
+        """Initialize context without pages."""
+        super().__init__()
+        self.pages = []
+
+
+@pytest.mark.unit
+class TestFailureCapture:
+    """Test failure-only capture of screenshots and page loads."""
+
+    def test_failure_capture_is_free_for_passing_tests(self, tmp_path):
+        """Test a passing test takes no screenshots and leaves no listeners behind."""
+        store = ArtifactStore(root=tmp_path)
+        context = FakeContext()
+        page = FakePage()
+
+        async def passing_then_failing():
+            capture = FailureCapture(context, store, mode="screenshots")
+            await capture.start()
+            context.pages.append(page)
+            context.emit("page", page)
+            page.emit("load")
+            assert await capture.finish("tests/x.py::passes", failed=False) is None
+            assert page.screenshots == 0
+            assert not page.listeners["load"] and not context.listeners["page"]
+
+            capture = FailureCapture(context, store, mode="screenshots")
+            await capture.start()
+            page.emit("load")
+            return await capture.finish("tests/x.py::fails", failed=True)
+
+        path = asyncio.run(passing_then_failing())
+        store.close()
+
+        assert page.screenshots == 1 and path.exists()
+        logger.info("✓ Failure capture cost test passed")
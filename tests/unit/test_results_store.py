@@ -0,0 +1,99 @@
+"""Results store tests on a temporary history."""
+
+import json
+import pytest
+from utils.logger import get_logger
+from utils.results_store import ResultsStore, ResultsWriter
+
+logger = get_logger(__name__)
+
+
+def record(run: str, nodeid: str, duration: float, outcome: str = "passed", **extra) -> dict:
+    """Return a result record as the results plugin writes it."""
+    return dict(run=run, id=nodeid, worker="main", start=1700000000.0,
+                outcome=outcome, duration=duration, **extra)
+
+
+def add_run(store: ResultsStore, run: str, workers: dict) -> int:
+    """Write per-worker files for a run and merge them into the history."""
+    for worker, records in workers.items():
+        writer = ResultsWriter(store.run_dir(run) / f"{worker}.jsonl")
+        for r in records:
+            writer.write(r)
+        writer.close()
+    return store.merge(run)
+
+
+@pytest.mark.unit
+class TestResultsStore:
+    """Test merging, pruning, trend queries and Allure export."""
+
+    def test_merge_worker_files(self, tmp_path):
+        """Test every worker's results are appended once and the run files removed."""
+        store = ResultsStore(root=tmp_path, keep_runs=10)
+        count = add_run(store, "r1", {
+            "gw0": [record("r1", "t.py::a", 1.0), record("r1", "t.py::b", 2.0)],
+            "gw1": [record("r1", "t.py::c", 3.0)],
+        })
+
+        assert count == 3
+        assert sorted(r["id"] for r in store.records()) == ["t.py::a", "t.py::b", "t.py::c"]
+        assert not store.run_dir("r1").exists()
+        assert store.merge("r1") == 0
+        logger.info("✓ Results merge test passed")
+
+    def test_prune_keeps_latest_runs(self, tmp_path):
+        """Test the history is rewritten with only the last keep_runs runs."""
+        store = ResultsStore(root=tmp_path, keep_runs=2)
+        for run in ("r1", "r2", "r3"):
+            add_run(store, run, {"main": [record(run, "t.py::a", 1.0)]})
+
+        assert store.runs() == ["r2", "r3"]
+        assert len(store.history.read_text().splitlines()) == 2
+        assert not store.history.with_suffix(".tmp").exists()
+        logger.info("✓ Results pruning test passed")
+
+    def test_slowest_and_getting_slower(self, tmp_path):
+        """Test median ordering of the slowest tests and the trend of passing runs."""
+        store = ResultsStore(root=tmp_path, keep_runs=10)
+        for i, run in enumerate(("r1", "r2", "r3", "r4")):
+            add_run(store, run, {"main": [
+                record(run, "t.py::steady", 1.0),
+                record(run, "t.py::slower", 0.5 * (i + 1)),
+                record(run, "t.py::slowest", 3.0),
+                # Failed runs are left out of durations
+                record(run, "t.py::flaky", 30.0, outcome="failed"),
+            ]})
+
+        assert [(n, m) for n, m, _ in store.slowest()] == [
+            ("t.py::slowest", 3.0), ("t.py::slower", 1.25), ("t.py::steady", 1.0)
+        ]
+        assert store.slowest(last_runs=1, top=1) == [("t.py::slowest", 3.0, 1)]
+        [(nodeid, first, last, increase)] = store.getting_slower()
+        assert nodeid == "t.py::slower"
+        assert (first, last, increase) == pytest.approx((0.5, 2.0, 3.0))
+        logger.info("✓ Results trend test passed")
+
+    def test_allure_export_maps_outcomes(self, tmp_path):
+        """Test the latest run is exported with Allure statuses, names and labels."""
+        store = ResultsStore(root=tmp_path / "results", keep_runs=10)
+        add_run(store, "old", {"main": [record("old", "t.py::Old::test_x", 1.0)]})
+        add_run(store, "new", {"main": [
+            record("new", "tests/t.py::TestA::test_ok", 1.5),
+            record("new", "tests/t.py::TestA::test_skip", 0.0, outcome="skipped"),
+            record("new", "tests/t.py::TestA::test_bad", 0.2, outcome="failed", message="AssertionError"),
+        ]})
+
+        out = tmp_path / "allure"
+        assert store.to_allure(str(out)) == 3
+        results = {
+            r["name"]: r for r in (json.loads(p.read_text()) for p in out.glob("*-result.json"))
+        }
+
+        assert {n: r["status"] for n, r in results.items()} == {
+            "test_ok": "passed", "test_skip": "skipped", "test_bad": "failed",
+        }
+        assert results["test_bad"]["statusDetails"]["message"] == "AssertionError"
+        assert results["test_ok"]["stop"] - results["test_ok"]["start"] == 1500
+        assert {"name": "suite", "value": "tests/t.py"} in results["test_ok"]["labels"]
+        logger.info("✓ Allure export test passed")
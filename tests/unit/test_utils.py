@@ -0,0 +1,175 @@
+"""Unit tests of the utilities, with no browser, API or database."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+import pytest
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.unit
+class TestPageLoadBenchmark:
+    """Test the benchmark baseline comparison."""
+
+    def test_missing_baseline_is_never_a_pass(self, tmp_path):
+        """Test a missing, outdated or empty baseline is reported instead of passing."""
+        from utils.benchmark import BASELINE_VERSION, PageLoadBenchmark
+
+        path = tmp_path / "baseline.json"
+        benchmark = PageLoadBenchmark(baseline_path=path)
+        assert "does not exist" in benchmark.missing_baseline("login")
+        with pytest.raises(LookupError):
+            benchmark.regressions("login")
+
+        path.write_text(json.dumps({"version": BASELINE_VERSION + 1, "pages": {}}))
+        assert "has version" in PageLoadBenchmark(baseline_path=path).missing_baseline("login")
+
+        path.write_text(json.dumps({"version": BASELINE_VERSION, "pages": {}}))
+        assert "no baseline for login" in PageLoadBenchmark(baseline_path=path).missing_baseline("login")
+        logger.info("✓ Missing baseline test passed")
+
+    def test_regression_needs_tolerance_and_sigma(self, tmp_path):
+        """Test a median regresses only past both the relative tolerance and the noise."""
+        from utils.benchmark import PageLoadBenchmark
+
+        benchmark = PageLoadBenchmark(baseline_path=tmp_path / "baseline.json", tolerance=0.2, sigma=3)
+        def summary(p50):
+            return {"login": {"load": {"p50": p50, "p95": p50, "stdev": 20.0, "samples": 5}}}
+
+        benchmark.results = summary(1000.0)
+        benchmark.save_baseline()
+        assert benchmark.missing_baseline("login") is None
+
+        benchmark.results = summary(1190.0)
+        assert benchmark.regressions("login") == []
+        benchmark.results = summary(1250.0)
+        assert benchmark.regressions("login") == [
+            "login load: median 1250ms vs baseline 1000ms (allowed +200ms)"
+        ]
+        logger.info("✓ Benchmark regression test passed")
+
+
+@pytest.mark.unit
+class TestUILoad:
+    """Test the UI load test's report."""
+
+    def test_ui_load_step_statistics(self):
+        """Test the UI load report's per-step percentiles, throughput and errors."""
+        from utils.ui_load import StepStats
+
+        stats = StepStats()
+        for ms in range(100, 0, -1):
+            stats.record("login", ms / 1000, ok=True)
+        stats.record("search", 0.2, ok=True)
+        stats.record("search", 5.0, ok=False)
+        stats.record("logout", 1.0, ok=False)
+        stats.iterations = 25
+
+        report = stats.report(elapsed=10)
+
+        login = report["steps"]["login"]
+        assert (login["count"], login["errors"], login["throughput"]) == (100, 0, 10.0)
+        assert (login["p50"], login["p90"], login["p99"], login["max"]) == (0.05, 0.09, 0.099, 0.1)
+        assert report["steps"]["search"]["count"] == 1 and report["steps"]["search"]["max"] == 0.2
+        assert report["steps"]["logout"] == {
+            "count": 0, "errors": 1, "throughput": 0.0,
+            "p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0,
+        }
+        assert report["iterations_per_second"] == 2.5
+        assert stats.report(elapsed=0)["steps"]["login"]["throughput"] == 0.0
+        logger.info("✓ UI load step statistics test passed")
+
+
+@pytest.mark.unit
+class TestTiming:
+    """Test page action timing spans."""
+
+    def test_timing_spans_never_record_credentials(self, monkeypatch):
+        """Test timing spans keep locators but not the text typed into the page."""
+        from pages.login_page import LoginPage
+        from utils.timing import recorder
+
+        class FakePage:
+            async def fill(self, locator, text):
+                pass
+
+        async def log_in(login_page):
+            await login_page.enter_username("Admin")
+            await login_page.enter_password("s3cret-pass")
+            await login_page.fill(LoginPage.PASSWORD_INPUT, text="s3cret-pass")
+
+        monkeypatch.setattr(recorder, "enabled", True)
+        monkeypatch.setattr(recorder, "spans", [])
+        asyncio.run(log_in(LoginPage(FakePage())))
+
+        recorded = repr(recorder.spans) + repr(recorder.summary())
+        assert "s3cret-pass" not in recorded
+        assert "Admin" not in recorded
+        selectors = {(action, selector) for _, action, selector, _, _ in recorder.spans}
+        assert ("LoginPage.enter_password", None) in selectors
+        assert ("BasePage.fill", LoginPage.PASSWORD_INPUT) in selectors
+        logger.info("✓ Timing credential redaction test passed")
+
+
+@pytest.mark.unit
+class TestHarReplay:
+    """Test HAR replay against a synthetic recording."""
+
+    def test_redirects_follow_the_current_base_url(self, tmp_path):
+        """Test a HAR recorded on one host replays, redirects included, on another."""
+        from utils.har import HarReplayer
+
+        def entry(url, status, headers):
+            return {
+                "request": {"method": "GET", "url": url},
+                "response": {"status": status, "headers": headers, "content": {"text": ""}},
+            }
+
+        path = tmp_path / "test.har"
+        path.write_text(json.dumps({"log": {"entries": [
+            entry("https://recorded.test/web/index.php", 302,
+                  [{"name": "Location", "value": "https://recorded.test/web/index.php/auth/login"}]),
+            entry("https://cdn.test/logo.png", 301, [{"name": "Location", "value": "https://cdn.test/v2/logo.png"}]),
+        ]}}))
+        replayer = HarReplayer(path, ignore_fields=(), base_url="http://localhost:8080/")
+
+        class FakeRoute:
+            def __init__(self, url):
+                self.request = SimpleNamespace(method="GET", url=url, post_data=None)
+                self.fulfilled = None
+
+            async def fulfill(self, **kwargs):
+                self.fulfilled = kwargs
+
+            async def abort(self, reason):
+                self.fulfilled = reason
+
+        app, cdn = FakeRoute("http://localhost:8080/web/index.php"), FakeRoute("https://cdn.test/logo.png")
+        asyncio.run(replayer._handle(app))
+        asyncio.run(replayer._handle(cdn))
+
+        assert app.fulfilled["status"] == 302
+        assert app.fulfilled["headers"]["location"] == "http://localhost:8080/web/index.php/auth/login"
+        assert cdn.fulfilled["headers"]["location"] == "https://cdn.test/v2/logo.png"
+        assert replayer.unmatched == []
+        logger.info("✓ HAR redirect rebase test passed")
+
+
+@pytest.mark.unit
+class TestLoadReport:
+    """Test the report files written by the load generators."""
+
+    def test_write_report(self, tmp_path, monkeypatch):
+        """Test reports are written as prefixed, timestamped JSON under LOAD_REPORT_DIR."""
+        from config.config import Config
+        from utils.load_report import write_report
+
+        monkeypatch.setattr(Config, "LOAD_REPORT_DIR", str(tmp_path / "load"))
+        path = write_report({"total": {"count": 3}}, "api_load")
+
+        assert path.parent == tmp_path / "load"
+        assert path.name.startswith("api_load_") and path.suffix == ".json"
+        assert json.loads(path.read_text()) == {"total": {"count": 3}}
+        logger.info("✓ Load report test passed")
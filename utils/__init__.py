@@ -1,7 +1,24 @@
-"""Utils module - Shared utilities."""
+"""Utils module - Shared utilities.
 
-from utils.logger import get_logger
-from utils.database import DatabaseConnection
-from utils.api_client import APIClient
+Exports are resolved on first access so importing one utility (e.g.
+``utils.timing`` from the page objects) doesn't load MySQL or requests.
+"""
 
-__all__ = ["get_logger", "DatabaseConnection", "APIClient"]
+import importlib
+
+_EXPORTS = {
+    "get_logger": "utils.logger",
+    "DatabaseConnection": "utils.database",
+    "APIClient": "utils.api_client",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import an exported name from its module on first use."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -1,19 +1,113 @@
 """API client utility for making HTTP requests."""
 
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Iterable
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from config.config import Config
 from utils.logger import get_logger
+from utils.response_cache import ResponseCache
 
 logger = get_logger(__name__)
 
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_STATUSES = {502, 503, 504}
+
+# Connect time of the connection opened by the current thread's request, if any
+_connect_timing = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTP connection that records how long connecting took."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_timing.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that records how long connecting (incl. TLS) took."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_timing.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled connections report their connect time."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def create_session(pool_size: int = None) -> requests.Session:
+    """Create a keep-alive session backed by a connection pool."""
+    pool_size = pool_size or Config.API_POOL_SIZE
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _HostRateLimiter:
+    """Spaces out request starts per host to a maximum rate."""
+
+    def __init__(self, rate_per_second: float = 0):
+        """Initialize limiter; a rate of 0 disables limiting."""
+        self.interval = 1.0 / rate_per_second if rate_per_second else 0.0
+        self._next_slot = {}
+
+    async def wait(self, host: str):
+        """Wait until the host's next start slot."""
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class APIClient:
     """Reusable API client for making HTTP requests."""
 
-    def __init__(self, base_url: str = None):
-        """Initialize API client with base URL."""
+    def __init__(
+        self,
+        base_url: str = None,
+        session: requests.Session = None,
+        cache: ResponseCache = None,
+    ):
+        """Initialize API client with base URL, optional shared session and GET cache."""
         self.base_url = base_url or Config.API_BASE_URL
         self.timeout = Config.API_TIMEOUT
+        self.retries = Config.API_RETRIES
+        self.backoff = Config.API_BACKOFF
+        self.session = session or create_session()
+        self.cache = cache
+        self.timings = []
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -22,66 +116,155 @@ class APIClient:
     def set_header(self, key: str, value: str):
         """Set custom header."""
         self.headers[key] = value
-        logger.info(f"Set header: {key}")
+        logger.info("Set header: %s", key)
 
     def set_authorization(self, token: str):
         """Set authorization token."""
         self.set_header("Authorization", f"Bearer {token}")
 
-    def get(self, endpoint: str, params: dict = None):
-        """Make GET request."""
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return a full-jitter exponential backoff delay for a retry attempt."""
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    def _request(self, method: str, endpoint: str, headers: dict = None, **kwargs):
+        """Send a request, retrying idempotent methods on transient failures."""
         url = f"{self.base_url}{endpoint}"
-        try:
-            response = requests.get(
-                url, headers=self.headers, params=params, timeout=self.timeout
-            )
-            logger.info(f"GET {url} - Status: {response.status_code}")
+        headers = {**self.headers, **(headers or {})}
+        attempts = 1 + (self.retries if method in IDEMPOTENT_METHODS else 0)
+        for attempt in range(attempts):
+            _connect_timing.seconds = 0.0
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, timeout=self.timeout, **kwargs
+                )
+            except requests.ConnectionError as e:
+                if attempt + 1 < attempts:
+                    delay = self._backoff_delay(attempt)
+                    logger.warning("%s %s failed (%s), retrying in %.2fs", method, url, e, delay)
+                    time.sleep(delay)
+                    continue
+                logger.error("%s request failed: %s", method, e)
+                return None
+            except requests.RequestException as e:
+                logger.error("%s request failed: %s", method, e)
+                return None
+
+            self.timings.append({
+                "method": method,
+                "url": url,
+                "status": response.status_code,
+                "attempt": attempt + 1,
+                "connect": _connect_timing.seconds,
+                "ttfb": response.elapsed.total_seconds(),
+                "total": time.perf_counter() - start,
+            })
+            if response.status_code in RETRY_STATUSES and attempt + 1 < attempts:
+                delay = self._backoff_delay(attempt)
+                logger.warning(
+                    "%s %s - Status: %s, retrying in %.2fs",
+                    method, url, response.status_code, delay,
+                )
+                response.close()
+                time.sleep(delay)
+                continue
+            logger.info("%s %s - Status: %s", method, url, response.status_code)
             return response
-        except requests.RequestException as e:
-            logger.error(f"GET request failed: {e}")
+
+    def get(self, endpoint: str, params: dict = None, use_cache: bool = True):
+        """Make GET request, served from the response cache when one is set."""
+        if self.cache is None or not use_cache:
+            return self._request("GET", endpoint, params=params)
+
+        key = self.cache.key(
+            f"{self.base_url}{endpoint}", params, self.headers.get("Authorization")
+        )
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.fresh:
+            self.cache.record_hit(entry)
+            logger.debug("GET %s - served from cache", endpoint)
+            return entry.response
+
+        validators = entry.validators if entry is not None else {}
+        response = self._request("GET", endpoint, headers=validators, params=params)
+        if response is None:
             return None
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, entry, response)
+            self.cache.record_hit(entry, revalidated=True)
+            return entry.response
+        self.cache.record_miss()
+        self.cache.store(key, response)
+        return response
 
     def post(self, endpoint: str, data: dict = None, json: dict = None):
         """Make POST request."""
-        url = f"{self.base_url}{endpoint}"
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                data=data,
-                json=json,
-                timeout=self.timeout,
-            )
-            logger.info(f"POST {url} - Status: {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"POST request failed: {e}")
-            return None
+        return self._request("POST", endpoint, data=data, json=json)
 
     def put(self, endpoint: str, data: dict = None, json: dict = None):
         """Make PUT request."""
-        url = f"{self.base_url}{endpoint}"
-        try:
-            response = requests.put(
-                url,
-                headers=self.headers,
-                data=data,
-                json=json,
-                timeout=self.timeout,
-            )
-            logger.info(f"PUT {url} - Status: {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"PUT request failed: {e}")
-            return None
+        return self._request("PUT", endpoint, data=data, json=json)
 
     def delete(self, endpoint: str):
         """Make DELETE request."""
-        url = f"{self.base_url}{endpoint}"
+        return self._request("DELETE", endpoint)
+
+    async def _run_spec(self, spec: dict, executor, limiter: _HostRateLimiter) -> dict:
+        """Run one batch request spec off the event loop and describe the outcome."""
+        method = spec.get("method", "GET").upper()
+        endpoint = spec["endpoint"]
+        kwargs = {k: spec[k] for k in ("params", "data", "json") if spec.get(k) is not None}
+        await limiter.wait(urlsplit(f"{self.base_url}{endpoint}").netloc)
+        start = time.perf_counter()
         try:
-            response = requests.delete(url, headers=self.headers, timeout=self.timeout)
-            logger.info(f"DELETE {url} - Status: {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"DELETE request failed: {e}")
-            return None
+            response = await asyncio.get_running_loop().run_in_executor(
+                executor, partial(self._request, method, endpoint, **kwargs)
+            )
+            error = None if response is not None else "request failed"
+        except Exception as e:
+            response, error = None, str(e)
+        return {
+            "spec": spec,
+            "response": response,
+            "error": error,
+            "elapsed": time.perf_counter() - start,
+        }
+
+    async def batch(
+        self,
+        specs: Iterable[dict],
+        concurrency: int = None,
+        rate_per_host: float = None,
+    ) -> AsyncIterator[dict]:
+        """Run many requests concurrently, yielding results as they finish.
+
+        Each spec is a dict with ``endpoint`` and optional ``method``,
+        ``params``, ``data`` and ``json``. Requests run on the pooled session
+        in worker threads, so the event loop is never blocked. A failed
+        request yields a result with ``error`` set instead of aborting the
+        batch.
+        """
+        concurrency = concurrency or Config.API_BATCH_CONCURRENCY
+        rate = Config.API_RATE_PER_HOST if rate_per_host is None else rate_per_host
+        limiter = _HostRateLimiter(rate)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="api-batch")
+        pending = set()
+        try:
+            for spec in specs:
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(self._run_spec(spec, executor, limiter)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
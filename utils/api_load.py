@@ -0,0 +1,277 @@
+"""Open-loop API load generator built on APIClient.
+
+Run with ``python -m utils.api_load --rate 50 --duration 60 --mix mix.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from config.config import Config
+from utils.api_client import APIClient, create_session
+from utils.load_report import write_report
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Weighted endpoint mix used when no mix file is given
+DEFAULT_MIX = [
+    {"name": "employees", "endpoint": "/api/v2/pim/employees", "weight": 5},
+    {"name": "job_titles", "endpoint": "/api/v2/admin/job-titles", "weight": 3},
+    {"name": "users", "endpoint": "/api/v2/admin/users", "weight": 2},
+]
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error.
+
+    Bucket ``i`` holds values in ``[GROWTH**i, GROWTH**(i+1))`` microseconds,
+    so percentiles are accurate to about 2% whatever the range, and memory
+    depends on the latency spread rather than the request count.
+    """
+
+    GROWTH = 1.02
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """Add one latency."""
+        index = int(math.log(max(seconds * 1e6, 1.0), self.GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, pct: float) -> float:
+        """Return the latency in seconds at a percentile (bucket upper bound)."""
+        if not self.count:
+            return 0.0
+        target = max(math.ceil(pct / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(self.GROWTH ** (index + 1) / 1e6, self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's counts to this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict:
+        """Export the histogram for comparison across runs."""
+        return {
+            "growth": self.GROWTH,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": {str(i): c for i, c in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """Load a histogram exported by ``to_dict``."""
+        if data.get("growth", cls.GROWTH) != cls.GROWTH:
+            raise ValueError(f"Histogram bucket growth {data['growth']} != {cls.GROWTH}")
+        histogram = cls()
+        histogram.buckets = {int(i): c for i, c in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"] if data["count"] else math.inf
+        histogram.max = data["max"]
+        return histogram
+
+
+class EndpointStats:
+    """Latency histogram and outcome counts for one endpoint of the mix."""
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.statuses = {}
+
+    def record(self, seconds: float, status, error: bool):
+        """Record one request outcome."""
+        self.histogram.record(seconds)
+        self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        if error:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> dict:
+        """Return rate, error rate and latency percentiles in milliseconds."""
+        h = self.histogram
+        return {
+            "count": h.count,
+            "rate": round(h.count / elapsed, 2) if elapsed else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / h.count, 4) if h.count else 0.0,
+            "statuses": self.statuses,
+            "mean_ms": round(h.total / h.count * 1000, 2) if h.count else 0.0,
+            **{
+                f"p{str(p).replace('.', '')}_ms": round(h.percentile(p) * 1000, 2)
+                for p in (50, 90, 99, 99.9)
+            },
+            "max_ms": round(h.max * 1000, 2),
+        }
+
+
+class APILoadGenerator:
+    """Sends requests at a fixed arrival rate regardless of response times.
+
+    Requests are scheduled on a fixed timeline and latency is measured from
+    each request's scheduled start, so time spent queued behind slow
+    requests counts against the server instead of being hidden
+    (no coordinated omission). Requests use the client's base URL,
+    headers (including authorization) and pooled session, without the
+    client's retries.
+    """
+
+    def __init__(self, client: APIClient, mix=None, rate: float = None,
+                 duration: float = None, max_in_flight: int = None):
+        """Initialize generator with settings defaulting to the config."""
+        self.client = client
+        self.mix = list(mix or DEFAULT_MIX)
+        self.weights = [spec.get("weight", 1) for spec in self.mix]
+        self.rate = Config.API_LOAD_RATE if rate is None else rate
+        self.duration = Config.API_LOAD_DURATION if duration is None else duration
+        self.max_in_flight = max_in_flight or Config.API_LOAD_MAX_IN_FLIGHT
+        self.stats = {self._name(spec): EndpointStats() for spec in self.mix}
+        self.elapsed = 0.0
+
+    @staticmethod
+    def _name(spec: dict) -> str:
+        """Return the report name of an endpoint spec."""
+        return spec.get("name") or f"{spec.get('method', 'GET').upper()} {spec['endpoint']}"
+
+    def _send(self, spec: dict):
+        """Send one request and return its status code."""
+        kwargs = {k: spec[k] for k in ("params", "data", "json") if spec.get(k) is not None}
+        response = self.client.session.request(
+            spec.get("method", "GET").upper(),
+            f"{self.client.base_url}{spec['endpoint']}",
+            headers=self.client.headers,
+            timeout=self.client.timeout,
+            **kwargs,
+        )
+        # Read the body so the connection goes back to the pool
+        response.content
+        return response.status_code
+
+    async def _fire(self, spec: dict, scheduled: float, executor):
+        """Run one request off the loop and record latency from its scheduled start."""
+        status, error = None, True
+        try:
+            status = await asyncio.get_running_loop().run_in_executor(
+                executor, partial(self._send, spec)
+            )
+            error = status >= 400
+        except Exception as e:
+            status = type(e).__name__
+        self.stats[self._name(spec)].record(time.perf_counter() - scheduled, status, error)
+
+    async def run(self) -> dict:
+        """Generate load for the configured duration and return the report."""
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="api-load")
+        total = int(self.rate * self.duration)
+        logger.info(
+            "Sending %s requests at %s/s to %s", total, self.rate, self.client.base_url
+        )
+        tasks = set()
+        started = time.perf_counter()
+        try:
+            for number in range(total):
+                scheduled = started + number / self.rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                spec = random.choices(self.mix, self.weights)[0]
+                task = asyncio.ensure_future(self._fire(spec, scheduled, executor))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.elapsed = time.perf_counter() - started
+        return self.report()
+
+    def report(self) -> dict:
+        """Return the per-endpoint summary and exported histograms."""
+        combined = EndpointStats()
+        for stats in self.stats.values():
+            combined.histogram.merge(stats.histogram)
+            combined.errors += stats.errors
+        return {
+            "settings": {
+                "base_url": self.client.base_url,
+                "rate": self.rate,
+                "duration": self.duration,
+                "max_in_flight": self.max_in_flight,
+                "mix": self.mix,
+            },
+            "elapsed": round(self.elapsed, 2),
+            "total": combined.summary(self.elapsed),
+            "endpoints": {name: s.summary(self.elapsed) for name, s in self.stats.items()},
+            "histograms": {name: s.histogram.to_dict() for name, s in self.stats.items()},
+        }
+
+
+def print_report(report: dict):
+    """Print the per-endpoint table."""
+    print(f"{'endpoint':<24}{'count':>8}{'rate':>8}{'err%':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}")
+    for name, s in [*report["endpoints"].items(), ("total", report["total"])]:
+        print(
+            f"{name:<24}{s['count']:>8}{s['rate']:>8.1f}{s['error_rate'] * 100:>7.2f}"
+            f"{s['p50_ms']:>9.1f}{s['p90_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['p999_ms']:>9.1f}{s['max_ms']:>9.1f}"
+        )
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Open-loop API load generator")
+    parser.add_argument("--rate", type=float, default=Config.API_LOAD_RATE,
+                        help="Requests per second.")
+    parser.add_argument("--duration", type=float, default=Config.API_LOAD_DURATION,
+                        help="Seconds to generate load for.")
+    parser.add_argument("--max-in-flight", type=int, default=Config.API_LOAD_MAX_IN_FLIGHT,
+                        help="Maximum concurrent requests.")
+    parser.add_argument("--mix", default=None,
+                        help="JSON file with a list of endpoint specs (endpoint, method, weight, ...).")
+    parser.add_argument("--token", default=None, help="Bearer token for the Authorization header.")
+    args = parser.parse_args(argv)
+
+    mix = json.loads(Path(args.mix).read_text()) if args.mix else None
+    client = APIClient(session=create_session(args.max_in_flight))
+    if args.token:
+        client.set_authorization(args.token)
+    try:
+        generator = APILoadGenerator(client, mix, args.rate, args.duration, args.max_in_flight)
+        report = asyncio.run(generator.run())
+    finally:
+        client.close()
+
+    print_report(report)
+    print(f"Report: {write_report(report, 'api_load')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Failure-only screenshot and trace capture with background writes."""
+
+from __future__ import annotations
+import os
+import re
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+from config.config import Config
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    # Annotations only, so conftest can create the artifact store without loading Playwright
+    from playwright.async_api import BrowserContext, Page
+
+logger = get_logger(__name__)
+
+
+def artifact_name(nodeid: str) -> str:
+    """Return a file-system safe artifact name for a test node id."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+
+
+class ArtifactStore:
+    """Writes artifacts on a background thread and caps their total size.
+
+    Writes are queued to a single worker thread so the event loop never
+    waits on compression or disk. After each write the oldest artifacts
+    are deleted until the directory fits in ``max_bytes``.
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = None):
+        """Initialize store under a directory with a size cap."""
+        self.root = Path(root or Config.ARTIFACT_DIR)
+        self.max_bytes = Config.ARTIFACT_MAX_BYTES if max_bytes is None else max_bytes
+        self.saved = []
+        self.evicted = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+
+    def _evict(self):
+        """Delete the oldest artifacts until the total size fits the cap."""
+        files = sorted(
+            (p for p in self.root.iterdir() if p.is_file()), key=lambda p: p.stat().st_mtime
+        )
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            self.evicted += 1
+            logger.info("Evicted artifact %s", path)
+
+    def _write_frames(self, path: Path, frames: list):
+        """Compress frames into a zip archive."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, data in frames:
+                archive.writestr(name, data)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _move(self, source: Path, path: Path):
+        """Move a file written elsewhere into the store."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        os.replace(source, path)
+        self._evict()
+
+    def save_frames(self, name: str, frames: list) -> Path:
+        """Queue (filename, bytes) frames to be zipped as ``<name>.zip``."""
+        path = self.root / f"{name}.zip"
+        self._executor.submit(self._write_frames, path, frames)
+        self.saved.append(path)
+        return path
+
+    def save_file(self, name: str, source: Path) -> Path:
+        """Queue a finished file (e.g. a trace) to be moved into the store."""
+        path = self.root / f"{name}{source.suffix}"
+        self._executor.submit(self._move, source, path)
+        self.saved.append(path)
+        return path
+
+    def close(self):
+        """Wait for queued writes to finish."""
+        self._executor.shutdown(wait=True)
+
+
+class PageLoadLog:
+    """Bounded log of the page loads in a context, kept for failure reports.
+
+    A load only appends its time and URL to a deque, so passing tests pay
+    next to nothing. Screenshots are taken once, after a test has failed.
+    """
+
+    def __init__(self, size: int = None):
+        """Initialize log keeping the last ``size`` page loads."""
+        self.size = Config.ARTIFACT_HISTORY if size is None else size
+        self.loads = deque(maxlen=self.size)
+        self._context = None
+        self._listeners = {}
+
+    def attach(self, context: BrowserContext):
+        """Log every load of every page in the context."""
+        self._context = context
+        context.on("page", self._watch)
+        for page in context.pages:
+            self._watch(page)
+
+    def _watch(self, page: Page):
+        """Log the page's URL whenever it finishes loading."""
+        def on_load(_):
+            self.loads.append((time.time(), page.url))
+
+        self._listeners[page] = on_load
+        page.on("load", on_load)
+
+    def detach(self):
+        """Remove the listeners so a pooled context stops logging."""
+        if self._context is not None:
+            self._context.remove_listener("page", self._watch)
+            self._context = None
+        for page, on_load in self._listeners.items():
+            page.remove_listener("load", on_load)
+        self._listeners.clear()
+
+    def text(self) -> bytes:
+        """Return the logged loads, one ``HH:MM:SS url`` line each."""
+        return "\n".join(
+            f"{time.strftime('%H:%M:%S', time.localtime(taken))} {url}" for taken, url in self.loads
+        ).encode()
+
+
+async def page_screenshots(pages) -> list:
+    """Return (filename, JPEG bytes) of the current state of each open page."""
+    frames = []
+    for index, page in enumerate(pages):
+        if page.is_closed():
+            continue
+        try:
+            frames.append((f"page_{index}.jpg", await page.screenshot(type="jpeg", quality=70)))
+        except Exception as e:
+            logger.debug("Failure screenshot of %s failed: %s", page.url, e)
+    return frames
+
+
+class FailureCapture:
+    """Keeps a trace or a page-load log for one test context.
+
+    ``ARTIFACT_MODE`` selects ``screenshots`` (a log of page loads while the
+    test runs, plus screenshots of the open pages if it fails), ``trace``
+    (Playwright trace with screenshots and DOM snapshots, which the driver
+    spools to its temp directory while recording) or ``off``. Passing tests
+    discard everything without writing to the store.
+    """
+
+    def __init__(self, context: BrowserContext, store: ArtifactStore, mode: str = None):
+        """Initialize capture for a context."""
+        self.context = context
+        self.store = store
+        self.mode = Config.ARTIFACT_MODE if mode is None else mode
+        self.log = None
+
+    async def start(self):
+        """Start tracing or logging page loads."""
+        if self.mode == "trace":
+            await self.context.tracing.start(screenshots=True, snapshots=True)
+        elif self.mode == "screenshots":
+            self.log = PageLoadLog()
+            self.log.attach(self.context)
+
+    async def finish(self, nodeid: str, failed: bool):
+        """Save artifacts for a failed test, discard them otherwise."""
+        name = artifact_name(nodeid)
+        if self.log is not None:
+            self.log.detach()
+        if self.mode == "trace":
+            if not failed:
+                await self.context.tracing.stop()
+                return None
+            # Outside the store's top level so eviction never sees a half-written trace
+            tmp_path = self.store.root / ".tmp" / f"{name}.zip"
+            tmp_path.parent.mkdir(parents=True, exist_ok=True)
+            await self.context.tracing.stop(path=tmp_path)
+            path = self.store.save_file(f"{name}.trace", tmp_path)
+        elif self.mode == "screenshots" and failed:
+            frames = await page_screenshots(self.context.pages)
+            frames.append(("loads.txt", self.log.text()))
+            path = self.store.save_frames(name, frames)
+        else:
+            return None
+        logger.info("Saving failure artifact %s", path)
+        return path
@@ -0,0 +1,99 @@
+"""Cache of authenticated Playwright storage state."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from playwright.async_api import Browser, BrowserContext, Page
+from config.config import Config
+from pages.login_page import LoginPage
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LOGIN_PATH = "/auth/login"
+
+
+class AuthStateCache:
+    """Logs in once per credential set and seeds new contexts from the saved state."""
+
+    def __init__(self, browser: Browser, cache_dir: str = None, ttl: int = None):
+        """Initialize cache for a browser, storing state files under cache_dir."""
+        self.browser = browser
+        self.cache_dir = Path(cache_dir or Config.AUTH_STATE_DIR)
+        self.ttl = Config.AUTH_STATE_TTL if ttl is None else ttl
+        self._states = {}
+
+    def _state_path(self, username: str) -> Path:
+        """Return the state file path for a user on the configured server."""
+        key = hashlib.sha1(f"{Config.BASE_URL}|{username}".encode()).hexdigest()[:16]
+        return self.cache_dir / f"{key}.json"
+
+    def _is_fresh(self, path: Path) -> bool:
+        """Check if a state file exists and has not expired."""
+        return path.exists() and time.time() - path.stat().st_mtime < self.ttl
+
+    def invalidate(self, username: str):
+        """Drop the cached state for a user."""
+        self._states.pop(username, None)
+        self._state_path(username).unlink(missing_ok=True)
+        logger.info("Invalidated cached auth state for %s", username)
+
+    async def get_state(self, username: str, password: str, refresh: bool = False) -> dict:
+        """Return storage state for a user, logging in through the UI if needed."""
+        path = self._state_path(username)
+        if not refresh and self._is_fresh(path):
+            if username not in self._states:
+                self._states[username] = json.loads(path.read_text())
+            return self._states[username]
+
+        state = await self._login(username, password)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, path)
+        self._states[username] = state
+        logger.info("Cached auth state for %s at %s", username, path)
+        return state
+
+    async def _login(self, username: str, password: str) -> dict:
+        """Log in through the UI in a throwaway context and capture its state."""
+        context = await self.browser.new_context()
+        try:
+            page = await context.new_page()
+            await page.goto(Config.BASE_URL)
+            await LoginPage(page).login(username, password)
+            if LOGIN_PATH in page.url:
+                raise RuntimeError(f"Login failed for {username}, still on {page.url}")
+            return await context.storage_state()
+        finally:
+            await context.close()
+
+    async def apply(self, context: BrowserContext, state: dict):
+        """Seed a context with cookies and local storage from a saved state."""
+        if state.get("cookies"):
+            await context.add_cookies(state["cookies"])
+        for origin in state.get("origins", []):
+            items = {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+            if items:
+                await context.add_init_script(
+                    f"if (location.origin === {json.dumps(origin['origin'])}) "
+                    f"for (const [k, v] of Object.entries({json.dumps(items)})) "
+                    "localStorage.setItem(k, v);"
+                )
+
+    async def authenticate(self, page: Page, username: str, password: str):
+        """Open the app on an authenticated page, re-logging in if the session expired."""
+        await self.apply(page.context, await self.get_state(username, password))
+        await page.goto(Config.BASE_URL)
+        if LOGIN_PATH not in page.url:
+            return
+
+        logger.info("Cached session for %s expired, logging in again", username)
+        self.invalidate(username)
+        await page.context.clear_cookies()
+        await self.apply(page.context, await self.get_state(username, password, refresh=True))
+        await page.goto(Config.BASE_URL)
+        if LOGIN_PATH in page.url:
+            raise RuntimeError(f"Authenticated session for {username} was rejected")
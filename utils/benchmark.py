@@ -0,0 +1,161 @@
+"""Page-load benchmarks compared against a stored baseline."""
+
+import json
+import os
+import statistics
+from pathlib import Path
+from typing import Awaitable, Callable
+from playwright.async_api import Page
+from config.config import Config
+from utils.logger import get_logger
+from utils.timing import percentile
+
+logger = get_logger(__name__)
+
+BASELINE_VERSION = 1
+METRICS = ("ttfb", "dcl", "load", "fcp", "lcp")
+
+# Navigation Timing and Paint Timing for the current document, in milliseconds.
+# LCP is only exposed through a buffered PerformanceObserver.
+PAGE_METRICS_SCRIPT = """
+async () => {
+    const [nav] = performance.getEntriesByType("navigation");
+    const fcp = performance.getEntriesByName("first-contentful-paint")[0];
+    const lcp = await new Promise((resolve) => {
+        if (!PerformanceObserver.supportedEntryTypes.includes("largest-contentful-paint")) {
+            resolve(null);
+            return;
+        }
+        new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            resolve(entries[entries.length - 1].startTime);
+        }).observe({type: "largest-contentful-paint", buffered: true});
+        setTimeout(() => resolve(null), 1000);
+    });
+    return {
+        ttfb: nav.responseStart,
+        dcl: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        fcp: fcp ? fcp.startTime : null,
+        lcp: lcp,
+    };
+}
+"""
+
+
+async def collect_page_metrics(page: Page) -> dict:
+    """Return TTFB, DOMContentLoaded, load, FCP and LCP for the current page."""
+    await page.wait_for_load_state("load")
+    return await page.evaluate(PAGE_METRICS_SCRIPT)
+
+
+def describe(samples) -> dict:
+    """Summarize metric samples: p50, p95 and standard deviation per metric."""
+    summary = {}
+    for metric in METRICS:
+        values = [s[metric] for s in samples if s.get(metric) is not None]
+        if not values:
+            continue
+        summary[metric] = {
+            "p50": round(statistics.median(values), 1),
+            "p95": round(percentile(values, 95), 1),
+            "stdev": round(statistics.stdev(values), 1) if len(values) > 1 else 0.0,
+            "samples": len(values),
+        }
+    return summary
+
+
+class PageLoadBenchmark:
+    """Measures page loads and compares their medians against a baseline file.
+
+    A metric regresses when its median exceeds the baseline median by more
+    than ``tolerance`` (relative) and by more than ``sigma`` baseline
+    standard deviations, so noisy metrics need a larger shift to fail.
+    """
+
+    def __init__(self, baseline_path: str = None, warmup: int = None, iterations: int = None,
+                 tolerance: float = None, sigma: float = None, results: dict = None):
+        """Initialize benchmark with settings defaulting to the config."""
+        self.baseline_path = Path(baseline_path or Config.BENCHMARK_BASELINE)
+        self.warmup = Config.BENCHMARK_WARMUP if warmup is None else warmup
+        self.iterations = Config.BENCHMARK_ITERATIONS if iterations is None else iterations
+        self.tolerance = Config.BENCHMARK_TOLERANCE if tolerance is None else tolerance
+        self.sigma = Config.BENCHMARK_SIGMA if sigma is None else sigma
+        self.baseline_problem = None
+        self.baseline = self._load_baseline()
+        self.results = {} if results is None else results
+
+    def _load_baseline(self) -> dict:
+        """Load baseline pages, ignoring files written by another format version."""
+        if not self.baseline_path.exists():
+            self.baseline_problem = f"baseline {self.baseline_path} does not exist"
+            return {}
+        try:
+            data = json.loads(self.baseline_path.read_text())
+        except (OSError, ValueError) as e:
+            self.baseline_problem = f"baseline {self.baseline_path} is unreadable ({e})"
+            return {}
+        if data.get("version") != BASELINE_VERSION:
+            self.baseline_problem = (
+                f"baseline {self.baseline_path} has version {data.get('version')} "
+                f"(expected {BASELINE_VERSION})"
+            )
+            return {}
+        return data.get("pages", {})
+
+    def missing_baseline(self, name: str):
+        """Return why a page cannot be compared with the baseline, or None if it can."""
+        if self.baseline_problem:
+            return self.baseline_problem
+        if not self.baseline.get(name):
+            return f"no baseline for {name} in {self.baseline_path}"
+        return None
+
+    async def measure(self, name: str, page: Page, load: Callable[[], Awaitable]) -> dict:
+        """Run warm-up and measured loads of a page and record their summary."""
+        for _ in range(self.warmup):
+            await load()
+        samples = []
+        for _ in range(self.iterations):
+            await load()
+            samples.append(await collect_page_metrics(page))
+        summary = describe(samples)
+        self.results[name] = summary
+        logger.info("Benchmark %s: %s", name, summary)
+        return summary
+
+    def regressions(self, name: str) -> list:
+        """Return a message for every metric of a page that regressed.
+
+        Raises ``LookupError`` when the page has no usable baseline, so a
+        missing baseline never passes as "no regressions".
+        """
+        problem = self.missing_baseline(name)
+        if problem:
+            raise LookupError(problem)
+        baseline = self.baseline[name]
+        messages = []
+        for metric, current in self.results.get(name, {}).items():
+            base = baseline.get(metric)
+            if not base:
+                continue
+            allowed = max(base["p50"] * self.tolerance, base["stdev"] * self.sigma)
+            if current["p50"] > base["p50"] + allowed:
+                messages.append(
+                    f"{name} {metric}: median {current['p50']:.0f}ms vs baseline "
+                    f"{base['p50']:.0f}ms (allowed +{allowed:.0f}ms)"
+                )
+        return messages
+
+    def save_baseline(self):
+        """Merge this run's results into the baseline file."""
+        pages = dict(self.baseline, **self.results)
+        self.baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.baseline_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": BASELINE_VERSION, "pages": pages}, indent=2, sort_keys=True) + "\n"
+        )
+        os.replace(tmp_path, self.baseline_path)
+        self.baseline = pages
+        self.baseline_problem = None
+        logger.info("Updated benchmark baseline %s", self.baseline_path)
@@ -0,0 +1,75 @@
+"""Pool of pre-warmed Playwright browser contexts."""
+
+import asyncio
+from playwright.async_api import Browser, BrowserContext
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BrowserContextPool:
+    """Warm pool of isolated BrowserContexts on a single shared browser.
+
+    Contexts are never handed out twice: a released context is closed and a
+    fresh one is created in the background, so every test starts with clean
+    cookies and storage while the creation cost is paid between tests.
+    """
+
+    def __init__(self, browser: Browser, size: int = 2, **context_options):
+        """Initialize pool for a browser with the given warm size."""
+        self.browser = browser
+        self.size = max(size, 0)
+        self.context_options = context_options
+        self._idle = []
+        self._refill_task = None
+        self._closed = False
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a new context with the pool's options."""
+        return await self.browser.new_context(**self.context_options)
+
+    async def fill(self):
+        """Create contexts until the pool holds its warm size."""
+        while not self._closed and len(self._idle) < self.size:
+            context = await self._new_context()
+            if self._closed:
+                await context.close()
+                return
+            self._idle.append(context)
+        logger.debug("Context pool filled: %s/%s", len(self._idle), self.size)
+
+    def _schedule_refill(self):
+        """Refill the pool in the background without blocking the caller."""
+        if self._closed or self.size == 0:
+            return
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.ensure_future(self.fill())
+
+    async def acquire(self) -> BrowserContext:
+        """Take a clean context from the pool, creating one if it is empty."""
+        if self._idle:
+            context = self._idle.pop()
+        else:
+            context = await self._new_context()
+        self._schedule_refill()
+        return context
+
+    async def release(self, context: BrowserContext):
+        """Dispose of a used context and top the pool back up."""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning("Failed to close browser context: %s", e)
+        self._schedule_refill()
+
+    async def close(self):
+        """Close all idle contexts and stop refilling."""
+        self._closed = True
+        if self._refill_task is not None and not self._refill_task.done():
+            try:
+                await self._refill_task
+            except Exception as e:
+                logger.warning("Context pool refill failed during close: %s", e)
+        while self._idle:
+            await self._idle.pop().close()
+        logger.info("Context pool closed")
@@ -1,87 +1,323 @@
 """Database utility for MySQL connections."""
 
+import re
+import threading
+from contextlib import contextmanager
 import mysql.connector
-from mysql.connector import Error
-import os
-from dotenv import load_dotenv
+from mysql.connector import Error, pooling
+from config.config import Config
 from utils.logger import get_logger
 
-load_dotenv()
 logger = get_logger(__name__)
 
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(host: str, port: int, user: str, password: str, database: str):
+    """Return the process-wide connection pool for a server, creating it on first use."""
+    key = (host, port, user, database)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = pooling.MySQLConnectionPool(
+                pool_name=f"orangehrm_{len(_pools)}",
+                pool_size=Config.DB_POOL_SIZE,
+                host=host,
+                port=port,
+                user=user,
+                password=password,
+                database=database,
+                connection_timeout=5,
+            )
+            logger.info(
+                "Created MySQL pool of %s for %s:%s/%s", Config.DB_POOL_SIZE, host, port, database
+            )
+        return _pools[key]
+
+
+def close_pools():
+    """Close every pooled connection.
+
+    MySQLConnectionPool has no public close; ``_remove_connections`` is the
+    connector's own way of closing idle pooled connections. It is private
+    API, which is why requirements.txt pins mysql-connector-python exactly.
+    """
+    with _pools_lock:
+        for pool in _pools.values():
+            pool._remove_connections()
+        _pools.clear()
+
 
 class DatabaseConnection:
     """Database connection handler for MySQL."""
 
     def __init__(self):
-        """Initialize database connection parameters from environment."""
-        self.host = os.getenv("MYSQL_HOST", "127.0.0.1")
-        self.port = int(os.getenv("MYSQL_PORT", 3306))
-        self.user = os.getenv("MYSQL_USER", "root")
-        self.password = os.getenv("MYSQL_PASSWORD", "")
-        self.database = os.getenv("MYSQL_DATABASE", "orangehrm")
+        """Initialize database connection parameters from the configuration."""
+        self.host = Config.MYSQL_HOST
+        self.port = Config.MYSQL_PORT
+        self.user = Config.MYSQL_USER
+        self.password = Config.MYSQL_PASSWORD
+        self.database = Config.MYSQL_DATABASE
         self.conn = None
+        self.in_transaction = False
+        self._savepoints = 0
 
     def connect(self):
-        """Establish database connection."""
+        """Check out a healthy connection from the pool."""
         try:
             logger.info(
-                f"Attempting MySQL connection to {self.host}:{self.port}/{self.database}"
+                "Attempting MySQL connection to %s:%s/%s", self.host, self.port, self.database
             )
-            self.conn = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                connection_timeout=5,
-            )
-            logger.info(f"Connected to MySQL: {self.host}:{self.port}/{self.database}")
+            pool = get_pool(self.host, self.port, self.user, self.password, self.database)
+            self.conn = pool.get_connection()
+            # Pooled connections may have been dropped by the server (wait_timeout)
+            self.conn.ping(reconnect=True, attempts=2, delay=0)
+            logger.info("Connected to MySQL: %s:%s/%s", self.host, self.port, self.database)
             return self.conn
         except Error as e:
-            logger.error(f"Error connecting to MySQL: {e}")
+            logger.error("Error connecting to MySQL: %s", e)
+            self.conn = None
             return None
 
     def disconnect(self):
-        """Close database connection."""
+        """Return the connection to the pool, rolling back any open transaction."""
         if self.conn:
-            self.conn.close()
+            if self.in_transaction:
+                self.rollback()
+            try:
+                self.conn.close()
+            except Error as e:
+                logger.warning("Error returning connection to pool: %s", e)
+            self.conn = None
             logger.info("Disconnected from MySQL")
 
-    def execute_query(self, query: str):
-        """Execute a modification query (INSERT/UPDATE/DELETE)."""
+    def _reconnect_if_lost(self, error: Error) -> bool:
+        """Re-establish a dropped connection; only safe outside a transaction."""
+        if self.in_transaction or error.errno not in (2006, 2013, 2055):
+            return False
+        logger.warning("MySQL connection lost (%s), reconnecting", error)
+        try:
+            self.conn.reconnect(attempts=2, delay=0)
+            return True
+        except Error as e:
+            logger.error("Reconnect failed: %s", e)
+            return False
+
+    def begin(self):
+        """Start a transaction; queries are no longer committed until it ends."""
+        self.conn.start_transaction()
+        self.in_transaction = True
+        self._savepoints = 0
+
+    def rollback(self):
+        """Roll back the current transaction."""
+        try:
+            self.conn.rollback()
+        except Error as e:
+            logger.error("Error rolling back: %s", e)
+        self.in_transaction = False
+
+    @contextmanager
+    def savepoint(self):
+        """Run a block inside a savepoint that is rolled back if the block fails."""
+        self._savepoints += 1
+        name = f"sp_{self._savepoints}"
+        cursor = self.conn.cursor()
+        cursor.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        else:
+            cursor.execute(f"RELEASE SAVEPOINT {name}")
+        finally:
+            cursor.close()
+
+    def _with_reconnect(self, operation):
+        """Run a cursor operation, retrying once if the connection was dropped."""
         try:
+            return operation()
+        except Error as e:
+            if not self._reconnect_if_lost(e):
+                raise
+            return operation()
+
+    def execute_query(self, query: str, params=None):
+        """Execute a modification query (INSERT/UPDATE/DELETE) with bound parameters.
+
+        Commits immediately unless a transaction was started with begin().
+        """
+        def run():
             cursor = self.conn.cursor()
-            cursor.execute(query)
-            self.conn.commit()
-            logger.info(f"Query executed successfully: {query[:50]}...")
+            cursor.execute(query, params)
+            rowcount = cursor.rowcount
+            if not self.in_transaction:
+                self.conn.commit()
             cursor.close()
+            return rowcount
+
+        try:
+            rowcount = self._with_reconnect(run)
+            logger.info("Query executed successfully: %s...", query[:50])
+            return rowcount
         except Error as e:
-            logger.error(f"Error executing query: {e}")
-            self.conn.rollback()
+            logger.error("Error executing query: %s", e)
+            if not self.in_transaction:
+                self.conn.rollback()
+            return None
 
-    def fetch_query(self, query: str):
-        """Execute a SELECT query and return results."""
+    def execute_many(self, query: str, rows, batch_size: int = None):
+        """Execute a query for many parameter rows in multi-row batches.
+
+        INSERT statements are rewritten by the driver into one multi-row
+        INSERT per batch, so each batch costs a single round trip.
+        """
+        batch_size = batch_size or Config.DB_BATCH_SIZE
+        total = 0
+        batch = []
         try:
             cursor = self.conn.cursor()
-            cursor.execute(query)
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    cursor.executemany(query, batch)
+                    total += cursor.rowcount
+                    batch = []
+            if batch:
+                cursor.executemany(query, batch)
+                total += cursor.rowcount
+            if not self.in_transaction:
+                self.conn.commit()
+            cursor.close()
+            logger.info("Bulk query affected %s rows: %s...", total, query[:50])
+            return total
+        except Error as e:
+            logger.error("Error executing bulk query: %s", e)
+            if not self.in_transaction:
+                self.conn.rollback()
+            return None
+
+    def bulk_insert(self, table: str, columns: list, rows, batch_size: int = None):
+        """Insert many rows into a table using multi-row INSERT batches."""
+        for name in [table, *columns]:
+            if not _IDENTIFIER.match(name):
+                raise ValueError(f"Invalid SQL identifier: {name!r}")
+        column_list = ", ".join(f"`{c}`" for c in columns)
+        placeholders = ", ".join(["%s"] * len(columns))
+        query = f"INSERT INTO `{table}` ({column_list}) VALUES ({placeholders})"
+        return self.execute_many(query, rows, batch_size=batch_size)
+
+    def fetch_query(self, query: str, params=None):
+        """Execute a SELECT query and return results."""
+        def run():
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
             results = cursor.fetchall()
-            logger.info(f"Query fetched successfully: {query[:50]}...")
             cursor.close()
             return results
+
+        try:
+            results = self._with_reconnect(run)
+            logger.info("Query fetched successfully: %s...", query[:50])
+            return results
         except Error as e:
-            logger.error(f"Error fetching query: {e}")
+            logger.error("Error fetching query: %s", e)
             return None
 
-    def fetch_one(self, query: str):
-        """Execute a SELECT query and return first result."""
+    def stream_query(self, query: str, params=None, chunk_size: int = None):
+        """Execute a SELECT query and yield its rows in chunks.
+
+        Uses an unbuffered cursor so rows are pulled from the server as the
+        caller consumes them and memory stays flat regardless of table size.
+        The connection cannot run other queries until the generator is
+        exhausted or closed. Closing it early kills the query on the server
+        instead of reading the rest of the result set.
+        """
+        chunk_size = chunk_size or Config.DB_FETCH_CHUNK_SIZE
+        cursor = self.conn.cursor(buffered=False)
+        exhausted = False
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(query)
+            cursor.execute(query, params)
+            logger.info("Streaming query: %s...", query[:50])
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    exhausted = True
+                    break
+                yield rows
+        finally:
+            if not exhausted:
+                self._abandon_stream(cursor, chunk_size)
+            cursor.close()
+
+    def _kill_query(self) -> bool:
+        """Kill the statement running on this connection from a side connection."""
+        try:
+            killer = mysql.connector.connect(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                connection_timeout=5,
+            )
+        except Error as e:
+            logger.warning("Cannot open a connection to kill the streaming query: %s", e)
+            return False
+        try:
+            cursor = killer.cursor()
+            cursor.execute(f"KILL QUERY {int(self.conn.connection_id)}")
+            cursor.close()
+            return True
+        except Error as e:
+            logger.warning("Cannot kill the streaming query: %s", e)
+            return False
+        finally:
+            killer.close()
+
+    def _abandon_stream(self, cursor, chunk_size: int):
+        """Stop an unfinished streaming query and leave the connection usable.
+
+        The query is killed on the server, so only the rows already in
+        flight are read before the interruption error; the connection and
+        its transaction survive. If the kill cannot be sent, the remaining
+        rows are drained instead.
+        """
+        killed = self._kill_query()
+        try:
+            while cursor.fetchmany(chunk_size):
+                pass
+        except Error:
+            pass
+        if not killed:
+            return
+        # A kill that landed after the result was complete would interrupt
+        # the next statement instead; absorb it here
+        probe = self.conn.cursor(buffered=True)
+        try:
+            probe.execute("SELECT 1")
+            probe.fetchall()
+        except Error as e:
+            if e.errno != 1317:
+                raise
+        finally:
+            probe.close()
+        logger.info("Killed unfinished streaming query on connection %s", self.conn.connection_id)
+
+    def fetch_one(self, query: str, params=None):
+        """Execute a SELECT query and return first result."""
+        def run():
+            cursor = self.conn.cursor(buffered=True)
+            cursor.execute(query, params)
             result = cursor.fetchone()
-            logger.info(f"Query fetched one record: {query[:50]}...")
             cursor.close()
             return result
+
+        try:
+            result = self._with_reconnect(run)
+            logger.info("Query fetched one record: %s...", query[:50])
+            return result
         except Error as e:
-            logger.error(f"Error fetching query: {e}")
+            logger.error("Error fetching query: %s", e)
             return None
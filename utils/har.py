@@ -0,0 +1,131 @@
+"""HAR record and replay for offline UI runs."""
+
+import base64
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from playwright.async_api import BrowserContext, Route
+from config.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Hop-by-hop or encoding headers that no longer apply to a decoded body
+SKIPPED_RESPONSE_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+
+def har_path(nodeid: str) -> Path:
+    """Return the HAR file path for a test node id."""
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+    return Path(Config.HAR_DIR) / f"{name}.har"
+
+
+def normalize_url(url: str) -> str:
+    """Normalize URL by sorting query parameters and dropping the fragment."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def origin(url: str) -> str:
+    """Return the scheme and host of a URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def rebase_url(url: str, old_origin: str, new_origin: str) -> str:
+    """Move a URL on old_origin to new_origin; other URLs are returned unchanged."""
+    if old_origin != new_origin and origin(url) == old_origin:
+        return new_origin + url[len(old_origin):]
+    return url
+
+
+def normalize_body(body: str, ignore_fields=()) -> str:
+    """Normalize request body: sorted JSON or form fields, minus volatile fields."""
+    if not body:
+        return ""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        pairs = parse_qsl(body, keep_blank_values=True)
+        if not pairs:
+            return body
+        return urlencode(sorted(p for p in pairs if p[0] not in ignore_fields))
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in ignore_fields}
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+async def record_har(context: BrowserContext, path: Path):
+    """Record all context traffic into a HAR file written when the context closes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    await context.route_from_har(path, update=True, update_content="embed", update_mode="minimal")
+    logger.info("Recording HAR to %s", path)
+
+
+class HarReplayer:
+    """Serves context traffic from a recorded HAR without touching the network.
+
+    Requests are matched by method, normalized URL and normalized body.
+    Repeated requests are answered in recorded order, reusing the last
+    response once the recording runs out. Anything else is aborted and
+    reported in ``unmatched``.
+
+    The recorded app origin is that of the first entry (the test's first
+    navigation to ``BASE_URL``). Requests to the current ``BASE_URL``
+    origin are matched against the recorded origin and recorded redirects
+    to it are rewritten, so a HAR replays against another host.
+    """
+
+    def __init__(self, path: Path, ignore_fields=None, base_url: str = None):
+        """Initialize replayer from a HAR file."""
+        self.path = Path(path)
+        self.ignore_fields = set(Config.HAR_IGNORE_FIELDS if ignore_fields is None else ignore_fields)
+        self.unmatched = []
+        self._entries = defaultdict(list)
+        har = json.loads(self.path.read_text())
+        self.origin = origin(base_url or Config.BASE_URL)
+        entries = har["log"]["entries"]
+        self.recorded_origin = origin(entries[0]["request"]["url"]) if entries else self.origin
+        for entry in entries:
+            request = entry["request"]
+            body = (request.get("postData") or {}).get("text", "")
+            self._entries[self._key(request["method"], request["url"], body)].append(entry)
+
+    def _key(self, method: str, url: str, body: str) -> tuple:
+        """Build the lookup key for a request."""
+        return method.upper(), normalize_url(url), normalize_body(body, self.ignore_fields)
+
+    async def _handle(self, route: Route):
+        """Fulfill a request from the HAR or abort it."""
+        request = route.request
+        url = rebase_url(request.url, self.origin, self.recorded_origin)
+        entries = self._entries.get(self._key(request.method, url, request.post_data))
+        if not entries:
+            self.unmatched.append(f"{request.method} {request.url}")
+            logger.warning("HAR replay miss: %s %s", request.method, request.url)
+            await route.abort("internetdisconnected")
+            return
+
+        entry = entries.pop(0) if len(entries) > 1 else entries[0]
+        response = entry["response"]
+        content = response.get("content", {})
+        body = content.get("text", "")
+        if content.get("encoding") == "base64":
+            body = base64.b64decode(body)
+        headers = {}
+        for header in response.get("headers", []):
+            name = header["name"].lower()
+            if name in SKIPPED_RESPONSE_HEADERS:
+                continue
+            headers[name] = f"{headers[name]}\n{header['value']}" if name in headers else header["value"]
+        if "location" in headers:
+            headers["location"] = rebase_url(headers["location"], self.recorded_origin, self.origin)
+        await route.fulfill(status=response["status"], headers=headers, body=body)
+
+    async def install(self, context: BrowserContext):
+        """Route all context traffic through the replayer."""
+        await context.route("**/*", self._handle)
+        logger.info("Replaying HAR from %s", self.path)
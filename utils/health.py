@@ -0,0 +1,126 @@
+"""Health probes and circuit breakers for the systems the tests depend on."""
+
+import time
+from functools import partial
+from config.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def probe_http(url: str, timeout: float = None):
+    """Return None if the URL answers with a non-5xx status, else the reason."""
+    # Imported here so loading the health plugin stays cheap
+    import requests
+
+    timeout = Config.HEALTH_TIMEOUT if timeout is None else timeout
+    try:
+        response = requests.get(url, timeout=timeout, allow_redirects=False, stream=True)
+    except requests.RequestException as e:
+        return f"{url} unreachable ({e.__class__.__name__})"
+    response.close()
+    if response.status_code >= 500:
+        return f"{url} returned HTTP {response.status_code}"
+    return None
+
+
+def probe_mysql(host: str, port: int, user: str, password: str, database: str,
+                timeout: float = None):
+    """Return None if a MySQL connection can be opened, else the reason."""
+    # Imported here so runs without database tests never load the driver
+    import mysql.connector
+
+    timeout = Config.HEALTH_TIMEOUT if timeout is None else timeout
+    try:
+        conn = mysql.connector.connect(
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            database=database,
+            connection_timeout=max(1, round(timeout)),
+        )
+    except mysql.connector.Error as e:
+        return f"MySQL {host}:{port}/{database} unavailable ({e})"
+    conn.close()
+    return None
+
+
+class CircuitBreaker:
+    """Guards one dependency with a probe that is run lazily and rarely.
+
+    The first ``check`` runs the probe. While the dependency is healthy
+    later checks cost nothing. Once a probe fails (or ``trip`` is called)
+    the breaker is open: checks return the failure reason immediately and
+    the probe is only retried after ``retry_interval`` seconds, closing
+    the breaker again when the dependency is back.
+    """
+
+    def __init__(self, name: str, probe, retry_interval: float = None, clock=time.monotonic):
+        """Initialize breaker for a probe returning None or a failure reason."""
+        self.name = name
+        self.probe = probe
+        self.retry_interval = (
+            Config.HEALTH_RETRY_INTERVAL if retry_interval is None else retry_interval
+        )
+        self.clock = clock
+        self.reason = None
+        self.checked_at = None
+        self.probes = 0
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while the dependency is considered down."""
+        return self.reason is not None
+
+    def check(self):
+        """Return None if the dependency may be used, else why it is down."""
+        due = self.checked_at is None or (
+            self.is_open and self.clock() - self.checked_at >= self.retry_interval
+        )
+        if due:
+            self._probe()
+        if self.is_open:
+            self.rejected += 1
+        return self.reason
+
+    def _probe(self):
+        """Run the probe and open or close the breaker on its result."""
+        self.probes += 1
+        start = time.perf_counter()
+        try:
+            reason = self.probe()
+        except Exception as e:
+            reason = f"probe failed ({e.__class__.__name__}: {e})"
+        self.checked_at = self.clock()
+        if reason:
+            self.trip(reason)
+        elif self.is_open:
+            logger.info("%s is back, closing circuit", self.name)
+            self.reason = None
+        logger.debug("Probed %s in %.2fs: %s", self.name, time.perf_counter() - start, reason or "ok")
+
+    def trip(self, reason: str):
+        """Open the breaker, e.g. when a fixture saw the dependency fail."""
+        if not self.is_open:
+            self.trips += 1
+            logger.warning("%s is down, opening circuit: %s", self.name, reason)
+        self.reason = reason
+        self.checked_at = self.clock()
+
+
+def default_breakers() -> dict:
+    """Return breakers for the web target, the API and MySQL."""
+    return {
+        "target": CircuitBreaker("target", partial(probe_http, Config.BASE_URL)),
+        "api": CircuitBreaker("api", partial(probe_http, Config.API_BASE_URL)),
+        "mysql": CircuitBreaker("mysql", partial(
+            probe_mysql, Config.MYSQL_HOST, Config.MYSQL_PORT, Config.MYSQL_USER,
+            Config.MYSQL_PASSWORD, Config.MYSQL_DATABASE,
+        )),
+    }
+
+
+breakers = default_breakers()
@@ -0,0 +1,14 @@
+"""Load test reports shared by the UI and API load generators."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from config.config import Config
+
+
+def write_report(report: dict, prefix: str) -> Path:
+    """Write a load test report as ``<prefix>_<timestamp>.json`` under LOAD_REPORT_DIR."""
+    path = Path(Config.LOAD_REPORT_DIR) / f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    return path
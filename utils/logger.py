@@ -1,16 +1,28 @@
 """Logger configuration for the test suite."""
 
+import atexit
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from config.config import Config
+
+LOG_DIR = "reports/logs"
+# Project packages whose loggers follow LOG_LEVEL; third-party loggers stay at WARNING
+PROJECT_LOGGERS = ("config", "pages", "plugins", "tests", "utils")
+
+_listener = None
+_lock = threading.Lock()
 
 
 def _cleanup_old_logs(log_dir: str, max_logs: int = 5):
     """Remove old log files, keeping only the most recent ones."""
     log_path = Path(log_dir)
     log_files = sorted(log_path.glob("test_*.log"), key=lambda f: f.stat().st_mtime)
-    
+
     # Delete oldest logs if we exceed the limit
     if len(log_files) >= max_logs:
         for old_log in log_files[:-max_logs + 1]:  # Keep space for the new log
@@ -20,37 +32,77 @@ def _cleanup_old_logs(log_dir: str, max_logs: int = 5):
                 print(f"Warning: Could not delete old log {old_log}: {e}")
 
 
+class _DeferredFormatQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record):
+        # The queue is in-process, so the record can be passed as is
+        return record
+
+
+def configure_logging():
+    """Set up the shared logging pipeline once per process.
+
+    Records are put on a queue and formatted and written by a background
+    thread, so logging never blocks on disk or console I/O. Old log files
+    are rotated here, once, not on every import. Parallel workers write
+    their own file and leave rotation to the controller.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return
+
+        worker_id = Config.WORKER_ID
+        level = getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO)
+        os.makedirs(LOG_DIR, exist_ok=True)
+        if not worker_id:
+            _cleanup_old_logs(LOG_DIR, max_logs=Config.LOG_KEEP)
+
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+        # File handler
+        suffix = f"_{worker_id}" if worker_id else ""
+        log_file = os.path.join(
+            LOG_DIR, f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}.log"
+        )
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        logging.getLogger().addHandler(_DeferredFormatQueueHandler(log_queue))
+        for name in PROJECT_LOGGERS:
+            logging.getLogger(name).setLevel(level)
+
+        _listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer."""
+    global _listener
+    with _lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 def get_logger(name: str):
-    """Configure and return logger instance."""
-    
-    # Create logs directory if it doesn't exist
-    log_dir = "reports/logs"
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Cleanup old logs, keeping only the last 5
-    _cleanup_old_logs(log_dir, max_logs=5)
-
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-
-    # Create formatters
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
-    # File handler
-    log_file = os.path.join(log_dir, f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    return logger
+    """Return a logger attached to the shared pipeline."""
+    configure_logging()
+    return logging.getLogger(name)
@@ -0,0 +1,86 @@
+"""Request interception that blocks resources UI tests don't need."""
+
+from __future__ import annotations
+from collections import Counter
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    # Annotations only, so conftest can build the run-wide stats without loading Playwright
+    from playwright.async_api import BrowserContext, Request, Response, Route
+
+logger = get_logger(__name__)
+
+
+class BlockingStats:
+    """Counters of blocked and allowed requests across a run.
+
+    Blocked requests never get a response, so their size is unknown and
+    only their count is reported.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.blocked = 0
+        self.allowed = 0
+        self.allowed_bytes = 0
+        self.blocked_by_type = Counter()
+
+    def record_blocked(self, request: Request):
+        """Count a blocked request by resource type."""
+        self.blocked += 1
+        self.blocked_by_type[request.resource_type] += 1
+
+    def record_response(self, response: Response):
+        """Count an allowed response and its declared size."""
+        self.allowed += 1
+        self.allowed_bytes += int(response.headers.get("content-length", 0) or 0)
+
+    def summary_lines(self) -> list:
+        """Return human readable summary lines."""
+        by_type = ", ".join(f"{t}={n}" for t, n in self.blocked_by_type.most_common())
+        return [
+            f"blocked requests: {self.blocked} ({by_type or 'none'})",
+            f"allowed requests: {self.allowed} ({self.allowed_bytes / 1024:.1f} KiB)",
+        ]
+
+
+class ResourceBlocker:
+    """Aborts requests by resource type or URL glob on a browser context."""
+
+    def __init__(self, resource_types=(), url_patterns=(), stats: BlockingStats = None):
+        """Initialize blocker with resource types and URL globs to abort."""
+        self.resource_types = {t.strip() for t in resource_types if t.strip()}
+        self.url_patterns = [p.strip() for p in url_patterns if p.strip()]
+        self.stats = stats or BlockingStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if anything is blocked."""
+        return bool(self.resource_types or self.url_patterns)
+
+    def should_block(self, request: Request) -> bool:
+        """Check if a request matches the block lists."""
+        if request.resource_type in self.resource_types:
+            return True
+        return any(fnmatch(request.url, pattern) for pattern in self.url_patterns)
+
+    async def _handle(self, route: Route):
+        """Abort blocked requests and pass everything else to the next handler."""
+        if self.should_block(route.request):
+            self.stats.record_blocked(route.request)
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+    async def install(self, context: BrowserContext):
+        """Install the interception layer on a context."""
+        context.on("response", self.stats.record_response)
+        if not self.enabled:
+            return
+        await context.route("**/*", self._handle)
+        logger.debug(
+            "Blocking resource types %s and URLs %s",
+            sorted(self.resource_types), self.url_patterns,
+        )
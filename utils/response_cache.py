@@ -0,0 +1,150 @@
+"""LRU cache for API GET responses with conditional revalidation."""
+
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+from config.config import Config
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    # Annotations only, so conftest can create the run-wide cache without loading requests
+    import requests
+
+logger = get_logger(__name__)
+
+
+class _CacheEntry:
+    """Cached response with its size, expiry and validators."""
+
+    __slots__ = ("response", "size", "expires_at", "etag", "last_modified")
+
+    def __init__(self, response: requests.Response, ttl: float):
+        """Initialize entry for a response that stays fresh for ttl seconds."""
+        self.response = response
+        self.size = len(response.content)
+        self.expires_at = time.monotonic() + ttl
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    @property
+    def fresh(self) -> bool:
+        """Return True while the entry may be served without revalidation."""
+        return time.monotonic() < self.expires_at
+
+    @property
+    def validators(self) -> dict:
+        """Return the conditional request headers for revalidating the entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Bounded LRU cache of GET responses keyed by URL, params and auth header."""
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None, default_ttl: float = None):
+        """Initialize cache limits and the TTL used when the server sends no max-age."""
+        self.max_entries = max_entries or Config.API_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or Config.API_CACHE_MAX_BYTES
+        self.default_ttl = Config.API_CACHE_TTL if default_ttl is None else default_ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def key(url: str, params: dict = None, authorization: str = None) -> tuple:
+        """Build the cache key for a request."""
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return url, query, authorization or ""
+
+    def _ttl(self, response: requests.Response):
+        """Return TTL from Cache-Control, or None if the response must not be stored."""
+        directives = {}
+        for part in response.headers.get("Cache-Control", "").lower().split(","):
+            name, _, value = part.strip().partition("=")
+            directives[name] = value
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0
+        if directives.get("max-age", "").isdigit():
+            return int(directives["max-age"])
+        return self.default_ttl
+
+    def lookup(self, key: tuple):
+        """Return the entry for a key (fresh or stale) and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def record_hit(self, entry: _CacheEntry, revalidated: bool = False):
+        """Count a response served from the cache."""
+        with self._lock:
+            if revalidated:
+                self.revalidations += 1
+            else:
+                self.hits += 1
+            self.bytes_saved += entry.size
+
+    def record_miss(self):
+        """Count a response fetched in full."""
+        with self._lock:
+            self.misses += 1
+
+    def refresh(self, key: tuple, entry: _CacheEntry, response: requests.Response):
+        """Extend an entry's lifetime after a 304 Not Modified, or drop it on no-store."""
+        ttl = self._ttl(response)
+        if ttl is not None:
+            entry.expires_at = time.monotonic() + ttl
+            return
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                self._bytes -= entry.size
+
+    def store(self, key: tuple, response: requests.Response):
+        """Store a 200 response if it is cacheable, evicting least recently used entries."""
+        ttl = self._ttl(response)
+        if response.status_code != 200 or ttl is None:
+            return
+        entry = _CacheEntry(response, ttl)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "bytes_saved": self.bytes_saved,
+        }
@@ -0,0 +1,197 @@
+"""Compact JSONL test results store with run history and trend queries.
+
+Query it with ``python -m utils.results_store slowest|slower|allure``.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from config.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResultsWriter:
+    """Appends one compact JSON line per finished test to a process file."""
+
+    def __init__(self, path: Path):
+        """Initialize writer for a JSONL file, opened on first write."""
+        self.path = Path(path)
+        self._file = None
+
+    def write(self, record: dict):
+        """Append a record and flush it so a crashed run keeps its results."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", buffering=1)
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def close(self):
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ResultsStore:
+    """Run history in one JSONL file, fed by per-process files of each run."""
+
+    def __init__(self, root: str = None, keep_runs: int = None):
+        """Initialize store under a directory."""
+        self.root = Path(root or Config.RESULTS_DIR)
+        self.keep_runs = Config.RESULTS_KEEP_RUNS if keep_runs is None else keep_runs
+        self.history = self.root / "history.jsonl"
+
+    def run_dir(self, run_id: str) -> Path:
+        """Return the directory holding a run's per-process files."""
+        return self.root / "runs" / run_id
+
+    def merge(self, run_id: str) -> int:
+        """Append a run's per-process files to the history and prune old runs."""
+        run_dir = self.run_dir(run_id)
+        if not run_dir.exists():
+            return 0
+        count = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.history, "a") as history:
+            for part in sorted(run_dir.glob("*.jsonl")):
+                with open(part) as lines:
+                    for line in lines:
+                        if line.strip():
+                            history.write(line if line.endswith("\n") else line + "\n")
+                            count += 1
+                part.unlink()
+        run_dir.rmdir()
+        self._prune()
+        logger.info("Merged %s results of run %s into %s", count, run_id, self.history)
+        return count
+
+    def records(self):
+        """Yield every stored result, oldest run first."""
+        if not self.history.exists():
+            return
+        with open(self.history) as lines:
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+
+    def runs(self) -> list:
+        """Return run ids in the order they were merged."""
+        return list(dict.fromkeys(r["run"] for r in self.records()))
+
+    def _prune(self):
+        """Drop the oldest runs beyond ``keep_runs``."""
+        runs = self.runs()
+        if len(runs) <= self.keep_runs:
+            return
+        keep = set(runs[-self.keep_runs:])
+        tmp_path = self.history.with_suffix(".tmp")
+        with open(self.history) as lines, open(tmp_path, "w") as out:
+            for line in lines:
+                if line.strip() and json.loads(line)["run"] in keep:
+                    out.write(line)
+        os.replace(tmp_path, self.history)
+
+    def _durations(self, last_runs: int) -> dict:
+        """Return each test's durations over the last runs, oldest first."""
+        runs = set(self.runs()[-last_runs:])
+        durations = defaultdict(list)
+        for record in self.records():
+            if record["run"] in runs and record["outcome"] == "passed":
+                durations[record["id"]].append(record["duration"])
+        return durations
+
+    def slowest(self, last_runs: int = 10, top: int = 20) -> list:
+        """Return (test id, median duration, runs) for the slowest tests."""
+        rows = [
+            (nodeid, statistics.median(values), len(values))
+            for nodeid, values in self._durations(last_runs).items()
+        ]
+        return sorted(rows, key=lambda r: r[1], reverse=True)[:top]
+
+    def getting_slower(self, last_runs: int = 10, min_increase: float = 0.2,
+                       min_seconds: float = 0.1) -> list:
+        """Return (test id, first fit, last fit, increase) for tests trending slower.
+
+        A least-squares line is fitted through each test's durations; tests
+        whose fitted duration grew by more than ``min_increase`` over the
+        window are reported, worst first. Tests faster than ``min_seconds``
+        are ignored as noise.
+        """
+        rows = []
+        for nodeid, values in self._durations(last_runs).items():
+            if len(values) < 3 or statistics.median(values) < min_seconds:
+                continue
+            slope, intercept = statistics.linear_regression(range(len(values)), values)
+            first, last = intercept, intercept + slope * (len(values) - 1)
+            if first > 0 and slope > 0 and (last - first) / first > min_increase:
+                rows.append((nodeid, first, last, (last - first) / first))
+        return sorted(rows, key=lambda r: r[3], reverse=True)
+
+    def to_allure(self, out_dir: str, run_id: str = None) -> int:
+        """Write Allure result files for one run (the latest by default)."""
+        runs = self.runs()
+        if not runs:
+            return 0
+        run_id = run_id or runs[-1]
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        count = 0
+        for record in self.records():
+            if record["run"] != run_id:
+                continue
+            module, _, name = record["id"].rpartition("::")
+            start = int(record["start"] * 1000)
+            result = {
+                "uuid": str(uuid.uuid4()),
+                "historyId": record["id"],
+                "fullName": record["id"],
+                "name": name or record["id"],
+                "status": {"passed": "passed", "skipped": "skipped"}.get(record["outcome"], "failed"),
+                "stage": "finished",
+                "start": start,
+                "stop": start + int(record["duration"] * 1000),
+                "statusDetails": {"message": record.get("message", "")},
+                "labels": [
+                    {"name": "suite", "value": module.split("::")[0]},
+                    {"name": "thread", "value": record.get("worker", "main")},
+                ],
+            }
+            (out / f"{result['uuid']}-result.json").write_text(json.dumps(result))
+            count += 1
+        return count
+
+
+def main(argv=None):
+    """Command line entry point for history queries and Allure export."""
+    parser = argparse.ArgumentParser(description="Query the test results history")
+    parser.add_argument("--runs", type=int, default=10, help="Number of recent runs to look at.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    slowest = commands.add_parser("slowest", help="Slowest tests by median duration.")
+    slowest.add_argument("--top", type=int, default=20)
+    slower = commands.add_parser("slower", help="Tests whose duration is trending up.")
+    slower.add_argument("--min-increase", type=float, default=0.2)
+    allure = commands.add_parser("allure", help="Write Allure results for a run.")
+    allure.add_argument("--out", default="reports/allure-results")
+    allure.add_argument("--run", default=None, help="Run id (default: latest).")
+    args = parser.parse_args(argv)
+
+    store = ResultsStore()
+    if args.command == "slowest":
+        for nodeid, median, runs in store.slowest(args.runs, args.top):
+            print(f"{median:8.2f}s  ({runs} runs)  {nodeid}")
+    elif args.command == "slower":
+        for nodeid, first, last, increase in store.getting_slower(args.runs, args.min_increase):
+            print(f"{first:8.2f}s -> {last:8.2f}s  (+{increase:.0%})  {nodeid}")
+    else:
+        count = store.to_allure(args.out, args.run)
+        print(f"Wrote {count} Allure results to {args.out}; run `allure serve {args.out}`")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Declarative test-data seeding with table snapshot and restore."""
+
+from __future__ import annotations
+import hashlib
+import json
+import time
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import TYPE_CHECKING
+from config.config import Config
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    # Annotations only, so collecting dataset modules never loads the MySQL driver
+    from utils.database import DatabaseConnection
+
+logger = get_logger(__name__)
+
+
+class Dataset:
+    """Named set of rows per table, loaded after the datasets it depends on.
+
+    ``tables`` maps a table name to ``{"columns": [...], "rows": ...}`` where
+    rows is a list of tuples or a callable returning an iterable of tuples.
+    """
+
+    def __init__(self, name: str, tables: dict, depends_on=()):
+        """Initialize dataset."""
+        self.name = name
+        self.tables = tables
+        self.depends_on = tuple(depends_on)
+
+    @classmethod
+    def from_json(cls, path: str) -> Dataset:
+        """Load a dataset from a JSON file with name, tables and depends_on keys."""
+        data = json.loads(Path(path).read_text())
+        return cls(data["name"], data["tables"], data.get("depends_on", ()))
+
+    def rows(self, table: str):
+        """Return an iterable of rows for a table."""
+        rows = self.tables[table]["rows"]
+        return rows() if callable(rows) else rows
+
+
+class TableSnapshot:
+    """Copy of a set of tables kept in shadow tables for fast restore."""
+
+    def __init__(self, db: DatabaseConnection, tables, label: str):
+        """Initialize snapshot of tables under a label."""
+        self.db = db
+        self.tables = list(tables)
+        self.label = label
+
+    def _shadow(self, table: str) -> str:
+        """Return shadow table name, hashed if it would exceed MySQL's 64 chars."""
+        name = f"_snap_{self.label}_{table}"
+        if len(name) > 64:
+            name = f"_snap_{self.label}_{hashlib.sha1(table.encode()).hexdigest()[:16]}"
+        return name
+
+    def take(self):
+        """Copy the current contents of every table into its shadow table."""
+        for table in self.tables:
+            shadow = self._shadow(table)
+            _run(self.db, f"DROP TABLE IF EXISTS `{shadow}`")
+            _run(self.db, f"CREATE TABLE `{shadow}` LIKE `{table}`")
+            _run(self.db, f"INSERT INTO `{shadow}` SELECT * FROM `{table}`")
+
+    def restore(self, tables=None):
+        """Replace table contents with their shadow copies."""
+        _run(self.db, "SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table in tables or self.tables:
+                _run(self.db, f"TRUNCATE TABLE `{table}`")
+                _run(self.db, f"INSERT INTO `{table}` SELECT * FROM `{self._shadow(table)}`")
+        finally:
+            _run(self.db, "SET FOREIGN_KEY_CHECKS = 1")
+
+    def drop(self):
+        """Drop the shadow tables."""
+        for table in self.tables:
+            _run(self.db, f"DROP TABLE IF EXISTS `{self._shadow(table)}`")
+
+
+def _run(db: DatabaseConnection, query: str, params=None):
+    """Execute a statement and raise if it failed."""
+    if db.execute_query(query, params) is None:
+        raise RuntimeError(f"Seeding statement failed: {query[:80]}")
+
+
+class Seeder:
+    """Seeds datasets once, snapshots them and restores them between modules."""
+
+    def __init__(self, db: DatabaseConnection, datasets=(), report: dict = None):
+        """Initialize seeder on a non-transactional connection."""
+        self.db = db
+        self.datasets = {d.name: d for d in datasets}
+        self.report = {} if report is None else report
+        self.seeded = []
+        self._base = None
+        self._seeded_snapshot = None
+
+    def register(self, dataset: Dataset):
+        """Register a dataset."""
+        self.datasets[dataset.name] = dataset
+
+    def _resolve(self, names) -> list:
+        """Return dataset names with dependencies, dependencies first."""
+        graph = {}
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in graph:
+                continue
+            if name not in self.datasets:
+                raise KeyError(f"Unknown dataset: {name}")
+            graph[name] = self.datasets[name].depends_on
+            stack.extend(graph[name])
+        return list(TopologicalSorter(graph).static_order())
+
+    def _table_order(self, tables) -> list:
+        """Order tables so foreign-key parents are loaded before children."""
+        tables = list(tables)
+        placeholders = ", ".join(["%s"] * len(tables))
+        rows = self.db.fetch_query(
+            "SELECT TABLE_NAME, REFERENCED_TABLE_NAME FROM information_schema.KEY_COLUMN_USAGE "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN ({placeholders}) "
+            f"AND REFERENCED_TABLE_NAME IN ({placeholders})",
+            (*tables, *tables),
+        ) or []
+        graph = {table: set() for table in tables}
+        for table, parent in rows:
+            if table != parent:
+                graph[table].add(parent)
+        return list(TopologicalSorter(graph).static_order())
+
+    def tables_for(self, names) -> list:
+        """Return every table touched by the datasets, in load order."""
+        tables = []
+        for name in self._resolve(names):
+            tables.extend(t for t in self.datasets[name].tables if t not in tables)
+        return self._table_order(tables)
+
+    def seed(self, names) -> list:
+        """Seed datasets (and dependencies) not seeded yet, then snapshot the result.
+
+        Refused in parallel workers: they share one database, so their seed
+        keys and shadow tables would collide and a restore would truncate
+        tables under the other workers.
+        """
+        if Config.WORKER_ID:
+            raise RuntimeError(
+                f"Cannot seed datasets in parallel worker {Config.WORKER_ID}; "
+                "run tests that use seeded data serially"
+            )
+        pending = [n for n in self._resolve(names) if n not in self.seeded]
+        if not pending:
+            return []
+        tables = self.tables_for(self.seeded + pending)
+        if self._base is None:
+            self._base = TableSnapshot(self.db, tables, "base")
+            self._base.take()
+        else:
+            # Tables first touched by the new datasets need a pristine copy too
+            new_tables = [t for t in tables if t not in self._base.tables]
+            if new_tables:
+                TableSnapshot(self.db, new_tables, "base").take()
+                self._base.tables.extend(new_tables)
+
+        for name in pending:
+            dataset = self.datasets[name]
+            start = time.perf_counter()
+            count = 0
+            for table in self._table_order(dataset.tables):
+                spec = dataset.tables[table]
+                inserted = self.db.bulk_insert(table, spec["columns"], dataset.rows(table))
+                if inserted is None:
+                    raise RuntimeError(f"Seeding {name} into {table} failed")
+                count += inserted
+            self.report.setdefault(name, {}).update(
+                rows=count, seed=time.perf_counter() - start, restores=0, restore=0.0
+            )
+            self.seeded.append(name)
+            logger.info("Seeded dataset %s: %s rows", name, count)
+
+        self._seeded_snapshot = TableSnapshot(self.db, tables, "seeded")
+        self._seeded_snapshot.take()
+        return pending
+
+    def restore(self, names):
+        """Restore the tables of the given datasets to their freshly seeded state."""
+        if self._seeded_snapshot is None:
+            return
+        for name in self._resolve(names):
+            start = time.perf_counter()
+            self._seeded_snapshot.restore(self._table_order(self.datasets[name].tables))
+            entry = self.report.setdefault(name, {})
+            entry["restores"] = entry.get("restores", 0) + 1
+            entry["restore"] = entry.get("restore", 0.0) + time.perf_counter() - start
+
+    def teardown(self):
+        """Put the tables back as they were before seeding and drop all shadow tables."""
+        if self._base is not None:
+            self._base.restore()
+            self._base.drop()
+        if self._seeded_snapshot is not None:
+            self._seeded_snapshot.drop()
+        self.seeded.clear()
@@ -0,0 +1,255 @@
+"""Profile the SQL the application runs, from performance_schema statement digests."""
+
+import json
+from contextlib import contextmanager
+from utils.database import DatabaseConnection
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# performance_schema timers are in picoseconds
+PICOSECONDS_PER_MS = 1_000_000_000
+
+DIGEST_QUERY = (
+    "SELECT DIGEST, DIGEST_TEXT, QUERY_SAMPLE_TEXT, COUNT_STAR, SUM_TIMER_WAIT, "
+    "MAX_TIMER_WAIT, SUM_ROWS_EXAMINED, SUM_ROWS_SENT, SUM_NO_INDEX_USED, "
+    "SUM_NO_GOOD_INDEX_USED "
+    "FROM performance_schema.events_statements_summary_by_digest "
+    "WHERE SCHEMA_NAME = %s AND DIGEST IS NOT NULL "
+    # Leave out the profiler's own snapshot queries
+    "AND DIGEST_TEXT NOT LIKE '%%performance_schema%%'"
+)
+DIGEST_FIELDS = (
+    "digest", "text", "sample", "count", "sum_timer", "max_timer",
+    "rows_examined", "rows_sent", "no_index_used", "no_good_index_used",
+)
+# Counters that grow with every execution and are diffed between snapshots
+COUNTERS = ("count", "sum_timer", "rows_examined", "rows_sent", "no_index_used", "no_good_index_used")
+
+# Individual executions, for the exact slowest run of a digest inside a window
+HISTORY_CONSUMER = "events_statements_history_long"
+HISTORY_QUERY = (
+    "SELECT THREAD_ID, EVENT_ID, DIGEST, TIMER_WAIT "
+    "FROM performance_schema.events_statements_history_long "
+    "WHERE CURRENT_SCHEMA = %s AND DIGEST IS NOT NULL AND TIMER_WAIT IS NOT NULL "
+    "AND DIGEST_TEXT NOT LIKE '%%performance_schema%%'"
+)
+HISTORY_CUTOFF_QUERY = (
+    "SELECT THREAD_ID, MAX(EVENT_ID) "
+    "FROM performance_schema.events_statements_history_long GROUP BY THREAD_ID"
+)
+
+
+def _full_scan_tables(plan) -> list:
+    """Return the tables an EXPLAIN FORMAT=JSON plan reads with a full scan."""
+    tables = []
+    if isinstance(plan, dict):
+        if plan.get("access_type") == "ALL":
+            tables.append(plan.get("table_name"))
+        for value in plan.values():
+            tables.extend(_full_scan_tables(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            tables.extend(_full_scan_tables(value))
+    return tables
+
+
+class SqlProfile:
+    """Statements run between two digest snapshots, slowest first.
+
+    Digests are aggregated server-wide per schema, so statements other
+    sessions ran on the same schema during the window are included.
+    ``max_ms`` is the slowest execution inside the window, taken from the
+    statement history (or the digest maximum when it was set in the
+    window). When neither covers the window it falls back to the average
+    and ``max_exact`` is False.
+    """
+
+    def __init__(self, statements=None):
+        """Initialize profile from statement dicts."""
+        self.statements = statements or []
+
+    @property
+    def query_count(self) -> int:
+        """Return the number of statement executions."""
+        return sum(s["count"] for s in self.statements)
+
+    @property
+    def total_ms(self) -> float:
+        """Return the total statement latency in milliseconds."""
+        return sum(s["total_ms"] for s in self.statements)
+
+    @property
+    def full_scans(self) -> int:
+        """Return the number of executions that used no index."""
+        return sum(s["no_index_used"] for s in self.statements)
+
+    @property
+    def no_good_index(self) -> int:
+        """Return the number of executions that found no good index."""
+        return sum(s["no_good_index_used"] for s in self.statements)
+
+    def report_lines(self, limit: int = 10) -> list:
+        """Return a short human-readable report of the slowest statements."""
+        lines = [
+            f"{self.query_count} queries, {len(self.statements)} distinct, "
+            f"{self.total_ms:.1f}ms total, {self.full_scans} without an index, "
+            f"{self.no_good_index} without a good index"
+        ]
+        for s in self.statements[:limit]:
+            flags = " FULL SCAN" if s["no_index_used"] else ""
+            if s["no_good_index_used"]:
+                flags += " NO GOOD INDEX"
+            lines.append(
+                f"  {s['count']}x {s['total_ms']:.1f}ms total {s['avg_ms']:.1f}ms avg "
+                f"{s['max_ms']:.1f}ms max{'' if s['max_exact'] else ' (avg)'} "
+                f"{s['rows_examined']} rows examined{flags}: {s['text'][:120]}"
+            )
+            if s.get("explain_full_scans"):
+                lines.append(f"    EXPLAIN full scan on: {', '.join(s['explain_full_scans'])}")
+        return lines
+
+    def assert_budget(self, max_statement_ms: float = None, max_queries: int = None,
+                      max_full_scans: int = None, max_total_ms: float = None):
+        """Fail with the offending statements when the profile exceeds a budget."""
+        problems = []
+        if max_queries is not None and self.query_count > max_queries:
+            problems.append(f"{self.query_count} queries > {max_queries}")
+        if max_total_ms is not None and self.total_ms > max_total_ms:
+            problems.append(f"{self.total_ms:.1f}ms total > {max_total_ms}ms")
+        if max_full_scans is not None and self.full_scans > max_full_scans:
+            problems.append(f"{self.full_scans} queries without an index > {max_full_scans}")
+        if max_statement_ms is not None:
+            for s in self.statements:
+                if s["max_ms"] > max_statement_ms:
+                    problems.append(
+                        f"{s['max_ms']:.1f}ms > {max_statement_ms}ms: {s['text'][:120]}"
+                    )
+        assert not problems, "SQL budget exceeded:\n" + "\n".join(problems)
+
+
+class SqlProfiler:
+    """Diffs performance_schema statement digests around a block of work."""
+
+    def __init__(self, db: DatabaseConnection, schema: str = None):
+        """Initialize profiler on a connected DatabaseConnection."""
+        self.db = db
+        self.schema = schema or db.database
+        self._history = None
+
+    def history_enabled(self) -> bool:
+        """Return whether the long statement history is on.
+
+        The consumer is a server-wide setting, so it is only read, never changed.
+        """
+        if self._history is None:
+            row = self.db.fetch_one(
+                "SELECT ENABLED FROM performance_schema.setup_consumers WHERE NAME = %s",
+                (HISTORY_CONSUMER,),
+            )
+            self._history = row is not None and row[0] == "YES"
+            if not self._history:
+                logger.warning(
+                    "%s is off; statement maxima fall back to averages. Enable it on the "
+                    "server with performance-schema-consumer-events-statements-history-long=ON",
+                    HISTORY_CONSUMER,
+                )
+        return self._history
+
+    def history_cutoff(self) -> dict:
+        """Return the last statement event id of each thread in the history."""
+        if not self.history_enabled():
+            return {}
+        return dict(self.db.fetch_query(HISTORY_CUTOFF_QUERY) or [])
+
+    def window_max(self, cutoff: dict) -> dict:
+        """Return the slowest execution (picoseconds) per digest after a cutoff."""
+        if not self.history_enabled():
+            return {}
+        maxima = {}
+        for thread_id, event_id, digest, timer_wait in self.db.fetch_query(
+            HISTORY_QUERY, (self.schema,)
+        ) or []:
+            if event_id > cutoff.get(thread_id, 0):
+                maxima[digest] = max(maxima.get(digest, 0), int(timer_wait))
+        return maxima
+
+    def snapshot(self) -> dict:
+        """Return the current digest counters keyed by digest."""
+        rows = self.db.fetch_query(DIGEST_QUERY, (self.schema,))
+        if rows is None:
+            raise RuntimeError("Cannot read performance_schema statement digests")
+        return {row[0]: dict(zip(DIGEST_FIELDS, row)) for row in rows}
+
+    def diff(self, before: dict, after: dict, window_max: dict = None) -> SqlProfile:
+        """Return the statements whose counters changed between two snapshots.
+
+        ``window_max`` maps digests to their slowest execution inside the
+        window, as returned by ``window_max``.
+        """
+        window_max = window_max or {}
+        statements = []
+        for digest, current in after.items():
+            previous = before.get(digest)
+            delta = {
+                key: int(current[key] or 0) - int((previous or {}).get(key) or 0)
+                for key in COUNTERS
+            }
+            if delta["count"] <= 0:
+                continue
+            avg_ms = delta["sum_timer"] / delta["count"] / PICOSECONDS_PER_MS
+            max_timer = int(current["max_timer"] or 0)
+            if previous is None or max_timer > int(previous["max_timer"] or 0):
+                # The digest's maximum was set inside the window
+                max_ms, exact = max_timer / PICOSECONDS_PER_MS, True
+            elif digest in window_max:
+                max_ms, exact = window_max[digest] / PICOSECONDS_PER_MS, True
+            else:
+                max_ms, exact = avg_ms, False
+            statements.append({
+                "digest": digest,
+                "text": current["text"] or "",
+                "sample": current["sample"],
+                "new": previous is None,
+                "count": delta["count"],
+                "total_ms": delta["sum_timer"] / PICOSECONDS_PER_MS,
+                "avg_ms": avg_ms,
+                "max_ms": max_ms,
+                "max_exact": exact,
+                "rows_examined": delta["rows_examined"],
+                "rows_sent": delta["rows_sent"],
+                "no_index_used": delta["no_index_used"],
+                "no_good_index_used": delta["no_good_index_used"],
+            })
+        statements.sort(key=lambda s: s["total_ms"], reverse=True)
+        return SqlProfile(statements)
+
+    def explain(self, statement: dict):
+        """Attach the EXPLAIN plan of a statement's sample query, if it can be explained."""
+        sample = (statement.get("sample") or "").strip()
+        if not sample.upper().startswith(("SELECT", "UPDATE", "DELETE", "INSERT", "REPLACE")):
+            return None
+        row = self.db.fetch_one(f"EXPLAIN FORMAT=JSON {sample}")
+        if row is None:
+            return None
+        plan = json.loads(row[0])
+        statement["explain"] = plan
+        statement["explain_full_scans"] = _full_scan_tables(plan)
+        return plan
+
+    @contextmanager
+    def profile(self, explain: int = 0):
+        """Profile the statements run inside the block.
+
+        The yielded profile is filled in when the block exits; the
+        ``explain`` slowest statements get their EXPLAIN plan attached.
+        """
+        profile = SqlProfile()
+        before = self.snapshot()
+        cutoff = self.history_cutoff()
+        yield profile
+        after = self.snapshot()
+        profile.statements = self.diff(before, after, self.window_max(cutoff)).statements
+        for statement in profile.statements[:explain]:
+            self.explain(statement)
+        logger.info("SQL profile: %s", profile.report_lines(limit=0)[0])
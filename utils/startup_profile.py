@@ -0,0 +1,71 @@
+"""Import-time and collection-time profile of a pytest run's startup.
+
+Run it with the pytest arguments to profile, e.g.
+``python -m utils.startup_profile -m api``. The run only collects.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# "import time: self [us] | cumulative | imported package" lines of -X importtime
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(lines) -> list:
+    """Return (module, self us, cumulative us, depth) for each -X importtime line."""
+    imports = []
+    for line in lines:
+        match = _IMPORT_LINE.match(line.rstrip())
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return imports
+
+
+def by_package(imports) -> list:
+    """Return (top-level package, total self time in us), slowest first."""
+    totals = defaultdict(int)
+    for module, self_us, _, _ in imports:
+        totals[module.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda t: t[1], reverse=True)
+
+
+def profile(pytest_args: list) -> tuple:
+    """Collect with ``-X importtime`` and return (wall seconds, imports, pytest output)."""
+    command = [
+        sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only",
+        # Per-file counts only (pytest.ini adds -v); without -s, output capture
+        # would swallow the import times of conftest and test modules
+        "-qqq", "-s", "-p", "no:cacheprovider", "--startup-profile", *pytest_args,
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    return wall, parse_importtime(result.stderr.splitlines()), result.stdout
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Profile import and collection time of a pytest run",
+        usage="python -m utils.startup_profile [--top N] [pytest args]",
+    )
+    parser.add_argument("--top", type=int, default=15, help="Number of packages to list.")
+    args, pytest_args = parser.parse_known_args(argv)
+
+    wall, imports, output = profile(pytest_args)
+    total_us = sum(self_us for _, self_us, _, _ in imports)
+    print(f"startup + collection: {wall:.3f}s wall, {total_us / 1e6:.3f}s importing "
+          f"{len(imports)} modules")
+    print("import time by package (self time):")
+    for package, self_us in by_package(imports)[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {package}")
+    print(output.rstrip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Lightweight timing spans for page actions."""
+
+import functools
+import inspect
+import math
+import time
+from collections import defaultdict
+
+
+def percentile(values, pct: float) -> float:
+    """Return the nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class SpanRecorder:
+    """Collects (test id, action, selector, outcome, seconds) spans in memory."""
+
+    def __init__(self):
+        """Initialize empty recorder."""
+        self.enabled = True
+        self.test_id = ""
+        self.spans = []
+
+    def record(self, action: str, selector, outcome: str, seconds: float):
+        """Store one span for the current test."""
+        self.spans.append((self.test_id, action, selector, outcome, seconds))
+
+    def clear(self):
+        """Drop all spans."""
+        self.spans.clear()
+
+    def summary(self, top_n: int = 20) -> dict:
+        """Aggregate spans into p50/p95/max per action and selector plus the slowest spans."""
+        groups = defaultdict(list)
+        for _, action, selector, _, seconds in self.spans:
+            groups[(action, selector)].append(seconds)
+        actions = [
+            {
+                "action": action,
+                "selector": selector,
+                "count": len(durations),
+                "p50": round(percentile(durations, 50), 4),
+                "p95": round(percentile(durations, 95), 4),
+                "max": round(max(durations), 4),
+            }
+            for (action, selector), durations in groups.items()
+        ]
+        actions.sort(key=lambda a: a["p95"], reverse=True)
+        slowest = sorted(self.spans, key=lambda s: s[4], reverse=True)[:top_n]
+        return {
+            "spans": len(self.spans),
+            "actions": actions,
+            "slowest": [
+                {
+                    "test": test_id,
+                    "action": action,
+                    "selector": selector,
+                    "outcome": outcome,
+                    "seconds": round(seconds, 4),
+                }
+                for test_id, action, selector, outcome, seconds in slowest
+            ],
+        }
+
+
+recorder = SpanRecorder()
+
+
+def timed(func=None, *, selector: str = None):
+    """Record a timing span for an async page method.
+
+    Use as ``@timed`` or ``@timed(selector="locator")``. Only the argument
+    named by ``selector`` is recorded, so values typed into the page
+    (usernames, passwords, search terms) never reach the report; without
+    it the selector is ``None``. The outcome is ``ok`` or the exception
+    class name.
+    """
+    if func is None:
+        return functools.partial(timed, selector=selector)
+    action = func.__qualname__
+    # Position among the arguments after self
+    position = list(inspect.signature(func).parameters).index(selector) - 1 if selector else None
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if not recorder.enabled:
+            return await func(self, *args, **kwargs)
+        if selector is None:
+            value = None
+        elif selector in kwargs:
+            value = kwargs[selector]
+        else:
+            value = args[position] if position < len(args) else None
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            return await func(self, *args, **kwargs)
+        except BaseException as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            recorder.record(action, value, outcome, time.perf_counter() - start)
+
+    return wrapper
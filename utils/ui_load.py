@@ -0,0 +1,213 @@
+"""Multi-user UI load test driving the page objects from shared browsers.
+
+Run with ``python -m utils.ui_load --users 30 --browsers 3 --duration 120``.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from playwright.async_api import Browser, Page, async_playwright
+from config.config import Config
+from pages.admin_page import AdminPage
+from pages.dashboard_page import DashboardPage
+from pages.login_page import LoginPage
+from utils.load_report import write_report
+from utils.logger import get_logger
+from utils.resource_blocker import ResourceBlocker
+from utils.timing import percentile, recorder
+
+logger = get_logger(__name__)
+
+
+class StepStats:
+    """Latencies and errors per scenario step."""
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.iterations = 0
+
+    def record(self, step: str, seconds: float, ok: bool):
+        """Record one step execution."""
+        if ok:
+            self.latencies[step].append(seconds)
+        else:
+            self.errors[step] += 1
+
+    def report(self, elapsed: float) -> dict:
+        """Return throughput and latency percentiles per step."""
+        steps = {}
+        for step in dict.fromkeys([*self.latencies, *self.errors]):
+            values = self.latencies[step]
+            steps[step] = {
+                "count": len(values),
+                "errors": self.errors[step],
+                "throughput": round(len(values) / elapsed, 3) if elapsed else 0.0,
+                "p50": round(percentile(values, 50), 3),
+                "p90": round(percentile(values, 90), 3),
+                "p95": round(percentile(values, 95), 3),
+                "p99": round(percentile(values, 99), 3),
+                "max": round(max(values, default=0.0), 3),
+            }
+        return {
+            "elapsed": round(elapsed, 1),
+            "iterations": self.iterations,
+            "iterations_per_second": round(self.iterations / elapsed, 3) if elapsed else 0.0,
+            "steps": steps,
+        }
+
+
+class VirtualUser:
+    """One simulated user running the scenario in its own browser context."""
+
+    def __init__(self, number: int, page: Page, stats: StepStats, think_time: float):
+        """Initialize virtual user on a page."""
+        self.number = number
+        self.page = page
+        self.stats = stats
+        self.think_time = think_time
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        """Time a scenario step, then pause for the think time."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.stats.record(name, time.perf_counter() - start, ok)
+        if self.think_time:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * self.think_time)
+
+
+async def admin_search_scenario(user: VirtualUser):
+    """Log in, check the dashboard, search system users and log out."""
+    login_page = LoginPage(user.page)
+    dashboard_page = DashboardPage(user.page)
+    admin_page = AdminPage(user.page)
+
+    async with user.step("login"):
+        await login_page.navigate_to(Config.BASE_URL)
+        await login_page.login(Config.DEFAULT_USERNAME, Config.DEFAULT_PASSWORD)
+    async with user.step("dashboard"):
+        if not await dashboard_page.is_dashboard_loaded():
+            raise AssertionError("Dashboard did not load")
+    async with user.step("admin_search"):
+        await admin_page.navigate_to(f"{Config.BASE_URL}/web/index.php/admin/viewSystemUsers")
+        await admin_page.search_user(Config.DEFAULT_USERNAME)
+    async with user.step("logout"):
+        await dashboard_page.logout()
+
+
+class UILoadTest:
+    """Runs a scenario for many virtual users spread over a few shared browsers.
+
+    Each user gets its own lightweight BrowserContext; users start evenly
+    over the ramp-up period and repeat the scenario until the duration ends.
+    """
+
+    def __init__(self, users: int = None, browsers: int = None, ramp_up: float = None,
+                 think_time: float = None, duration: float = None,
+                 scenario=admin_search_scenario):
+        """Initialize load test with settings defaulting to the config."""
+        self.users = Config.LOAD_USERS if users is None else users
+        self.browsers = max(Config.LOAD_BROWSERS if browsers is None else browsers, 1)
+        self.ramp_up = Config.LOAD_RAMP_UP if ramp_up is None else ramp_up
+        self.think_time = Config.LOAD_THINK_TIME if think_time is None else think_time
+        self.duration = Config.LOAD_DURATION if duration is None else duration
+        self.scenario = scenario
+        self.stats = StepStats()
+
+    async def _run_user(self, number: int, browser: Browser, deadline: float):
+        """Start after the user's ramp-up delay and loop the scenario until the deadline."""
+        await asyncio.sleep(self.ramp_up * number / self.users)
+        blocker = ResourceBlocker(Config.BLOCK_RESOURCE_TYPES, Config.BLOCK_URL_PATTERNS)
+        while time.monotonic() < deadline:
+            context = await browser.new_context()
+            try:
+                await blocker.install(context)
+                page = await context.new_page()
+                await self.scenario(VirtualUser(number, page, self.stats, self.think_time))
+                self.stats.iterations += 1
+            except Exception as e:
+                logger.warning("Virtual user %s iteration failed: %s", number, e)
+            finally:
+                await context.close()
+
+    async def run(self) -> dict:
+        """Run the load test and return the report."""
+        # Page object spans would grow without bound over a long run
+        recorder.enabled = False
+        async with async_playwright() as playwright:
+            launcher = playwright[Config.BROWSER_TYPE]
+            browsers = [
+                await launcher.launch(headless=Config.HEADLESS) for _ in range(self.browsers)
+            ]
+            logger.info(
+                "Starting %s users on %s browsers for %ss (ramp-up %ss)",
+                self.users, self.browsers, self.duration, self.ramp_up,
+            )
+            started = time.monotonic()
+            deadline = started + self.duration
+            try:
+                await asyncio.gather(*(
+                    self._run_user(number, browsers[number % self.browsers], deadline)
+                    for number in range(self.users)
+                ))
+            finally:
+                for browser in browsers:
+                    await browser.close()
+        report = self.stats.report(time.monotonic() - started)
+        report["settings"] = {
+            "users": self.users,
+            "browsers": self.browsers,
+            "ramp_up": self.ramp_up,
+            "think_time": self.think_time,
+            "duration": self.duration,
+            "base_url": Config.BASE_URL,
+        }
+        return report
+
+
+def print_report(report: dict):
+    """Print the per-step table."""
+    print(
+        f"{report['iterations']} iterations in {report['elapsed']}s "
+        f"({report['iterations_per_second']}/s)"
+    )
+    print(f"{'step':<14}{'count':>7}{'errors':>8}{'rps':>8}{'p50':>8}{'p90':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+    for step, s in report["steps"].items():
+        print(
+            f"{step:<14}{s['count']:>7}{s['errors']:>8}{s['throughput']:>8.2f}"
+            f"{s['p50']:>8.2f}{s['p90']:>8.2f}{s['p95']:>8.2f}{s['p99']:>8.2f}{s['max']:>8.2f}"
+        )
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Multi-user UI load test")
+    parser.add_argument("--users", type=int, default=Config.LOAD_USERS,
+                        help="Concurrent virtual users.")
+    parser.add_argument("--browsers", type=int, default=Config.LOAD_BROWSERS,
+                        help="Browsers shared by the users.")
+    parser.add_argument("--ramp-up", type=float, default=Config.LOAD_RAMP_UP,
+                        help="Seconds over which users are started.")
+    parser.add_argument("--think-time", type=float, default=Config.LOAD_THINK_TIME,
+                        help="Mean pause in seconds after each step.")
+    parser.add_argument("--duration", type=float, default=Config.LOAD_DURATION,
+                        help="Seconds to keep starting scenario iterations.")
+    args = parser.parse_args(argv)
+
+    load_test = UILoadTest(args.users, args.browsers, args.ramp_up, args.think_time, args.duration)
+    report = asyncio.run(load_test.run())
+    print_report(report)
+    print(f"Report: {write_report(report, 'ui_load')}")
+
+
+if __name__ == "__main__":
+    main()